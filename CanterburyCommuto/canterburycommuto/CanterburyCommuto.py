@@ -1,31 +1,64 @@
+import atexit
 import csv
 import time
 import datetime
 import logging
+import logging.handlers
 import os
 import pickle
-from typing import Dict, List, Tuple, Optional, Any, Callable
-from multiprocessing.dummy import Pool
-
+import queue
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
+from itertools import count, islice, product
+from operator import itemgetter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Any, Callable, Type
+
+import numpy as np
 import polyline
 import requests
-import yaml
 from pydantic import BaseModel
-from shapely.geometry import Point
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses the API responses several times faster than the json module; it is optional.
+# Raw responses are stored as returned, so they never need to be serialized again.
+try:
+    from orjson import loads as load_json
+except ImportError:
+    from json import loads as load_json
 
 # Import functions from modules
 from canterburycommuto.PlotMaps import plot_routes, plot_routes_and_buffers
-from canterburycommuto.HelperFunctions import generate_unique_filename, write_csv_file, safe_split
+from canterburycommuto.HelperFunctions import (
+    generate_unique_filename,
+    parse_coordinate,
+    format_coordinate,
+    normalize_coordinate,
+    same_point,
+    safe_split,
+    RouteCache,
+    CsvResultWriter,
+    LRUDict,
+    ResponseStore,
+)
 from canterburycommuto.Computations import (
     find_common_nodes,
     split_segments,
     calculate_segment_distances,
+    before_overlap_share,
     create_segment_rectangles,
     filter_combinations_by_overlap,
     find_overlap_boundary_nodes,
     create_buffered_route,
+    create_buffered_routes,
+    route_buffers_disjoint,
     get_buffer_intersection,
+    calculate_buffer_intersection_ratios,
     get_route_polygon_intersections,
+    entry_exit_nodes,
 )
 
 class RouteBase(BaseModel):
@@ -93,8 +126,220 @@ class SimpleDualOverlapResult(RouteBase):
     boverlapDist: Optional[float] = None
     boverlapTime: Optional[float] = None
 
-# Global cache for Google API responses
-api_response_cache = {}
+@lru_cache(maxsize=None)
+def _empty_result_row(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Returns the all-None row of a result model; callers copy it rather than modify it.
+    """
+    return dict.fromkeys(model.model_fields)
+
+@lru_cache(maxsize=None)
+def _float_fields(model: Type[BaseModel]) -> frozenset:
+    """
+    Returns the names of the float fields of a result model.
+    """
+    return frozenset(
+        name for name, field in model.model_fields.items()
+        if field.annotation in (float, Optional[float])
+    )
+
+def update_result_row(model: Type[BaseModel], row: Dict[str, Any], values: Dict[str, Any]) -> None:
+    """
+    Sets values in a result row, converting the values of float fields to float.
+
+    Pydantic would coerce an int 0 to 0.0, which the CSV writes as "0.0"; rows built without the
+    model are converted the same way so that the output does not depend on how a row was built.
+
+    Parameters:
+    - model (Type[BaseModel]): Result model describing the output columns.
+    - row (Dict[str, Any]): The result row, modified in place.
+    - values (Dict[str, Any]): Values to set, keyed by field name.
+
+    Returns:
+    - None
+    """
+    float_fields = _float_fields(model)
+    for name, value in values.items():
+        if value is not None and name in float_fields and not isinstance(value, float):
+            value = float(value)
+        row[name] = value
+
+def build_result_row(model: Type[BaseModel], **values: Any) -> Dict[str, Any]:
+    """
+    Builds a result row as a plain dict in the field order of a result model.
+
+    The values are computed by the package itself, so the Pydantic validation and
+    model_dump() round trip is skipped; fields that are not given are None, as in the model,
+    and the values of float fields are converted to float, as the model would.
+
+    Parameters:
+    - model (Type[BaseModel]): Result model describing the output columns.
+    - **values: Values of the row, keyed by field name.
+
+    Returns:
+    - Dict[str, Any]: The result row.
+    """
+    # Copying a prebuilt row skips reading model_fields and rehashing the names for every row
+    row = _empty_result_row(model).copy()
+    update_result_row(model, row, values)
+    return row
+
+def endpoint_fields(
+    row: Dict[str, Any],
+    parse: Callable[[str], Tuple[Optional[float], Optional[float]]] = parse_coordinate
+) -> Dict[str, Any]:
+    """
+    Builds the ID and endpoint coordinate columns shared by every result row of a route pair.
+
+    Parameters:
+    - row (Dict[str, Any]): Input row with ID, OriginA, DestinationA, OriginB and DestinationB.
+    - parse (Callable): Parses a "lat,lon" string. parse_coordinate raises on invalid input;
+      safe_split returns (None, None) instead, for rows being reported as errors.
+
+    Returns:
+    - Dict[str, Any]: ID, OriginAlat, OriginAlong, ..., DestinationBlong.
+    """
+    origin_a_lat, origin_a_lon = parse(row.get("OriginA", ""))
+    destination_a_lat, destination_a_lon = parse(row.get("DestinationA", ""))
+    origin_b_lat, origin_b_lon = parse(row.get("OriginB", ""))
+    destination_b_lat, destination_b_lon = parse(row.get("DestinationB", ""))
+    return {
+        "ID": row.get("ID", ""),
+        "OriginAlat": origin_a_lat,
+        "OriginAlong": origin_a_lon,
+        "DestinationAlat": destination_a_lat,
+        "DestinationAlong": destination_a_lon,
+        "OriginBlat": origin_b_lat,
+        "OriginBlong": origin_b_lon,
+        "DestinationBlat": destination_b_lat,
+        "DestinationBlong": destination_b_lon,
+    }
+
+@lru_cache(maxsize=None)
+def _same_route_fields(model: Type[BaseModel]) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Splits the distance and time fields of a result model into whole-route distances,
+    whole-route times and before/after parts.
+    """
+    metrics = [field for field in model.model_fields if field.endswith(("Dist", "Time"))]
+    parts = tuple(field for field in metrics if "Before" in field or "After" in field)
+    whole = [field for field in metrics if field not in parts]
+    return (
+        tuple(field for field in whole if field.endswith("Dist")),
+        tuple(field for field in whole if field.endswith("Time")),
+        parts,
+    )
+
+@lru_cache(maxsize=None)
+def _same_route_row(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Returns the row of a result model with the before/after parts set to 0.0; callers copy it
+    rather than modify it.
+    """
+    row = dict.fromkeys(model.model_fields)
+    row.update(dict.fromkeys(_same_route_fields(model)[2], 0.0))
+    return row
+
+def same_route_result(model: Type[BaseModel], endpoints: Dict[str, Any], distance: float, time_min: float) -> Dict[str, Any]:
+    """
+    Builds the result row of a pair whose routes A and B are the same route.
+
+    The routes overlap entirely: every route and overlap distance and time is the route's own,
+    and the parts before and after the overlap are 0.
+
+    Parameters:
+    - model (Type[BaseModel]): Result model of the row function.
+    - endpoints (Dict[str, Any]): ID and endpoint columns from endpoint_fields.
+    - distance (float): Distance of the route.
+    - time_min (float): Travel time of the route.
+
+    Returns:
+    - Dict[str, Any]: The result row.
+    """
+    distance_fields, time_fields, _ = _same_route_fields(model)
+    row = _same_route_row(model).copy()
+    row.update(endpoints)
+    distance = None if distance is None else float(distance)
+    time_min = None if time_min is None else float(time_min)
+    for field in distance_fields:
+        row[field] = distance
+    for field in time_fields:
+        row[field] = time_min
+    return row
+
+@lru_cache(maxsize=None)
+def _no_overlap_row(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Returns the row of a result model with every metric set to 0.0; callers copy it rather than modify it.
+    """
+    row = dict.fromkeys(model.model_fields)
+    for field in row:
+        if field != "ID" and not field.startswith(("Origin", "Destination")):
+            row[field] = 0.0
+    return row
+
+def no_overlap_result(model: Type[BaseModel], endpoints: Dict[str, Any], **values: Any) -> Dict[str, Any]:
+    """
+    Builds the result row of a pair whose routes do not overlap.
+
+    Every distance, time and ratio not given in values is 0.0, so only the whole-route
+    distances and times need to be passed.
+
+    Parameters:
+    - model (Type[BaseModel]): Result model of the row function.
+    - endpoints (Dict[str, Any]): ID and endpoint columns from endpoint_fields.
+    - **values: Other values of the row, e.g. aDist, aTime, bDist and bTime.
+
+    Returns:
+    - Dict[str, Any]: The result row.
+    """
+    row = _no_overlap_row(model).copy()
+    row.update(endpoints)
+    update_result_row(model, row, values)
+    return row
+
+def error_result(model: Type[BaseModel], row: Dict[str, Any], api_calls: int) -> Tuple[Dict[str, Any], int, int]:
+    """
+    Builds the result of a row that failed and is skipped (skip_invalid=True).
+
+    Parameters:
+    - model (Type[BaseModel]): Result model of the row function.
+    - row (Dict[str, Any]): The input row; its coordinates are parsed with safe_split.
+    - api_calls (int): API calls made for the row before it failed.
+
+    Returns:
+    - tuple: (result_dict, api_calls, 1), where every metric of result_dict is None.
+    """
+    return build_result_row(model, **endpoint_fields(row, parse=safe_split)), api_calls, 1
+
+# Global store of raw API responses, filled only when save_api_info is set. Every response is
+# saved to api_response_cache.pkl at the end of the run, so they are kept in a temporary SQLite
+# file rather than in memory.
+api_response_cache = ResponseStore(loads=load_json)
+
+# In-process LRU cache of successful route lookups, keyed by (method, origin, destination)
+# with both coordinates normalized, see route_cache_key. Entries are (coordinates, distance_km,
+# time_min, response_key), where response_key is the (origin, destination) under which the raw
+# response is in api_response_cache, or None if the lookup did not save it.
+ROUTE_CACHE_MAXSIZE = 10_000
+route_cache: "OrderedDict[Tuple[str, str, str], tuple]" = OrderedDict()
+route_cache_lock = threading.Lock()
+
+# Lookups currently being fetched, so that concurrent identical requests share one HTTP call
+inflight_routes: Dict[Tuple[str, str, str], Future] = {}
+
+# Number of route requests actually sent to the routing service; cache hits are not counted
+route_requests_sent = 0
+
+# Routes kept in the on-disk cache are requested again after this many seconds
+ROUTE_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# Part of every on-disk cache key; bump it when the route requests or the decoding of their
+# responses change, so that routes stored by older versions are requested again
+ROUTE_CACHE_VERSION = "v1"
+
+# Optional on-disk cache shared across runs, see enable_route_cache
+persistent_route_cache: Optional[RouteCache] = None
 
 # Global URL for Google Maps Routes API (v2)
 GOOGLE_API_URL = "https://routes.googleapis.com/directions/v2:computeRoutes"
@@ -102,19 +347,95 @@ GOOGLE_API_URL = "https://routes.googleapis.com/directions/v2:computeRoutes"
 # Global URL for local GraphHopper server (assumes user followed setup)
 GRAPHOPPER_BASE_URL = "http://localhost:8989"
 
+# (connect, read) timeouts in seconds for routing requests
+REQUEST_TIMEOUT = (3.05, 30)
+
+def create_http_session(pool_size: int = 64) -> requests.Session:
+    """
+    Creates a requests session whose connections are kept alive and shared by all worker threads.
+
+    Parameters:
+    - pool_size (int): Maximum number of pooled connections per host.
+
+    Returns:
+    - requests.Session: Session with connection pooling and retries on transient server errors.
+    """
+    # Rate limiting (429) is handled by the retry loop in get_route_data_google
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    # Row threads and the route request threads share the pool and can together exceed its size.
+    # Blocking makes the extra threads wait for a kept-alive connection instead of opening one
+    # (with a new TLS handshake) that is thrown away afterwards.
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry, pool_block=True)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Shared session so that TCP/TLS connections are reused across rows and threads
+HTTP_POOL_SIZE = 64
+http_session = create_http_session(HTTP_POOL_SIZE)
+
+# Number of input rows whose routes are prefetched together (see process_rows)
+PREFETCH_WINDOW = 1000
+
+# Row results kept for rows repeating a route pair of an earlier window (see iter_row_results).
+# Results carrying the route coordinates after (result_dict, api_calls, api_errors), as those of
+# process_routes_with_buffers do, are far larger than a result row, so fewer of them are kept.
+FINISHED_RESULTS_MAXSIZE = 10_000
+FINISHED_ROUTE_RESULTS_MAXSIZE = 256
+
+# Shared worker threads for the route requests a row issues in parallel. Sized like the
+# connection pool, it bounds the number of in-flight requests across all rows and avoids
+# starting new threads for every row.
+route_request_executor = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix="route-request")
+
+# Rows processed at the same time by process_rows. Row work is dominated by waiting on the
+# routing API, not by the CPU, so the default follows the connection pool rather than os.cpu_count().
+ROW_WORKERS = HTTP_POOL_SIZE
+
 # Function to read a csv file and then asks the users to manually enter their corresponding column variables with respect to OriginA, DestinationA, OriginB, and DestinationB.
 # The following functions also help determine if there are errors in the code. 
 
 # Always save the log in the current working directory, not in the results folder
 log_path = os.path.join(os.getcwd(), "validation_errors_timing.log")
 
-# Set up logging
-logging.basicConfig(
-    filename=log_path,
-    filemode="a",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Set up logging. Worker threads only put records on a queue; a background listener thread
+# writes them to the log file, so the row workers never wait on the file lock or disk I/O.
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_file_handler = logging.FileHandler(log_path, mode="a", delay=True)
+log_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+log_queue_handler = logging.handlers.QueueHandler(log_queue)
+log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[log_queue_handler])
+log_listener = logging.handlers.QueueListener(log_queue, log_file_handler)
+log_listener.start()
+# Flush the queued records when the interpreter exits
+atexit.register(log_listener.stop)
+
+# Timings of the individual API calls and geometry steps are logged at DEBUG level and therefore
+# skipped, unformatted, in normal runs. To record them in the log file, call
+# logging.getLogger("canterburycommuto.timing").setLevel(logging.DEBUG).
+timing_log = logging.getLogger("canterburycommuto.timing")
+
+def is_valid_lat_lon(lat: Any, lon: Any) -> bool:
+    """
+    Checks if a latitude and a longitude value are numeric and within geographic bounds.
+
+    Returns True if valid, False otherwise.
+    """
+    try:
+        lat = float(lat)
+        lon = float(lon)
+    except (TypeError, ValueError):
+        return False
+    # NaN fails both comparisons and is therefore rejected as well
+    return -90 <= lat <= 90 and -180 <= lon <= 180
 
 def is_valid_coordinate(coord: str) -> bool:
     """
@@ -125,20 +446,83 @@ def is_valid_coordinate(coord: str) -> bool:
     """
     if not isinstance(coord, str):
         return False
-    parts = coord.strip().split(",")
-    if len(parts) != 2:
-        return False
+    return _is_valid_coordinate_string(coord)
 
-    try:
-        lat = float(parts[0].strip())
-        lon = float(parts[1].strip())
-        if not (-90 <= lat <= 90):
-            return False
-        if not (-180 <= lon <= 180):
-            return False
-        return True
-    except ValueError:
-        return False
+@lru_cache(maxsize=100_000)
+def _is_valid_coordinate_string(coord: str) -> bool:
+    # The verdict is kept per distinct string: input files repeat the same homes and
+    # workplaces on many rows, and each of them is then split and range-checked only once
+    lat, lon = safe_split(coord)
+    return lat is not None and is_valid_lat_lon(lat, lon)
+
+def iter_csv_rows(
+    csv_file: str,
+    input_dir: str,
+    home_a_lat: str,
+    home_a_lon: str,
+    work_a_lat: str,
+    work_a_lon: str,
+    home_b_lat: str,
+    home_b_lon: str,
+    work_b_lat: str,
+    work_b_lon: str,
+    id_column: Optional[str] = None,
+    skip_invalid: bool = True
+) -> Iterator[Tuple[Dict[str, str], bool]]:
+    """
+    Lazily reads the input CSV file, yielding one standardized row at a time so that processing
+    can start before the whole file has been read. See read_csv_file for the parameters.
+
+    Yields:
+    -------
+    Tuple[Dict[str, str], bool]
+        - Dictionary with the keys 'ID', 'OriginA', 'DestinationA', 'OriginB', 'DestinationB'.
+        - False if the row has invalid coordinates (it is still yielded when skip_invalid is True).
+    """
+    csv_path = os.path.join(input_dir, csv_file)
+    with open(csv_path, mode="r", encoding="utf-8") as file:
+        # Plain csv.reader rows plus one itemgetter per row avoid building a dict for every CSV line
+        reader = csv.reader(file)
+        csv_columns = next(reader, [])
+        # Same resolution as csv.DictReader: a repeated header name maps to its last column
+        column_index = {name: index for index, name in enumerate(csv_columns)}
+
+        # Check all required columns exist
+        required_columns = [
+            home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon
+        ]
+        for column in required_columns:
+            if column not in csv_columns:
+                raise ValueError(f"Column '{column}' not found in the CSV file.")
+
+        use_id_column = bool(id_column) and id_column in csv_columns
+        extract_columns = itemgetter(
+            *(column_index[column] for column in required_columns),
+            column_index[id_column] if use_id_column else 0,
+        )
+        endpoint_names = ("OriginA", "DestinationA", "OriginB", "DestinationB")
+
+        # Single pass: each CSV row is mapped straight to the standardized columns (and ID).
+        # Blank lines are skipped and not counted, as csv.DictReader does.
+        for row_number, row in enumerate(filter(None, reader), 1):
+            *values, id_value = extract_columns(row)
+            mapped_row = {"ID": id_value if use_id_column else f"R{row_number}"}
+            invalids = []
+            for i, name in enumerate(endpoint_names):
+                coord = mapped_row[name] = f"{values[2 * i].strip()},{values[2 * i + 1].strip()}"
+                # Validated with the same cached parser the row functions use, so a repeated
+                # coordinate is parsed once, and a value accepted here is also accepted there
+                if not is_valid_coordinate(coord):
+                    invalids.append(coord)
+
+            if invalids:
+                error_msg = f"Row {row_number} - Invalid coordinates: {invalids}"
+                logging.warning(error_msg)
+                if not skip_invalid:
+                    raise ValueError(error_msg)
+
+            yield mapped_row, not invalids
 
 def read_csv_file(
     csv_file: str,
@@ -199,65 +583,57 @@ def read_csv_file(
     - The function combines each latitude/longitude pair into a single string "lat,lon" for each endpoint.
     - The function ensures each row has an 'ID' field, either from the CSV or auto-generated.
     """
-    csv_path = os.path.join(input_dir, csv_file)
-    with open(csv_path, mode="r", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        csv_columns = reader.fieldnames
+    mapped_data = []
+    error_count = 0
+    for mapped_row, is_valid in iter_csv_rows(
+        csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+        home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+    ):
+        mapped_data.append(mapped_row)
+        error_count += not is_valid
 
-        # Check all required columns exist
-        required_columns = [
-            home_a_lat, home_a_lon, work_a_lat, work_a_lon,
-            home_b_lat, home_b_lon, work_b_lat, work_b_lon
-        ]
-        for column in required_columns:
-            if column not in csv_columns:
-                raise ValueError(f"Column '{column}' not found in the CSV file.")
+    return mapped_data, error_count
 
-        rows = list(reader)
-
-        # Combine lat/lon into coordinate strings
-        for idx, row in enumerate(rows, 1):
-            row["OriginA"] = f"{row[home_a_lat].strip()},{row[home_a_lon].strip()}"
-            row["DestinationA"] = f"{row[work_a_lat].strip()},{row[work_a_lon].strip()}"
-            row["OriginB"] = f"{row[home_b_lat].strip()},{row[home_b_lon].strip()}"
-            row["DestinationB"] = f"{row[work_b_lat].strip()},{row[work_b_lon].strip()}"
-            # Handle ID column
-            if id_column and id_column in csv_columns:
-                row["ID"] = row[id_column]
-            else:
-                row["ID"] = f"R{idx}"
-
-        mapped_data = []
-        error_count = 0
-        row_number = 1
-        for row in rows:
-            coords = [
-                row["OriginA"],
-                row["DestinationA"],
-                row["OriginB"],
-                row["DestinationB"],
-            ]
-            invalids = [c for c in coords if not is_valid_coordinate(c)]
+@lru_cache(maxsize=None)
+def request_cost_table(approximation: str, commuting_info: str) -> np.ndarray:
+    """
+    Lists the number of API requests a row needs for every combination of shared endpoints.
 
-            if invalids:
-                error_msg = f"Row {row_number} - Invalid coordinates: {invalids}"
-                logging.warning(error_msg)
-                error_count += 1
-                if not skip_invalid:
-                    raise ValueError(error_msg)
+    Parameters:
+    - approximation (str): Approximation strategy to apply.
+    - commuting_info (str): Whether commuting info is to be considered.
 
-            # Only keep standardized columns (and ID)
-            mapped_row = {
-                "ID": row["ID"],
-                "OriginA": row["OriginA"],
-                "DestinationA": row["DestinationA"],
-                "OriginB": row["OriginB"],
-                "DestinationB": row["DestinationB"],
-            }
-            mapped_data.append(mapped_row)
-            row_number += 1
+    Returns:
+    - np.ndarray: 16 request counts, indexed by same_a * 8 + same_b * 4 + same_a_dest * 2 + same_b_dest.
+    """
+    costs = []
+    for same_a, same_b, same_a_dest, same_b_dest in product((False, True), repeat=4):
+        if approximation == "no":
+            n = 1 if same_a and same_b else (7 if commuting_info == "yes" else 3)
+
+        elif approximation == "yes":
+            n = 1 if same_a and same_b else (7 if commuting_info == "yes" else 4)
+
+        elif approximation == "yes with buffer":
+            if same_a_dest and same_b_dest:
+                n = 0
+            elif same_a_dest or same_b_dest or (same_a and same_b):
+                n = 1
+            else:
+                n = 2
 
-        return mapped_data, error_count
+        elif approximation == "closer to precision" or approximation == "exact":
+            if same_a_dest and same_b_dest:
+                n = 0
+            elif same_a_dest or same_b_dest or (same_a and same_b):
+                n = 1
+            else:
+                n = 8 if commuting_info == "yes" else 4
+
+        else:
+            raise ValueError(f"Invalid approximation option: '{approximation}'")
+        costs.append(n)
+    return np.array(costs)
 
 def request_cost_estimation(
     csv_file: str,
@@ -299,44 +675,29 @@ def request_cost_estimation(
     - Tuple[int, float]: Estimated number of API requests and corresponding cost in USD.
     """
 
-    data_set, pre_api_error_count = read_csv_file(csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon, home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid=skip_invalid)
-    n = 0
-
-    for row in data_set:
-        origin_a = row["OriginA"]
-        destination_a = row["DestinationA"]
-        origin_b = row["OriginB"]
-        destination_b = row["DestinationB"]
-
-        same_a = origin_a == origin_b
-        same_b = destination_a == destination_b
-        same_a_dest = origin_a == destination_a
-        same_b_dest = origin_b == destination_b
-
-        if approximation == "no":
-            n += 1 if same_a and same_b else (7 if commuting_info == "yes" else 3)
-
-        elif approximation == "yes":
-            n += 1 if same_a and same_b else (7 if commuting_info == "yes" else 4)
+    costs = request_cost_table(approximation, commuting_info)
 
-        elif approximation == "yes with buffer":
-            if same_a_dest and same_b_dest:
-                n += 0
-            elif same_a_dest or same_b_dest or (same_a and same_b):
-                n += 1
-            else:
-                n += 2
+    # Rows are streamed from the file and only counted per combination of shared endpoints
+    # (indexed as in request_cost_table), so memory use does not grow with the number of rows
+    combination_counts = [0] * 16
 
-        elif approximation == "closer to precision" or approximation == "exact":
-            if same_a_dest and same_b_dest:
-                n += 0
-            elif same_a_dest or same_b_dest or (same_a and same_b):
-                n += 1
-            else:
-                n += 8 if commuting_info == "yes" else 4
+    for row, _ in iter_csv_rows(
+        csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+        home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+    ):
+        # Points are compared like the row functions compare them, so "45.5,-73.6" and
+        # "45.50,-73.60" count as the same point here as they do when the rows are processed
+        origin_a, destination_a = row["OriginA"], row["DestinationA"]
+        origin_b, destination_b = row["OriginB"], row["DestinationB"]
+        combination_counts[
+            same_point(origin_a, origin_b) * 8
+            + same_point(destination_a, destination_b) * 4
+            + same_point(origin_a, destination_a) * 2
+            + same_point(origin_b, destination_b)
+        ] += 1
 
-        else:
-            raise ValueError(f"Invalid approximation option: '{approximation}'")
+    # Weight the row counts of each combination by their request cost
+    n = int(np.dot(combination_counts, costs))
 
     cost = (n / 1000) * 5  # USD estimate
     return n, cost
@@ -352,8 +713,8 @@ def generate_request_body(origin: str, destination: str) -> dict:
     Returns:
     - dict: JSON body for the Routes API POST request.
     """
-    origin_lat, origin_lng = map(float, origin.split(','))
-    dest_lat, dest_lng = map(float, destination.split(','))
+    origin_lat, origin_lng = parse_coordinate(origin)
+    dest_lat, dest_lng = parse_coordinate(destination)
 
     return {
         "origin": {
@@ -379,6 +740,39 @@ def generate_request_body(origin: str, destination: str) -> dict:
         }
     }
 
+# Encoded polylines shorter than this are decoded with the polyline package, which is faster
+# for them than setting up the arrays
+POLYLINE_ARRAY_DECODE_MIN_LENGTH = 256
+
+def decode_polyline(expression: str, precision: int = 5) -> List[Tuple[float, float]]:
+    """
+    Decodes an encoded polyline into (latitude, longitude) tuples, with the same values as
+    polyline.decode. Long polylines are decoded with array operations instead of a Python
+    loop over their characters.
+
+    Parameters:
+    - expression (str): The encoded polyline.
+    - precision (int): Number of decimals of the encoded coordinates (5 for Google).
+
+    Returns:
+    - list: (latitude, longitude) tuples.
+    """
+    if len(expression) < POLYLINE_ARRAY_DECODE_MIN_LENGTH:
+        return polyline.decode(expression, precision)
+
+    # Each value is a run of 5-bit chunks (offset by 63); only its last chunk is below 0x20
+    chunks = np.frombuffer(expression.encode("ascii"), dtype=np.uint8).astype(np.int64) - 63
+    ends = np.flatnonzero(chunks < 0x20)
+    if not ends.size or ends.size % 2 or ends[-1] != chunks.size - 1:
+        raise ValueError("Malformed encoded polyline.")
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    shifts = 5 * (np.arange(chunks.size) - np.repeat(starts, ends + 1 - starts))
+    values = np.add.reduceat((chunks & 0x1F) << shifts, starts)
+    # Zigzag decoding gives the deltas, alternately of latitude and longitude
+    deltas = np.where(values & 1, ~(values >> 1), values >> 1)
+    coordinates = np.cumsum(deltas.reshape(-1, 2), axis=0) / float(10 ** precision)
+    return list(map(tuple, coordinates.tolist()))
+
 def get_route_data_google(origin: str, destination: str, api_key: str, save_api_info: bool = False) -> tuple:
     """
     Fetches route data from the Google Maps Routes API (v2) and decodes the polyline.
@@ -408,19 +802,18 @@ def get_route_data_google(origin: str, destination: str, api_key: str, save_api_
 
     for attempt in range(max_retries):
         try:
-            response = requests.post(GOOGLE_API_URL, json=body, headers=headers)
-            data = response.json()
+            response = http_session.post(GOOGLE_API_URL, json=body, headers=headers, timeout=REQUEST_TIMEOUT)
+            data = load_json(response.content)
 
             if response.status_code == 200 and "routes" in data and data["routes"]:
                 if save_api_info:
-                    global api_response_cache
-                    api_response_cache[(origin, destination)] = data
+                    api_response_cache.put((origin, destination), response.content)
 
                 # Pick the shortest route if alternatives are present
                 route = min(data["routes"], key=lambda r: r["legs"][0].get("distanceMeters", float("inf")))
 
                 polyline_points = route["polyline"]["encodedPolyline"]
-                coordinates = polyline.decode(polyline_points)
+                coordinates = decode_polyline(polyline_points)
 
                 legs = route.get("legs", [])
                 if not legs:
@@ -472,12 +865,11 @@ def get_route_data_graphhopper(origin: str, destination: str, profile: str = "ca
     }
 
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
+        response = http_session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        data = load_json(response.content)
 
         if save_api_info:
-            global api_response_cache
-            api_response_cache[(origin, destination)] = data
+            api_response_cache.put((origin, destination), response.content)
 
         if "paths" not in data or not data["paths"]:
             print("No route found.")
@@ -496,10 +888,94 @@ def get_route_data_graphhopper(origin: str, destination: str, profile: str = "ca
         print(f"GraphHopper error: {e}")
         return [], 0, 0
 
+def enable_route_cache(path: Optional[str]) -> None:
+    """
+    Enables (or, with None, disables) the on-disk route cache used by get_route_data.
+
+    Parameters:
+    - path (Optional[str]): Path of the SQLite file holding cached routes.
+
+    Returns:
+    - None
+    """
+    global persistent_route_cache
+    if persistent_route_cache is not None:
+        persistent_route_cache.close()
+    persistent_route_cache = RouteCache(path, max_age=ROUTE_CACHE_MAX_AGE) if path else None
+
+def route_cache_key(method: str, origin: str, destination: str) -> Tuple[str, str, str]:
+    """
+    Returns the route cache key of a lookup; coordinates are normalized so that the same point
+    written with different precision or spacing is only requested once.
+    """
+    return method, normalize_coordinate(origin), normalize_coordinate(destination)
+
+def _usable_route(entry: Optional[tuple], save_api_info: bool, origin: str, destination: str) -> Optional[tuple]:
+    """
+    Returns a route cache entry if it can serve a lookup, or None if the lookup must go on.
+
+    A route without its raw response cannot serve a run that saves API info, the same rule
+    the on-disk cache follows. If the response was saved under another spelling of the pair,
+    it is copied so that api_response_cache also has it under (origin, destination).
+    """
+    if entry is None or not save_api_info:
+        return entry
+    response_key = entry[3]
+    if response_key is None:
+        return None
+    if response_key != (origin, destination) and (origin, destination) not in api_response_cache:
+        api_response_cache.put((origin, destination), api_response_cache.get_raw(response_key))
+    return entry
+
+def _cached_route(key: Tuple[str, str, str], save_api_info: bool, origin: str, destination: str) -> Optional[tuple]:
+    """
+    Returns a cached (coordinates, distance_km, time_min) tuple, or None on a miss.
+    """
+    with route_cache_lock:
+        cached = route_cache.get(key)
+        if cached is not None:
+            route_cache.move_to_end(key)
+    cached = _usable_route(cached, save_api_info, origin, destination)
+    if cached is None and persistent_route_cache is not None:
+        stored = persistent_route_cache.get(_persistent_key(key))
+        # A stored route without its raw response cannot serve a run that saves API info
+        if stored is not None and (not save_api_info or stored[3] is not None):
+            coordinates, distance_km, time_min, response = stored
+            response_key = None
+            if save_api_info:
+                response_key = (origin, destination)
+                api_response_cache.put(response_key, response)
+            cached = (coordinates, distance_km, time_min, response_key)
+            _remember_route(key, cached)
+    if cached is None:
+        return None
+    # Callers get their own list so a cached route is never modified in place
+    return list(cached[0]), cached[1], cached[2]
+
+def _persistent_key(key: Tuple[str, str, str]) -> str:
+    """
+    Returns the on-disk cache key of a route cache key, tagged with ROUTE_CACHE_VERSION.
+    """
+    return "|".join((ROUTE_CACHE_VERSION, *key))
+
+def _remember_route(key: Tuple[str, str, str], route: tuple) -> None:
+    with route_cache_lock:
+        route_cache[key] = route
+        route_cache.move_to_end(key)
+        if len(route_cache) > ROUTE_CACHE_MAXSIZE:
+            route_cache.popitem(last=False)
+
 def get_route_data(origin: str, destination: str, method: str = "google", api_key: Optional[str] = None, save_api_info: bool = False) -> tuple:
     """
     Unified routing interface supporting Google and GraphHopper.
 
+    Successful lookups are memoized in memory and, if enabled with enable_route_cache,
+    on disk, so that repeated origin/destination pairs are only requested once. Only the
+    lookups that reach the routing service are counted in route_requests_sent. A route whose
+    origin is also its destination (compared as same_point does) is returned as ([], 0.0, 0.0),
+    a zero-length route, without a request. The row functions handle such routes in their own
+    branches before asking for them, so only the segment requests rely on this.
+
     Parameters:
     - origin (str): "latitude,longitude"
     - destination (str): "latitude,longitude"
@@ -513,41 +989,301 @@ def get_route_data(origin: str, destination: str, method: str = "google", api_ke
     if method == "google":
         if api_key is None:
             raise ValueError("API key is required for Google Maps method.")
-        return get_route_data_google(origin, destination, api_key, save_api_info)
+    elif method != "graphhopper":
+        raise ValueError("Method must be 'google' or 'graphhopper'.")
 
-    elif method == "graphhopper":
-        return get_route_data_graphhopper(origin, destination, save_api_info=save_api_info)
+    global route_requests_sent
+    key = route_cache_key(method, origin, destination)
+    # A route from a point to itself is empty; this covers the segment requests of routes whose
+    # first common node is their origin, without a billed request. The keys are normalized, so
+    # this is the same equality as same_point, which the row functions check first.
+    if key[1] == key[2]:
+        return [], 0.0, 0.0
+    cached = _cached_route(key, save_api_info, origin, destination)
+    if cached is not None:
+        return cached
+
+    # Only the first thread asking for a route fetches it; the others wait for its result
+    with route_cache_lock:
+        cached = route_cache.get(key)
+        if save_api_info and cached is not None and cached[3] is None:
+            cached = None
+        future = inflight_routes.get(key)
+        is_owner = cached is None and future is None
+        if is_owner:
+            future = inflight_routes[key] = Future()
+            route_requests_sent += 1
+    if not is_owner:
+        if cached is None:
+            cached = future.result()
+            # The owner did not save the response this lookup needs, so it is fetched again
+            if cached[0] and _usable_route(cached, save_api_info, origin, destination) is None:
+                return get_route_data(origin, destination, method, api_key, save_api_info)
+        _usable_route(cached, save_api_info, origin, destination)
+        return list(cached[0]), cached[1], cached[2]
 
-    else:
-        raise ValueError("Method must be 'google' or 'graphhopper'.")
+    try:
+        if method == "google":
+            coordinates, distance_km, time_min = get_route_data_google(origin, destination, api_key, save_api_info)
+        else:
+            coordinates, distance_km, time_min = get_route_data_graphhopper(origin, destination, save_api_info=save_api_info)
+
+        response = api_response_cache.get_raw((origin, destination)) if save_api_info else None
+        entry = (coordinates, distance_km, time_min, (origin, destination) if response is not None else None)
+        # Failed lookups return an empty route and are not cached
+        if coordinates:
+            _remember_route(key, entry)
+            if persistent_route_cache is not None:
+                persistent_route_cache.put(_persistent_key(key), coordinates, distance_km, time_min, response)
+        future.set_result(entry)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with route_cache_lock:
+            inflight_routes.pop(key, None)
+
+    return list(coordinates), distance_km, time_min
+
+def get_routes_concurrently(
+    pairs: List[Tuple[str, str]],
+    method: str,
+    api_key: Optional[str],
+    save_api_info: bool = False
+) -> List[tuple]:
+    """
+    Fetches several independent routes at the same time instead of one after another.
 
-def wrap_row(args): 
+    Parameters:
+    - pairs (List[Tuple[str, str]]): (origin, destination) pairs in "latitude,longitude" format.
+    - method (str): "google" or "graphhopper"
+    - api_key (str): Required for Google
+    - save_api_info (bool): Cache raw response
+
+    Returns:
+    - List[tuple]: (coordinates, distance_km, time_min) for each pair, in the order of `pairs`.
     """
-    Wraps a single row-processing task for multithreading.
+    start_time = time.perf_counter()
+    futures = [
+        route_request_executor.submit(get_route_data, origin, destination, method, api_key, save_api_info)
+        for origin, destination in pairs
+    ]
+    routes = [future.result() for future in futures]
+    timing_log.debug("Time for %s concurrent API call(s): %.2f seconds", len(pairs), time.perf_counter() - start_time)
+    return routes
 
-    Args:
-        args (tuple): A tuple containing:
-            - row (dict): A dictionary representing a single row of data with keys:
-            - api_key (str): API key for route data fetching.
-            - row_function (callable): Function that processes a single row.
-            - input_dir (str): Directory containing the input CSV file's folder.
-            - skip_invalid (bool): If True, skips rows with errors; if False, raises an error.
-            - save_api_info (bool): If True, saves API response.
-            - method (str): "google" or "graphhopper"
+def prefetch_routes(
+    data: List[Dict[str, Any]],
+    method: str,
+    api_key: Optional[str],
+    save_api_info: bool = False
+) -> None:
+    """
+    Requests the A and B routes of all rows up front, so that the row functions find them in the
+    route cache.
+
+    Every distinct origin/destination pair is requested once, with as many requests in flight as
+    the shared HTTP connection pool allows. Pairs already in the in-memory route cache are skipped,
+    and so are routes whose origin is also their destination, which get_route_data answers without
+    a request.
+    Failures are left to the row functions, which will request the route again and report the
+    error for their row.
+
+    Parameters:
+    - data (List[Dict[str, Any]]): Rows with OriginA, DestinationA, OriginB and DestinationB.
+    - method (str): "google" or "graphhopper"
+    - api_key (str): Required for Google
+    - save_api_info (bool): Cache raw response
 
     Returns:
-        dict or None
+    - None
     """
-    row, api_key, row_function, input_dir, skip_invalid, save_api_info, method = args
-    return row_function(
-        (row, api_key, save_api_info),
-        method=method,
-        skip_invalid=skip_invalid,
-        input_dir=input_dir
-    )
+    # Keyed like the route cache, so that spellings of the same pair are submitted once
+    pairs = {}
+    for row in data:
+        for origin, destination in ((row["OriginA"], row["DestinationA"]), (row["OriginB"], row["DestinationB"])):
+            key = route_cache_key(method, origin, destination)
+            if key[1] != key[2]:
+                pairs.setdefault(key, (origin, destination))
+    with route_cache_lock:
+        # A cached route without its raw response is fetched again when saving API info, see _usable_route
+        pairs = [
+            pair for key, pair in pairs.items()
+            if key not in route_cache or (save_api_info and route_cache[key][3] is None)
+        ]
+    # Prefetching more routes than the cache holds would evict them before the rows run
+    pairs = pairs[:ROUTE_CACHE_MAXSIZE]
+
+    start_time = time.perf_counter()
+    futures = [
+        route_request_executor.submit(get_route_data, origin, destination, method, api_key, save_api_info)
+        for origin, destination in pairs
+    ]
+    try:
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                pass
+    except KeyboardInterrupt:
+        for future in futures:
+            future.cancel()
+        raise
+    timing_log.debug("Time to prefetch %s route(s): %.2f seconds", len(pairs), time.perf_counter() - start_time)
+
+def route_pair_key(row: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """
+    Returns the origins and destinations of a row's two routes, which fully determine its result.
+    """
+    return row["OriginA"], row["DestinationA"], row["OriginB"], row["DestinationB"]
+
+def repeat_row_result(result: tuple, row: Dict[str, Any]) -> tuple:
+    """
+    Returns a copy of a row result for another row with the same route pair, counting no API calls.
+    Any trailing items after (result_dict, api_calls, api_errors), such as buffers, are shared.
+    """
+    row_result, _, api_errors, *extra = result
+    return (dict(row_result, ID=row["ID"]), 0, api_errors, *extra)
+
+def group_repeated_rows(
+    window: List[Dict[str, Any]],
+    finished_pairs: LRUDict,
+    pair_key: Callable[[Dict[str, Any]], tuple] = route_pair_key
+) -> Tuple[Dict[tuple, List[Dict[str, Any]]], List[Tuple[Dict[str, Any], int, int]]]:
+    """
+    Groups the rows of a window by route pair, so that rows repeating an earlier pair are not processed again.
+
+    Parameters:
+    - window (List[Dict[str, Any]]): Rows about to be processed.
+    - finished_pairs (LRUDict): Error-free row results of earlier windows, keyed by pair_key.
+    - pair_key (Callable): Returns the key of a row's route pair; route_pair_key by default.
+
+    Returns:
+    - tuple: (
+        pending (dict): Rows of each new route pair; only the first of each needs processing,
+        reused (list): (result_dict, api_calls, api_errors, ...) of the rows whose pair has a result already
+      )
+    """
+    pending: Dict[tuple, List[Dict[str, Any]]] = {}
+    reused = []
+    for row in window:
+        key = pair_key(row)
+        if key in finished_pairs:
+            reused.append(repeat_row_result(finished_pairs[key], row))
+        else:
+            pending.setdefault(key, []).append(row)
+    return pending, reused
+
+def iter_row_results(
+    data: Iterable[Dict[str, Any]],
+    submit: Callable[[Dict[str, Any]], Future],
+    method: Optional[str],
+    api_key: Optional[str],
+    save_api_info: bool = False,
+    run: Optional[Callable[[Dict[str, Any]], tuple]] = None,
+    reuse_results: bool = True,
+    finished_maxsize: int = FINISHED_RESULTS_MAXSIZE
+) -> Iterator[Tuple[Dict[str, Any], int, int]]:
+    """
+    Runs rows through submit and yields their (result_dict, api_calls, api_errors) as they complete.
+
+    Rows are taken in windows of PREFETCH_WINDOW: if method is given, the distinct A/B routes of a
+    window are fetched first, many at a time, then its rows are submitted against the warm route
+    cache. The next window is read as soon as fewer than PREFETCH_WINDOW rows are still running,
+    so its prefetch overlaps with the slowest rows of the previous one instead of waiting for them.
+    Rows repeating the route pair of an earlier or still running row take its result, unless
+    reuse_results is False. If the row processed for a pair returns None or an error result, the
+    next row repeating the pair is processed instead. Row functions may return items after
+    (result_dict, api_calls, api_errors); they are passed through unchanged.
+
+    Parameters:
+    - data (Iterable[Dict[str, Any]]): Input rows; may be a generator.
+    - submit (Callable): Submits one row to the thread pool and returns its Future.
+    - method (Optional[str]): Routing method used to prefetch the routes, or None to skip prefetching.
+    - api_key (str): Required for Google
+    - save_api_info (bool): Cache raw response
+    - run (Optional[Callable]): Processes one row in the calling thread and returns its result. If
+      given, rows whose origins equal their destinations on both routes, which need no routing
+      request, are run with it instead of paying for a round trip through the thread pool.
+    - reuse_results (bool): If False, every row is processed, even if it repeats the route pair of
+      another row; needed when the row functions have side effects such as saving a map per row.
+    - finished_maxsize (int): Number of finished results kept for rows repeating a pair of an
+      earlier window. Row functions returning route coordinates should pass
+      FINISHED_ROUTE_RESULTS_MAXSIZE, as their results are far larger.
+
+    Returns:
+    - Iterator of (result_dict, api_calls, api_errors), in completion order.
+    """
+    rows = iter(data)
+    # Rows repeating the route pair of an earlier row reuse its result instead of being processed again
+    finished_pairs = LRUDict(finished_maxsize)
+    running: Dict[Future, tuple] = {}
+    running_pairs: Dict[tuple, List[Dict[str, Any]]] = {}
+
+    if reuse_results:
+        pair_key = route_pair_key
+    else:
+        # Numbering the rows gives every row a pair of its own
+        row_numbers = count()
+
+        def pair_key(row):
+            return (*route_pair_key(row), next(row_numbers))
+
+    def finish(key, pair_rows, result):
+        # Yields a row result, then shares it with the rows repeating its route pair
+        if result is None or result[2]:
+            # A missing or failed result is not shared (the failure may be transient), so the
+            # next row of the pair is processed in its place
+            if len(pair_rows) > 1:
+                running_pairs[key] = pair_rows[1:]
+                running[submit(pair_rows[1])] = key
+            if result is not None:
+                yield result
+            return
+        if reuse_results:
+            finished_pairs[key] = result
+        yield result
+        for row in pair_rows[1:]:
+            yield repeat_row_result(result, row)
+
+    try:
+        while True:
+            window = list(islice(rows, PREFETCH_WINDOW))
+            if window:
+                pending, reused = group_repeated_rows(window, finished_pairs, pair_key)
+                yield from reused
+                new_pairs = {}
+                for key, pair_rows in pending.items():
+                    if key in running_pairs:
+                        running_pairs[key].extend(pair_rows)
+                    else:
+                        new_pairs[key] = pair_rows
+                if method is not None:
+                    prefetch_routes([pair_rows[0] for pair_rows in new_pairs.values()], method, api_key, save_api_info)
+                for key, pair_rows in new_pairs.items():
+                    if run is not None and same_point(key[0], key[1]) and same_point(key[2], key[3]):
+                        yield from finish(key, pair_rows, run(pair_rows[0]))
+                        continue
+                    running_pairs[key] = pair_rows
+                    running[submit(pair_rows[0])] = key
+
+            # After the last window, every running row is waited for
+            limit = PREFETCH_WINDOW if window else 0
+            while len(running) > limit:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    yield from finish(key, running_pairs.pop(key), future.result())
+
+            if not window:
+                break
+    finally:
+        # Drop the queued rows so that leaving the pool only waits for the running ones
+        for future in running:
+            future.cancel()
 
 def process_rows(
-    data: List[Dict[str, Any]],
+    data: Iterable[Dict[str, Any]],
     api_key: str,
     row_function: Callable[
         [Tuple[Dict[str, Any], str, bool], str, bool, str],
@@ -557,59 +1293,74 @@ def process_rows(
     input_dir: str = "",
     processes: Optional[int] = None,
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    output_writer: Optional[CsvResultWriter] = None,
+    plot: bool = False
 ) -> Tuple[List[Dict[str, Any]], int, int]:
     """
-    Processes a list of data rows using multiprocessing, applying a row_function to each row.
+    Processes a list of data rows on a thread pool, applying a row_function to each row.
 
-    Each row is passed to a wrapper function that supplies additional context like the API key,
-    method, input directory, and flags for error handling and API info saving.
+    Each row is passed to row_function along with the additional context it needs: the API key,
+    method, input directory, and flags for error handling and API info saving. Rows with the same
+    origins and destinations as an earlier row are not passed again but take its result, unless
+    plot is set, in which case every row is passed so that each saves its own map.
 
     Args:
-        data (List[Dict[str, Any]]): List of input rows (each as a dictionary).
+        data (Iterable[Dict[str, Any]]): Input rows (each as a dictionary); may be a generator, in
+            which case rows are read while earlier ones are being processed.
         api_key (str): API key used by the row processing function (e.g., for route services).
         row_function (Callable): Function to apply to each row. Must accept a tuple of 
-            (row, api_key, save_api_info) and keyword args: method, skip_invalid, input_dir.
+            (row, api_key, save_api_info) and keyword args: method, skip_invalid, input_dir, plot.
         method (str): Routing method to use, e.g., "google" or "graphhopper".
         input_dir (str, optional): Path to input directory containing reference data or files.
-        processes (Optional[int], optional): Number of parallel worker processes. Defaults to CPU count.
+        processes (Optional[int], optional): Number of rows processed at the same time. Rows mostly wait
+            on the routing API, so this is best set well above the CPU count. Defaults to ROW_WORKERS.
         skip_invalid (bool, optional): If True, skips rows that raise errors. If False, raises on error.
         save_api_info (bool, optional): If True, saves the raw API response along with row output.
+        output_writer (Optional[CsvResultWriter], optional): If given, each row is written to it as
+            soon as it is processed instead of being collected in the returned list.
+        plot (bool, optional): If True, row_function saves a map for every row. Defaults to False, since
+            rendering maps is far slower than computing the overlaps.
 
     Returns:
         Tuple[List[Dict[str, Any]], int, int]:
-            - List of successfully processed rows (as dictionaries).
-            - Total number of API calls made.
+            - List of successfully processed rows (as dictionaries); empty when output_writer is given.
+            - Number of route requests sent to the routing service, see route_requests_sent.
             - Total number of API-related errors encountered.
     """
-    args = [
-        (row, api_key, row_function, input_dir, skip_invalid, save_api_info, method)
-        for row in data
-    ]
-
     processed_rows: List[Dict[str, Any]] = []
-    total_api_calls = 0
+    requests_before = route_requests_sent
     total_api_errors = 0
     processed_count = 0
+    # The arguments shared by all rows are bound once; each task only carries its row
+    process_row = partial(
+        row_function, method=method, skip_invalid=skip_invalid, input_dir=input_dir, plot=plot
+    )
+
+    def run(row):
+        return process_row((row, api_key, save_api_info))
 
     try:
-        with Pool(processes=processes) as pool:
-            for result in pool.imap_unordered(wrap_row, args):
-                if result is None:
-                    continue
-                row_result, api_calls, api_errors = result
-                processed_rows.append(row_result)
-                total_api_calls += api_calls
-                total_api_errors += api_errors
-                processed_count += 1
-                print(f"[INFO] Processed {processed_count} row(s)...")
+        with ThreadPoolExecutor(max_workers=processes or ROW_WORKERS, thread_name_prefix="row") as pool:
+            with closing(iter_row_results(
+                data, lambda row: pool.submit(run, row), method, api_key, save_api_info, run,
+                reuse_results=not plot
+            )) as results:
+                for row_result, _, api_errors in results:
+                    if output_writer is not None:
+                        output_writer.write_row(row_result)
+                    else:
+                        processed_rows.append(row_result)
+                    total_api_errors += api_errors
+                    processed_count += 1
+                    print(f"[INFO] Processed {processed_count} row(s)...")
 
     except KeyboardInterrupt:
         print("\n[INTERRUPTED] Keyboard interrupt received. Returning partial results...")
 
-    return processed_rows, total_api_calls, total_api_errors
+    return processed_rows, route_requests_sent - requests_before, total_api_errors
 
-def process_row_overlap(row_and_api_key_and_flag, method, skip_invalid=True, input_dir=""):
+def process_row_overlap(row_and_api_key_and_flag, method, skip_invalid=True, input_dir="", plot=False):
     """
     Processes one pair of routes, finds overlap, segments travel, and handles errors based on skip_invalid.
 
@@ -618,6 +1369,7 @@ def process_row_overlap(row_and_api_key_and_flag, method, skip_invalid=True, inp
         method (str): "google" or "graphhopper"
         skip_invalid (bool): If True, skips rows with errors; if False, raises an error.
         input_dir (str): Directory containing the folder of the input CSV file.
+        plot (bool): If True, saves a map of the two routes and their common nodes.
 
     Returns:
         tuple: (result_dict, api_calls, api_errors)
@@ -630,46 +1382,19 @@ def process_row_overlap(row_and_api_key_and_flag, method, skip_invalid=True, inp
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
 
-        # Split "lat,lon" into separate variables for each endpoint
-        origin_a_lat, origin_a_lon = map(str.strip, origin_a.split(","))
-        destination_a_lat, destination_a_lon = map(str.strip, destination_a.split(","))
-        origin_b_lat, origin_b_lon = map(str.strip, origin_b.split(","))
-        destination_b_lat, destination_b_lon = map(str.strip, destination_b.split(","))
+        # Parse "lat,lon" into floats once; every result branch and the comparisons below share them
+        endpoints = endpoint_fields(row)
+
+        same_origin = same_point(origin_a, origin_b)
+        same_destination = same_point(destination_a, destination_b)
 
-        if origin_a == origin_b and destination_a == destination_b:
+        if same_origin and same_destination:
             api_calls += 1
             coordinates_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info)
-            plot_routes(coordinates_a, [], (), (), ID, input_dir)
+            if plot:
+                plot_routes(coordinates_a, [], (), (), ID, input_dir)
             # Return structured full overlap result as a dictionary, along with API stats
-            return (
-                FullOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=a_dist,           
-                    bTime=a_time,
-                    overlapDist=a_dist,
-                    overlapTime=a_time,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0,
-                ).model_dump(),
-                api_calls,
-                0  # no error flag
-            )
+            return same_route_result(FullOverlapResult, endpoints, a_dist, a_time), api_calls, 0
         
         api_calls += 1
         coordinates_a, total_distance_a, total_time_a = get_route_data(origin_a, destination_a, method, api_key, save_api_info)
@@ -679,79 +1404,50 @@ def process_row_overlap(row_and_api_key_and_flag, method, skip_invalid=True, inp
         first_common_node, last_common_node = find_common_nodes(coordinates_a, coordinates_b)
 
         if not first_common_node or not last_common_node:
-            plot_routes(coordinates_a, coordinates_b, (), (), ID, input_dir)
+            if plot:
+                plot_routes(coordinates_a, coordinates_b, (), (), ID, input_dir)
             return (
-                FullOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
+                no_overlap_result(
+                    FullOverlapResult,
+                    endpoints,
                     aDist=total_distance_a,
                     aTime=total_time_a,
                     bDist=total_distance_b,
                     bTime=total_time_b,
-                    overlapDist=0.0,
-                    overlapTime=0.0,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0,
-                ).model_dump(),
+                ),
                 api_calls,
                 0
             )
 
-        before_a, overlap_a, after_a = split_segments(coordinates_a, first_common_node, last_common_node)
-        before_b, overlap_b, after_b = split_segments(coordinates_b, first_common_node, last_common_node)
-
-        api_calls += 1
-        start_time = time.time()
-        _, before_a_distance, before_a_time = get_route_data(origin_a, f"{before_a[-1][0]},{before_a[-1][1]}", method, api_key, save_api_info)
-        logging.info(f"Time for before_a API call: {time.time() - start_time:.2f} seconds")
-
-        api_calls += 1
-        start_time = time.time()
-        _, overlap_a_distance, overlap_a_time = get_route_data(
-            f"{overlap_a[0][0]},{overlap_a[0][1]}", f"{overlap_a[-1][0]},{overlap_a[-1][1]}", method, api_key, save_api_info)
-        logging.info(f"Time for overlap_a API call: {time.time() - start_time:.2f} seconds")
-
-        api_calls += 1
-        start_time = time.time()
-        _, after_a_distance, after_a_time = get_route_data(f"{after_a[0][0]},{after_a[0][1]}", destination_a, method, api_key, save_api_info)
-        logging.info(f"Time for after_a API call: {time.time() - start_time:.2f} seconds")
-
-        api_calls += 1
-        start_time = time.time()
-        _, before_b_distance, before_b_time = get_route_data(origin_b, f"{before_b[-1][0]},{before_b[-1][1]}", method, api_key, save_api_info)
-        logging.info(f"Time for before_b API call: {time.time() - start_time:.2f} seconds")
-
-        api_calls += 1
-        start_time = time.time()
-        _, after_b_distance, after_b_time = get_route_data(f"{after_b[0][0]},{after_b[0][1]}", destination_b, method, api_key, save_api_info)
-        logging.info(f"Time for after_b API call: {time.time() - start_time:.2f} seconds")
-
-        plot_routes(coordinates_a, coordinates_b, first_common_node, last_common_node, ID, input_dir)
+        # Every segment ends or starts at a common node, so the routes need not be split here:
+        # the before segments end at the first common node, the after segments start at the last.
+        first_common = format_coordinate(first_common_node)
+        last_common = format_coordinate(last_common_node)
+
+        # The five segment routes are independent of each other, so they are requested together
+        segment_pairs = [
+            (origin_a, first_common),
+            (first_common, last_common),
+            (last_common, destination_a),
+            (origin_b, first_common),
+            (last_common, destination_b),
+        ]
+        api_calls += len(segment_pairs)
+        (
+            (_, before_a_distance, before_a_time),
+            (_, overlap_a_distance, overlap_a_time),
+            (_, after_a_distance, after_a_time),
+            (_, before_b_distance, before_b_time),
+            (_, after_b_distance, after_b_time),
+        ) = get_routes_concurrently(segment_pairs, method, api_key, save_api_info)
+
+        if plot:
+            plot_routes(coordinates_a, coordinates_b, first_common_node, last_common_node, ID, input_dir)
 
         return (
-            FullOverlapResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                FullOverlapResult,
+                **endpoints,
                 aDist=total_distance_a,
                 aTime=total_time_a,
                 bDist=total_distance_b,
@@ -762,11 +1458,11 @@ def process_row_overlap(row_and_api_key_and_flag, method, skip_invalid=True, inp
                 aBeforeTime=before_a_time,
                 bBeforeDist=before_b_distance,
                 bBeforeTime=before_b_time,
-                aAfterDist=after_a_distance if after_a else 0.0,
-                aAfterTime=after_a_time if after_a else 0.0,
-                bAfterDist=after_b_distance if after_b else 0.0,
-                bAfterTime=after_b_time if after_b else 0.0,
-            ).model_dump(),
+                aAfterDist=after_a_distance,
+                aAfterTime=after_a_time,
+                bAfterDist=after_b_distance,
+                bAfterTime=after_b_time,
+            ),
             api_calls,
             0
         )
@@ -774,40 +1470,7 @@ def process_row_overlap(row_and_api_key_and_flag, method, skip_invalid=True, inp
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error in process_row_overlap for row {row}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-            return (
-                FullOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    overlapDist=None,
-                    overlapTime=None,
-                    aBeforeDist=None,
-                    aBeforeTime=None,
-                    bBeforeDist=None,
-                    bBeforeTime=None,
-                    aAfterDist=None,
-                    aAfterTime=None,
-                    bAfterDist=None,
-                    bAfterTime=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return error_result(FullOverlapResult, row, api_calls)
 
         else:
             raise
@@ -829,7 +1492,8 @@ def process_routes_with_csv(
     method: str = "google",
     output_csv: str = "output.csv",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    plot: bool = False
 ) -> Tuple[List[Dict[str, any]], int, int, int]:
     """
     Processes route pairs from a CSV file using a row-processing function and writes results to a new CSV file.
@@ -839,7 +1503,7 @@ def process_routes_with_csv(
     - Maps the user-provided column names to standard labels.
     - Optionally skips or halts on invalid coordinate entries.
     - Uses multithreading.
-    - Writes the processed route data to an output CSV file.
+    - Writes each processed row to the output CSV file as soon as it is available.
 
     Parameters:
     - csv_file (str): Name of the input CSV file containing the route pairs.
@@ -858,33 +1522,27 @@ def process_routes_with_csv(
     - output_csv (str): File path for saving the output CSV file (default: "output.csv").
     - skip_invalid (bool): If True (default), invalid rows are logged and skipped; if False, processing halts on the first invalid row.
     - save_api_info (bool): If True, API responses are saved; if False, API responses are not saved.
+    - plot (bool): If True, a map of each route pair is saved to the results folder (default: False).
 
     Returns:
     - tuple: (
-        results (list of dicts),
+        results (list of dicts; empty, the rows are streamed to output_csv),
         pre_api_error_count (int),
         total_api_calls (int),
         total_api_errors (int)
       )
     """
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
+    pre_api_error_count = 0
 
-    results, total_api_calls, total_api_errors = process_rows(
-        data, api_key, process_row_overlap, method=method, input_dir=input_dir, skip_invalid=skip_invalid, save_api_info=save_api_info
-    )
+    def mapped_rows():
+        # Rows are handed to the workers while the CSV file is still being read
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
 
     fieldnames = [
         "ID", "OriginAlat", "OriginAlong", "DestinationAlat", "DestinationAlong", 
@@ -895,14 +1553,20 @@ def process_routes_with_csv(
         "aAfterDist", "aAfterTime", "bAfterDist", "bAfterTime",
     ]
 
-    write_csv_file(input_dir, results, fieldnames, output_csv)
+    # Rows are written as they complete rather than collected and written at the end
+    with CsvResultWriter(input_dir, fieldnames, output_csv) as writer:
+        results, total_api_calls, total_api_errors = process_rows(
+            mapped_rows(), api_key, process_row_overlap, method=method, input_dir=input_dir, skip_invalid=skip_invalid,
+            save_api_info=save_api_info, output_writer=writer, plot=plot
+        )
 
     return results, pre_api_error_count, total_api_calls, total_api_errors
 
 
-def process_row_only_overlap(row_api_and_flag, method, skip_invalid=True, input_dir=""):
+def process_row_only_overlap(row_api_and_flag, method, skip_invalid=True, input_dir="", plot=False):
     """
     Processes a single route pair to compute overlapping travel segments.
+    A map of the routes is only saved when `plot` is True.
 
     Returns:
     - result_dict (dict): Metrics including distances, times, and overlaps
@@ -917,37 +1581,14 @@ def process_row_only_overlap(row_api_and_flag, method, skip_invalid=True, input_
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
 
-        # Split and convert to float
-        origin_a_lat, origin_a_lon = map(float, map(str.strip, origin_a.split(",")))
-        destination_a_lat, destination_a_lon = map(float, map(str.strip, destination_a.split(",")))
-        origin_b_lat, origin_b_lon = map(float, map(str.strip, origin_b.split(",")))
-        destination_b_lat, destination_b_lon = map(float, map(str.strip, destination_b.split(",")))
+        endpoints = endpoint_fields(row)
 
-        if origin_a == origin_b and destination_a == destination_b:
+        if same_point(origin_a, origin_b) and same_point(destination_a, destination_b):
             api_calls += 1
             coordinates_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info)
-            plot_routes(coordinates_a, [], (), (), ID, input_dir)
-            return (
-                SimpleOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=a_dist,
-                    bTime=a_time,
-                    overlapDist=a_dist,
-                    overlapTime=a_time,
-                ).model_dump(),
-                api_calls,
-                0
-            )
+            if plot:
+                plot_routes(coordinates_a, [], (), (), ID, input_dir)
+            return same_route_result(SimpleOverlapResult, endpoints, a_dist, a_time), api_calls, 0
 
         api_calls += 1
         coordinates_a, total_distance_a, total_time_a = get_route_data(origin_a, destination_a, method, api_key, save_api_info)
@@ -957,25 +1598,17 @@ def process_row_only_overlap(row_api_and_flag, method, skip_invalid=True, input_
         first_common_node, last_common_node = find_common_nodes(coordinates_a, coordinates_b)
 
         if not first_common_node or not last_common_node:
-            plot_routes(coordinates_a, coordinates_b, (), (), ID, input_dir)
+            if plot:
+                plot_routes(coordinates_a, coordinates_b, (), (), ID, input_dir)
             return (
-                SimpleOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
+                no_overlap_result(
+                    SimpleOverlapResult,
+                    endpoints,
                     aDist=total_distance_a,
                     aTime=total_time_a,
                     bDist=total_distance_b,
                     bTime=total_time_b,
-                    overlapDist=0.0,
-                    overlapTime=0.0,
-                ).model_dump(),
+                ),
                 api_calls,
                 0
             )
@@ -992,30 +1625,24 @@ def process_row_only_overlap(row_api_and_flag, method, skip_invalid=True, input_
             api_key,
             save_api_info
         )
-        logging.info(f"API call for overlap_a took {time.time() - start_time:.2f} seconds")
+        timing_log.debug("API call for overlap_a took %.2f seconds", time.time() - start_time)
 
         overlap_b_distance, overlap_b_time = overlap_a_distance, overlap_a_time
 
-        plot_routes(coordinates_a, coordinates_b, first_common_node, last_common_node, ID, input_dir)
+        if plot:
+            plot_routes(coordinates_a, coordinates_b, first_common_node, last_common_node, ID, input_dir)
 
         return (
-            SimpleOverlapResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                SimpleOverlapResult,
+                **endpoints,
                 aDist=total_distance_a,
                 aTime=total_time_a,
                 bDist=total_distance_b,
                 bTime=total_time_b,
                 overlapDist=overlap_a_distance,
                 overlapTime=overlap_a_time,
-            ).model_dump(),
+            ),
             api_calls,
             0
         )
@@ -1023,33 +1650,7 @@ def process_row_only_overlap(row_api_and_flag, method, skip_invalid=True, input_
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error processing row {row}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-
-            return (
-                SimpleOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    overlapDist=None,
-                    overlapTime=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return error_result(SimpleOverlapResult, row, api_calls)
         else:
             raise
 
@@ -1069,35 +1670,31 @@ def process_routes_only_overlap_with_csv(
     method: str = "google",
     output_csv: str = "output.csv",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    plot: bool = False
 ) -> tuple:
     """
     Processes all route pairs in a CSV to compute overlaps only.
+    Each row is written to output_csv as soon as it is processed, and route maps are only
+    saved when `plot` is True.
 
     Returns:
-    - results (list): List of processed route dictionaries
+    - results (list): Empty; the rows are streamed to output_csv
     - pre_api_error_count (int): Number of invalid rows skipped before API calls
-    - api_call_count (int): Total number of API calls made
+    - api_call_count (int): Number of route requests sent to the routing service
     - post_api_error_count (int): Number of errors encountered during processing
     """
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
+    pre_api_error_count = 0
 
-    results, api_call_count, post_api_error_count = process_rows(
-        data, api_key, process_row_only_overlap, method, input_dir, skip_invalid=skip_invalid, save_api_info=save_api_info
-    )
+    def mapped_rows():
+        # Rows are handed to the workers while the CSV file is still being read
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
 
     fieldnames = [
         "ID", "OriginAlat", "OriginAlong", "DestinationAlat", "DestinationAlong", 
@@ -1105,7 +1702,13 @@ def process_routes_only_overlap_with_csv(
         "aDist", "aTime", "bDist", "bTime",
         "overlapDist", "overlapTime",
     ]
-    write_csv_file(input_dir, results, fieldnames, output_csv)
+
+    # Rows are written as they complete rather than collected and written at the end
+    with CsvResultWriter(input_dir, fieldnames, output_csv) as writer:
+        results, api_call_count, post_api_error_count = process_rows(
+            mapped_rows(), api_key, process_row_only_overlap, method, input_dir, skip_invalid=skip_invalid,
+            save_api_info=save_api_info, output_writer=writer, plot=plot
+        )
 
     return results, pre_api_error_count, api_call_count, post_api_error_count
 
@@ -1140,42 +1743,60 @@ def process_rows_multiproc(
     processes=None,
     extra_args=(),
     skip_invalid=True,
-    save_api_info=False
+    save_api_info=False,
+    method=None,
+    output_writer=None,
+    reuse_results=True
 ):
     """
-    Processes rows using multithreading and aggregates API call/error counts.
+    Processes rows on a thread pool and aggregates API call/error counts.
+
+    data may be any iterable of rows, including a generator reading the input CSV file;
+    rows are only taken from it one window at a time.
+
+    Rows mostly wait on the routing API, so the pool defaults to ROW_WORKERS threads rather
+    than the CPU count; processes overrides it.
+
+    If method is given, the distinct A/B routes of each window of PREFETCH_WINDOW rows are
+    requested once, up front, so the row functions read them from the route cache. Rows with the
+    same origins and destinations as an earlier row are not processed again but take its result,
+    unless reuse_results is False (e.g. when row_function saves a map for every row).
+
+    If output_writer (a CsvResultWriter) is given, each result is written to it as soon as it is
+    available instead of being collected, so memory use does not grow with the number of rows.
 
     Returns:
-    - results (list): List of processed result dicts
-    - api_call_count (int): Total number of API calls across all rows
+    - results (list): List of processed result dicts; empty when output_writer is given
+    - api_call_count (int): Number of route requests sent to the routing service while processing
+      the rows, see route_requests_sent; lookups answered from a cache are not counted
     - api_error_count (int): Total number of API errors across all rows
     """
-    args = [
-        (row, api_key, row_function, skip_invalid, save_api_info, *extra_args)
-        for row in data
-    ]
-
     processed_rows = []
-    api_call_count = 0
+    requests_before = route_requests_sent
     api_error_count = 0
     processed_count = 0
+    def run(row):
+        return wrap_row_multiproc((row, api_key, row_function, skip_invalid, save_api_info, *extra_args))
+
+    def submit(row):
+        return pool.submit(run, row)
 
     try:
-        with Pool(processes=processes) as pool:
-            for result in pool.imap_unordered(wrap_row_multiproc, args):
-                if result is None:
-                    continue
-                row_result, row_api_calls, row_api_errors = result
-                processed_rows.append(row_result)
-                api_call_count += row_api_calls
-                api_error_count += row_api_errors
-                processed_count += 1
-                print(f"[INFO] Processed {processed_count} row(s)...")
+        with ThreadPoolExecutor(max_workers=processes or ROW_WORKERS, thread_name_prefix="row") as pool:
+            with closing(iter_row_results(data, submit, method, api_key, save_api_info, run, reuse_results)) as results:
+                for row_result, _, row_api_errors in results:
+                    if output_writer is not None:
+                        output_writer.write_row(row_result)
+                    else:
+                        processed_rows.append(row_result)
+                    api_error_count += row_api_errors
+                    processed_count += 1
+                    print(f"[INFO] Processed {processed_count} row(s)...")
 
     except KeyboardInterrupt:
         print("\n[INTERRUPTED] Keyboard interrupt received. Returning partial results...")
 
-    return processed_rows, api_call_count, api_error_count
+    return processed_rows, route_requests_sent - requests_before, api_error_count
 
 def process_row_overlap_rec_multiproc(
     row: Dict[str, str],
@@ -1184,6 +1805,8 @@ def process_row_overlap_rec_multiproc(
     threshold: int,
     method: str,
     input_dir: str,
+    estimate_segments: bool,
+    plot: bool,
     skip_invalid: bool,
     save_api_info: bool
 ) -> Tuple[Dict[str, Any], int, int]:
@@ -1202,6 +1825,9 @@ def process_row_overlap_rec_multiproc(
             - api_key (str): Google Maps API key
             - width (int): Width for rectangular overlap
             - threshold (int): Overlap filtering threshold
+            - estimate_segments (bool): If True, only the overlap is requested; the before/after
+              distances and times are estimated from the remainder of each route
+            - plot (bool): Whether to save a map of the two routes
             - skip_invalid (bool): Whether to log and skip or raise on errors
             - save_api_info (bool): Whether to save the API response
 
@@ -1217,87 +1843,38 @@ def process_row_overlap_rec_multiproc(
         ID = row["ID"]
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
-        origin_a_lat, origin_a_lon = map(float, map(str.strip, origin_a.split(",")))
-        destination_a_lat, destination_a_lon = map(float, map(str.strip, destination_a.split(",")))
-        origin_b_lat, origin_b_lon = map(float, map(str.strip, origin_b.split(",")))
-        destination_b_lat, destination_b_lon = map(float, map(str.strip, destination_b.split(",")))
+        endpoints = endpoint_fields(row)
 
-        if origin_a == origin_b and destination_a == destination_b:
+        if same_point(origin_a, origin_b) and same_point(destination_a, destination_b):
             api_calls += 1
             start_time = time.time()
             coordinates_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info)
-            logging.info(f"Time for same-route API call: {time.time() - start_time:.2f} seconds")
-            plot_routes(coordinates_a, [], (), (), ID, input_dir)
-            return (
-                FullOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=a_dist,
-                    bTime=a_time,
-                    overlapDist=a_dist,
-                    overlapTime=a_time,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0,
-                ).model_dump(),
-                api_calls,
-                0
-            )
-
-        api_calls += 1
-        start_time = time.time()
-        coordinates_a, total_distance_a, total_time_a = get_route_data(origin_a, destination_a, method, api_key, save_api_info)
-        logging.info(f"Time for coordinates_a API call: {time.time() - start_time:.2f} seconds")
+            timing_log.debug("Time for same-route API call: %.2f seconds", time.time() - start_time)
+            if plot:
+                plot_routes(coordinates_a, [], (), (), ID, input_dir)
+            return same_route_result(FullOverlapResult, endpoints, a_dist, a_time), api_calls, 0
 
-        api_calls += 1
-        start_time = time.time()
-        coordinates_b, total_distance_b, total_time_b = get_route_data(origin_b, destination_b, method, api_key, save_api_info)
-        logging.info(f"Time for coordinates_b API call: {time.time() - start_time:.2f} seconds")
+        # Routes A and B are independent, so they are requested together
+        api_calls += 2
+        (
+            (coordinates_a, total_distance_a, total_time_a),
+            (coordinates_b, total_distance_b, total_time_b),
+        ) = get_routes_concurrently([(origin_a, destination_a), (origin_b, destination_b)], method, api_key, save_api_info)
 
         first_common_node, last_common_node = find_common_nodes(coordinates_a, coordinates_b)
 
         if not first_common_node or not last_common_node:
-            plot_routes(coordinates_a, coordinates_b, (), (), ID, input_dir)
+            if plot:
+                plot_routes(coordinates_a, coordinates_b, (), (), ID, input_dir)
             return (
-                FullOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
+                no_overlap_result(
+                    FullOverlapResult,
+                    endpoints,
                     aDist=total_distance_a,
                     aTime=total_time_a,
                     bDist=total_distance_b,
                     bTime=total_time_b,
-                    overlapDist=0.0,
-                    overlapTime=0.0,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0,
-                ).model_dump(),
+                ),
                 api_calls,
                 0
             )
@@ -1335,74 +1912,54 @@ def process_row_overlap_rec_multiproc(
                 },
             }
 
-        api_calls += 1
-        start_time = time.time()
-        _, before_a_dist, before_a_time = get_route_data(
-            origin_a,
-            f"{boundary_nodes['first_node_before_overlap']['node_a'][0]},{boundary_nodes['first_node_before_overlap']['node_a'][1]}",
-            method,
-            api_key,
-            save_api_info
-        )
-        logging.info(f"Time for before_a API call: {time.time() - start_time:.2f} seconds")
-
-        api_calls += 1
-        start_time = time.time()
-        _, overlap_a_dist, overlap_a_time = get_route_data(
-            f"{boundary_nodes['first_node_before_overlap']['node_a'][0]},{boundary_nodes['first_node_before_overlap']['node_a'][1]}",
-            f"{boundary_nodes['last_node_after_overlap']['node_a'][0]},{boundary_nodes['last_node_after_overlap']['node_a'][1]}",
-            method,
-            api_key,
-            save_api_info
-        )
-        logging.info(f"Time for overlap_a API call: {time.time() - start_time:.2f} seconds")
-
-        api_calls += 1
-        start_time = time.time()
-        _, after_a_dist, after_a_time = get_route_data(
-            f"{boundary_nodes['last_node_after_overlap']['node_a'][0]},{boundary_nodes['last_node_after_overlap']['node_a'][1]}",
-            destination_a,
-            method,
-            api_key,
-            save_api_info
-        )
-        logging.info(f"Time for after_a API call: {time.time() - start_time:.2f} seconds")
+        # Each boundary node is formatted once for all the requests that start or end at it
+        node_a_first = format_coordinate(boundary_nodes["first_node_before_overlap"]["node_a"])
+        node_b_first = format_coordinate(boundary_nodes["first_node_before_overlap"]["node_b"])
+        node_a_last = format_coordinate(boundary_nodes["last_node_after_overlap"]["node_a"])
+        node_b_last = format_coordinate(boundary_nodes["last_node_after_overlap"]["node_b"])
 
-        api_calls += 1
-        start_time = time.time()
-        _, before_b_dist, before_b_time = get_route_data(
-            origin_b,
-            f"{boundary_nodes['first_node_before_overlap']['node_b'][0]},{boundary_nodes['first_node_before_overlap']['node_b'][1]}",
-            method,
-            api_key,
-            save_api_info
-        )
-        logging.info(f"Time for before_b API call: {time.time() - start_time:.2f} seconds")
-
-        api_calls += 1
-        start_time = time.time()
-        _, after_b_dist, after_b_time = get_route_data(
-            f"{boundary_nodes['last_node_after_overlap']['node_b'][0]},{boundary_nodes['last_node_after_overlap']['node_b'][1]}",
-            destination_b,
-            method,
-            api_key,
-            save_api_info
-        )
-        logging.info(f"Time for after_b API call: {time.time() - start_time:.2f} seconds")
-
-        plot_routes(coordinates_a, coordinates_b, first_common_node, last_common_node, ID, input_dir)
+        if estimate_segments:
+            # Only the overlap is requested. What remains of each route is split between its before
+            # and after parts in proportion to their polyline lengths.
+            api_calls += 1
+            _, overlap_a_dist, overlap_a_time = get_route_data(
+                node_a_first, node_a_last, method, api_key, save_api_info
+            )
+            share_a = before_overlap_share(a_segment_distances)
+            share_b = before_overlap_share(b_segment_distances)
+            rest_a_dist = max(total_distance_a - overlap_a_dist, 0.0)
+            rest_a_time = max(total_time_a - overlap_a_time, 0.0)
+            rest_b_dist = max(total_distance_b - overlap_a_dist, 0.0)
+            rest_b_time = max(total_time_b - overlap_a_time, 0.0)
+            before_a_dist, after_a_dist = rest_a_dist * share_a, rest_a_dist * (1 - share_a)
+            before_a_time, after_a_time = rest_a_time * share_a, rest_a_time * (1 - share_a)
+            before_b_dist, after_b_dist = rest_b_dist * share_b, rest_b_dist * (1 - share_b)
+            before_b_time, after_b_time = rest_b_time * share_b, rest_b_time * (1 - share_b)
+        else:
+            # The five segment routes are independent of each other, so they are requested together
+            segment_pairs = [
+                (origin_a, node_a_first),
+                (node_a_first, node_a_last),
+                (node_a_last, destination_a),
+                (origin_b, node_b_first),
+                (node_b_last, destination_b),
+            ]
+            api_calls += len(segment_pairs)
+            (
+                (_, before_a_dist, before_a_time),
+                (_, overlap_a_dist, overlap_a_time),
+                (_, after_a_dist, after_a_time),
+                (_, before_b_dist, before_b_time),
+                (_, after_b_dist, after_b_time),
+            ) = get_routes_concurrently(segment_pairs, method, api_key, save_api_info)
+
+        if plot:
+            plot_routes(coordinates_a, coordinates_b, first_common_node, last_common_node, ID, input_dir)
 
         return (
-            FullOverlapResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                FullOverlapResult,
+                **endpoints,
                 aDist=total_distance_a,
                 aTime=total_time_a,
                 bDist=total_distance_b,
@@ -1417,7 +1974,7 @@ def process_row_overlap_rec_multiproc(
                 aAfterTime=after_a_time,
                 bAfterDist=after_b_dist,
                 bAfterTime=after_b_time,
-            ).model_dump(),
+            ),
         api_calls,
         0
     )
@@ -1425,41 +1982,7 @@ def process_row_overlap_rec_multiproc(
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error in process_row_overlap_rec_multiproc for row {row}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-
-            return (
-                FullOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    overlapDist=None,
-                    overlapTime=None,
-                    aBeforeDist=None,
-                    aBeforeTime=None,
-                    bBeforeDist=None,
-                    bBeforeTime=None,
-                    aAfterDist=None,
-                    aAfterTime=None,
-                    bAfterDist=None,
-                    bAfterTime=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return error_result(FullOverlapResult, row, api_calls)
 
         else:
             raise
@@ -1482,7 +2005,9 @@ def overlap_rec(
     width: int = 100,
     method: str = "google",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    estimate_segments: bool = False,
+    plot: bool = False
 ) -> tuple:
     """
     Processes routes using the rectangular overlap method with a defined threshold and width.
@@ -1506,45 +2031,44 @@ def overlap_rec(
     - method (str): Routing method to use, either "google" or "graphhopper".
     - skip_invalid (bool): If True, skips invalid rows and logs them.
     - save_api_info (bool): If True, save API response.
+    - estimate_segments (bool): If True, the before/after segments are not requested but estimated by
+      splitting what remains of each route outside the overlap in proportion to the polyline lengths
+      of its before and after parts. This needs 3 instead of 7 API calls per overlapping pair.
+    - plot (bool): If True, a map of each route pair is saved to the results folder (default: False).
 
     Returns:
     - tuple: (
-        results (list): Processed results with travel and overlap metrics,
+        results (list): Empty; the rows are streamed to output_csv,
         pre_api_error_count (int),
         api_call_count (int),
         post_api_error_count (int)
       )
     """
-    # Step 1: Read input CSV
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
+    pre_api_error_count = 0
 
-    # Step 2: Process with multiproc + interruption support
-    processed_rows, api_call_count, post_api_error_count = process_rows_multiproc(
-        data,
-        api_key,
-        row_function=process_row_overlap_rec_multiproc,  # Pass your actual processor here
-        extra_args=(width, threshold, method, input_dir),
-        skip_invalid=skip_invalid,
-        save_api_info=save_api_info
-    )
+    # Step 1: Read input CSV; rows are handed to the workers while the file is still being read
+    def mapped_rows():
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
 
-    # Step 3: Write if anything was processed
-    if processed_rows:
-        fieldnames = list(processed_rows[0].keys())
-        write_csv_file(input_dir, processed_rows, fieldnames, output_csv)
+    # Step 2: Process with multiproc + interruption support, writing each row as it completes
+    with CsvResultWriter(input_dir, FullOverlapResult.model_fields, output_csv) as writer:
+        processed_rows, api_call_count, post_api_error_count = process_rows_multiproc(
+            mapped_rows(),
+            api_key,
+            row_function=process_row_overlap_rec_multiproc,  # Pass your actual processor here
+            extra_args=(width, threshold, method, input_dir, estimate_segments, plot),
+            skip_invalid=skip_invalid,
+            save_api_info=save_api_info,
+            method=method,
+            output_writer=writer,
+            reuse_results=not plot
+        )
 
     return processed_rows, pre_api_error_count, api_call_count, post_api_error_count
 
@@ -1555,6 +2079,7 @@ def process_row_only_overlap_rec(
     threshold: float,
     method: str,
     input_dir: str,
+    plot: bool,
     skip_invalid: bool,
     save_api_info: bool
 ):
@@ -1570,6 +2095,7 @@ def process_row_only_overlap_rec(
             - threshold (int): Distance threshold for overlap detection
             - method (str): Routing method to use (e.g., "driving", "walking")
             - input_dir (str): Directory for saving output files
+            - plot (bool): Whether to save a map of the two routes
             - skip_invalid (bool): Whether to skip errors or halt on first error
             - save_api_info (bool): Whether to save the Google API response
 
@@ -1584,72 +2110,53 @@ def process_row_only_overlap_rec(
         ID = row["ID"]
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
-        origin_a_lat, origin_a_lon = map(float, map(str.strip, origin_a.split(",")))
-        destination_a_lat, destination_a_lon = map(float, map(str.strip, destination_a.split(",")))
-        origin_b_lat, origin_b_lon = map(float, map(str.strip, origin_b.split(",")))
-        destination_b_lat, destination_b_lon = map(float, map(str.strip, destination_b.split(",")))
+        endpoints = endpoint_fields(row)
 
+        # Routes from a point to itself need no request and have no overlap
+        if same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
+            return no_overlap_result(SimpleOverlapResult, endpoints), api_calls, 0
+        if same_point(origin_a, destination_a):
+            api_calls += 1
+            coordinates_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
+            return no_overlap_result(SimpleOverlapResult, endpoints, bDist=b_dist, bTime=b_time), api_calls, 0
+        if same_point(origin_b, destination_b):
+            api_calls += 1
+            coordinates_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
+            return no_overlap_result(SimpleOverlapResult, endpoints, aDist=a_dist, aTime=a_time), api_calls, 0
 
-        if origin_a == origin_b and destination_a == destination_b:
+        if same_point(origin_a, origin_b) and same_point(destination_a, destination_b):
             api_calls += 1
             start_time = time.time()
             coordinates_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
-            logging.info(f"Time for same-route API call: {time.time() - start_time:.2f} seconds")
-            plot_routes(coordinates_a, [], (), (), ID, input_dir)
-            return (
-                SimpleOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=a_dist,
-                    bTime=a_time,
-                    overlapDist=a_dist,
-                    overlapTime=a_time,
-                ).model_dump(),
-                api_calls,
-                0
-            )
+            timing_log.debug("Time for same-route API call: %.2f seconds", time.time() - start_time)
+            if plot:
+                plot_routes(coordinates_a, [], (), (), ID, input_dir)
+            return same_route_result(SimpleOverlapResult, endpoints, a_dist, a_time), api_calls, 0
 
         api_calls += 1
         start_time = time.time()
         coordinates_a, total_distance_a, total_time_a = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
-        logging.info(f"Time for coordinates_a API call: {time.time() - start_time:.2f} seconds")
+        timing_log.debug("Time for coordinates_a API call: %.2f seconds", time.time() - start_time)
 
         api_calls += 1
         start_time = time.time()
         coordinates_b, total_distance_b, total_time_b = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
-        logging.info(f"Time for coordinates_b API call: {time.time() - start_time:.2f} seconds")
+        timing_log.debug("Time for coordinates_b API call: %.2f seconds", time.time() - start_time)
 
         first_common_node, last_common_node = find_common_nodes(coordinates_a, coordinates_b)
 
         if not first_common_node or not last_common_node:
-            plot_routes(coordinates_a, coordinates_b, None, None, ID, input_dir)
+            if plot:
+                plot_routes(coordinates_a, coordinates_b, None, None, ID, input_dir)
             return (
-                SimpleOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
+                no_overlap_result(
+                    SimpleOverlapResult,
+                    endpoints,
                     aDist=total_distance_a,
                     aTime=total_time_a,
                     bDist=total_distance_b,
                     bTime=total_time_b,
-                    overlapDist=0.0,
-                    overlapTime=0.0,
-                ).model_dump(),
+                ),
                 api_calls,
                 0
             )
@@ -1686,48 +2193,45 @@ def process_row_only_overlap_rec(
                 },
             }
 
+        first_overlap_node = boundary_nodes["first_node_before_overlap"]
+        last_overlap_node = boundary_nodes["last_node_after_overlap"]
+
         api_calls += 1
         start_time = time.time()
         _, overlap_a_dist, overlap_a_time = get_route_data(
-            f"{boundary_nodes['first_node_before_overlap']['node_a'][0]},{boundary_nodes['first_node_before_overlap']['node_a'][1]}",
-            f"{boundary_nodes['last_node_after_overlap']['node_a'][0]},{boundary_nodes['last_node_after_overlap']['node_a'][1]}",
+            format_coordinate(first_overlap_node["node_a"]),
+            format_coordinate(last_overlap_node["node_a"]),
             method,
             api_key,
             save_api_info=save_api_info
         )
-        logging.info(f"Time for overlap_a API call: {time.time() - start_time:.2f} seconds")
+        timing_log.debug("Time for overlap_a API call: %.2f seconds", time.time() - start_time)
 
         api_calls += 1
         start_time = time.time()
         _, overlap_b_dist, overlap_b_time = get_route_data(
-            f"{boundary_nodes['first_node_before_overlap']['node_b'][0]},{boundary_nodes['first_node_before_overlap']['node_b'][1]}",
-            f"{boundary_nodes['last_node_after_overlap']['node_b'][0]},{boundary_nodes['last_node_after_overlap']['node_b'][1]}",
+            format_coordinate(first_overlap_node["node_b"]),
+            format_coordinate(last_overlap_node["node_b"]),
             method,
             api_key,
             save_api_info=save_api_info
         )
-        logging.info(f"Time for overlap_b API call: {time.time() - start_time:.2f} seconds")
+        timing_log.debug("Time for overlap_b API call: %.2f seconds", time.time() - start_time)
 
-        plot_routes(coordinates_a, coordinates_b, first_common_node, last_common_node, ID, input_dir)
+        if plot:
+            plot_routes(coordinates_a, coordinates_b, first_common_node, last_common_node, ID, input_dir)
 
         return (
-            SimpleOverlapResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                SimpleOverlapResult,
+                **endpoints,
                 aDist=total_distance_a,
                 aTime=total_time_a,
                 bDist=total_distance_b,
                 bTime=total_time_b,
                 overlapDist=overlap_a_dist,
                 overlapTime=overlap_a_time,
-            ).model_dump(),
+            ),
             api_calls,
             0
         )
@@ -1735,33 +2239,7 @@ def process_row_only_overlap_rec(
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error processing row {row}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-
-            return (
-                SimpleOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    overlapDist=None,
-                    overlapTime=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return error_result(SimpleOverlapResult, row, api_calls)
 
         else:
             raise
@@ -1784,7 +2262,8 @@ def only_overlap_rec(
     width: float = 100,
     method: str = "google",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    plot: bool = False
 ) -> tuple:
     """
     Processes routes to compute only the overlapping rectangular segments based on a threshold and width.
@@ -1808,45 +2287,41 @@ def only_overlap_rec(
     - method (str): Routing method to use ("google" or "graphhopper").
     - skip_invalid (bool): If True, skips rows with invalid input and logs them.
     - save_api_info (bool): If True, saves API response.
+    - plot (bool): If True, a map of each route pair is saved to the results folder (default: False).
 
     Returns:
     - tuple: (
-        results (list): Processed results with overlap metrics only,
+        results (list): Empty; the rows are streamed to output_csv,
         pre_api_error_count (int),
         api_call_count (int),
-        post_api_error_count (int)
-      )
-    """
-    # Step 1: Read input CSV
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
-
-    # Step 2: Process rows with keyboard interrupt support
-    processed_rows, api_call_count, post_api_error_count = process_rows_multiproc(
-        data=data,
-        api_key=api_key,
-        row_function=process_row_only_overlap_rec,
-        extra_args=(width, threshold, method, input_dir),
-        skip_invalid=skip_invalid,
-        save_api_info=save_api_info
-    )
+        post_api_error_count (int)
+      )
+    """
+    pre_api_error_count = 0
 
-    # Step 3: Write results if any were processed
-    if processed_rows:
-        fieldnames = list(processed_rows[0].keys())
-        write_csv_file(input_dir, processed_rows, fieldnames, output_csv)
+    # Step 1: Read input CSV; rows are handed to the workers while the file is still being read
+    def mapped_rows():
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
+
+    # Step 2: Process rows with keyboard interrupt support, writing each row as it completes
+    with CsvResultWriter(input_dir, SimpleOverlapResult.model_fields, output_csv) as writer:
+        processed_rows, api_call_count, post_api_error_count = process_rows_multiproc(
+            data=mapped_rows(),
+            api_key=api_key,
+            row_function=process_row_only_overlap_rec,
+            extra_args=(width, threshold, method, input_dir, plot),
+            skip_invalid=skip_invalid,
+            save_api_info=save_api_info,
+            method=method,
+            output_writer=writer,
+            reuse_results=not plot
+        )
 
     return processed_rows, pre_api_error_count, api_call_count, post_api_error_count
 
@@ -1856,11 +2331,10 @@ def process_row_route_buffers(row_and_args):
 
     This function:
     - Retrieves route data for two routes (A and B).
-    - Creates buffered polygons around each route using a specified buffer distance.
-    - Computes the intersection area between the buffers.
-    - Calculates and returns the intersection ratios for both routes.
+    - Returns the routes so that their buffers and intersection ratios can be computed for
+      a whole batch of rows at once by `process_routes_with_buffers`.
     - Handles trivial routes where origin equals destination.
-    - Plots the routes and their buffers.
+    - Plots the routes and their buffers when `plot` is True.
     - Optionally logs and skips invalid rows based on `skip_invalid`.
 
     Args:
@@ -1872,98 +2346,73 @@ def process_row_route_buffers(row_and_args):
             - save_api_info (bool): Whether to save the Google API response
             - input_dir (str): Directory where input files are located
             - method (str): Routing method to use (e.g., "driving", "walking")
-        
+            - plot (bool): Whether to save a map of the routes and their buffers
+
 
     Returns:
         tuple:
             - dict: Metrics for the route pair
             - int: Number of API calls made
             - int: 1 if skipped due to error, else 0
+            - tuple or None: (route_a_coords, route_b_coords) when the intersection ratios still
+              have to be computed, None when the result is already final
     """
-    row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method = row_and_args
+    row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method, plot = row_and_args
     api_calls = 0
 
     try:
         ID = row["ID"]
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
-        # Split and convert to float
-        origin_a_lat, origin_a_lon = map(float, map(str.strip, origin_a.split(",")))
-        destination_a_lat, destination_a_lon = map(float, map(str.strip, destination_a.split(",")))
-        origin_b_lat, origin_b_lon = map(float, map(str.strip, origin_b.split(",")))
-        destination_b_lat, destination_b_lon = map(float, map(str.strip, destination_b.split(",")))
+        endpoints = endpoint_fields(row)
 
-        if origin_a == destination_a and origin_b == destination_b:
+        if same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
             return (
-                IntersectionRatioResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0,
-                    aTime=0,
-                    bDist=0,
-                    bTime=0,
-                    aIntersecRatio=0.0,
-                    bIntersecRatio=0.0,
-                ).model_dump(),
+                no_overlap_result(
+                    IntersectionRatioResult,
+                    endpoints,
+                    aDist=0.0,
+                    aTime=0.0,
+                    bDist=0.0,
+                    bTime=0.0,
+                ),
                 api_calls,
-                0
+                0,
+                None
             )
 
-        if origin_a == destination_a and origin_b != destination_b:
+        if same_point(origin_a, destination_a) and not same_point(origin_b, destination_b):
             api_calls += 1
             route_b_coords, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
             return (
-                IntersectionRatioResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0,
-                    aTime=0,
+                no_overlap_result(
+                    IntersectionRatioResult,
+                    endpoints,
+                    aDist=0.0,
+                    aTime=0.0,
                     bDist=b_dist,
                     bTime=b_time,
-                    aIntersecRatio=0.0,
-                    bIntersecRatio=0.0,
-                ).model_dump(),
+                ),
                 api_calls,
-                0
+                0,
+                None
             )
 
-        if origin_a != destination_a and origin_b == destination_b:
+        if not same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
             api_calls += 1
             route_a_coords, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
             return (
-                IntersectionRatioResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
+                no_overlap_result(
+                    IntersectionRatioResult,
+                    endpoints,
                     aDist=a_dist,
                     aTime=a_time,
-                    bDist=0,
-                    bTime=0,
-                    aIntersecRatio=0.0,
-                    bIntersecRatio=0.0,
-                ).model_dump(),
+                    bDist=0.0,
+                    bTime=0.0,
+                ),
                 api_calls,
-                0
+                0,
+                None
             )
 
         api_calls += 1
@@ -1972,122 +2421,71 @@ def process_row_route_buffers(row_and_args):
         api_calls += 1
         route_b_coords, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
 
-        if origin_a == origin_b and destination_a == destination_b:
-            buffer_a = create_buffered_route(route_a_coords, buffer_distance)
-            buffer_b = buffer_a
-            plot_routes_and_buffers(route_a_coords, route_b_coords, buffer_a, buffer_b, ID, input_dir)
+        if same_point(origin_a, origin_b) and same_point(destination_a, destination_b):
+            # The ratios are 1 by definition, so the buffer is only needed for the map
+            if plot:
+                buffer_a = create_buffered_route(route_a_coords, buffer_distance)
+                plot_routes_and_buffers(route_a_coords, route_b_coords, buffer_a, buffer_a, ID, input_dir)
             return (
-                IntersectionRatioResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
+                build_result_row(
+                    IntersectionRatioResult,
+                    **endpoints,
                     aDist=a_dist,
                     aTime=a_time,
                     bDist=a_dist,
                     bTime=a_time,
                     aIntersecRatio=1.0,
                     bIntersecRatio=1.0,
-                ).model_dump(),
+                ),
                 api_calls,
-                0
+                0,
+                None
             )
 
-        buffer_a = create_buffered_route(route_a_coords, buffer_distance)
-        buffer_b = create_buffered_route(route_b_coords, buffer_distance)
-
-        start_time = time.time()
-        intersection = buffer_a.intersection(buffer_b)
-        logging.info(f"Time to compute buffer intersection of A and B: {time.time() - start_time:.6f} seconds")
-
-        plot_routes_and_buffers(route_a_coords, route_b_coords, buffer_a, buffer_b, ID, input_dir)
-
-        if intersection.is_empty:
+        # Routes too far apart for their buffers to meet get ratios of 0.0 without being buffered
+        if not plot and route_buffers_disjoint(route_a_coords, route_b_coords, buffer_distance):
             return (
-                IntersectionRatioResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
+                build_result_row(
+                    IntersectionRatioResult,
+                    **endpoints,
                     aDist=a_dist,
                     aTime=a_time,
                     bDist=b_dist,
                     bTime=b_time,
                     aIntersecRatio=0.0,
                     bIntersecRatio=0.0,
-                ).model_dump(),
+                ),
                 api_calls,
-                0
+                0,
+                None
             )
 
-        intersection_area = intersection.area
-        a_area = buffer_a.area
-        b_area = buffer_b.area
-        a_intersec_ratio = intersection_area / a_area
-        b_intersec_ratio = intersection_area / b_area
+        if len(route_a_coords) < 2 or len(route_b_coords) < 2:
+            raise ValueError("Route is too short to be buffered.")
+
+        if plot:
+            buffer_a, buffer_b = create_buffered_routes([route_a_coords, route_b_coords], buffer_distance)
+            plot_routes_and_buffers(route_a_coords, route_b_coords, buffer_a, buffer_b, ID, input_dir)
 
+        # The buffers and intersection ratios are computed for the whole batch by process_routes_with_buffers
         return (
-            IntersectionRatioResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                IntersectionRatioResult,
+                **endpoints,
                 aDist=a_dist,
                 aTime=a_time,
                 bDist=b_dist,
                 bTime=b_time,
-                aIntersecRatio=a_intersec_ratio,
-                bIntersecRatio=b_intersec_ratio,
-            ).model_dump(),
+            ),
             api_calls,
-            0
+            0,
+            (route_a_coords, route_b_coords)
         )
 
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error processing row {row}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-
-            return (
-                IntersectionRatioResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    aIntersecRatio=None,
-                    bIntersecRatio=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return (*error_result(IntersectionRatioResult, row, api_calls), None)
 
         else:
             raise
@@ -2109,7 +2507,8 @@ def process_routes_with_buffers(
     buffer_distance: float = 100,
     method: str = "google",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    plot: bool = False
 ) -> tuple:
     """
     Processes two routes from a CSV file to compute buffer intersection ratios.
@@ -2132,61 +2531,93 @@ def process_routes_with_buffers(
     - method (str): Routing method to use ("google" or "graphhopper).
     - skip_invalid (bool): If True, skips invalid rows and logs them instead of halting.
     - save_api_info (bool): If True, saves API response.
+    - plot (bool): If True, a map of each route pair and its buffers is saved to the results folder (default: False).
 
     Returns:
     - tuple: (
-        results (list of dicts),
+        results (list of dicts; empty, the rows are streamed to output_csv),
         pre_api_error_count (int),
         total_api_calls (int),
         post_api_error_count (int)
     )
     """
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
+    pre_api_error_count = 0
 
-    args = [(row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method) for row in data]
-    
-    results = []
-    total_api_calls = 0
+    def mapped_rows():
+        # Rows are handed to the workers while the CSV file is still being read
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
+
+    fieldnames = [
+        "ID", "OriginAlat", "OriginAlong", "DestinationAlat", "DestinationAlong", 
+        "OriginBlat", "OriginBlong", "DestinationBlat", "DestinationBlong",
+        "aDist", "aTime", "bDist", "bTime",
+        "aIntersecRatio", "bIntersecRatio",
+    ]
+
+    requests_before = route_requests_sent
     post_api_error_count = 0
     processed_count = 0
 
-    try:
-        with Pool() as pool:
-            for result in pool.imap_unordered(process_row_route_buffers, args):
-                if result is None:
-                    continue
-                result_dict, api_calls, api_errors = result
-                results.append(result_dict)
-                total_api_calls += api_calls
-                post_api_error_count += api_errors
-                processed_count += 1
-                print(f"[INFO] Processed {processed_count} row(s)...")
-    except KeyboardInterrupt:
-        print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
-
-    if results:
-        fieldnames = [
-            "ID", "OriginAlat", "OriginAlong", "DestinationAlat", "DestinationAlong", 
-            "OriginBlat", "OriginBlong", "DestinationBlat", "DestinationBlong",
-            "aDist", "aTime", "bDist", "bTime",
-            "aIntersecRatio", "bIntersecRatio",
-        ]
-        write_csv_file(input_dir, results, fieldnames, output_csv)
+    # Rows whose ratios are still missing, kept column-wise so they can be buffered and intersected together
+    pending_rows = []
+    routes_a = []
+    routes_b = []
 
-    return results, pre_api_error_count, total_api_calls, post_api_error_count
+    def write_pending_rows(writer):
+        # Buffer and intersect the batch in vectorized calls instead of GEOS calls per row; routes
+        # shared by several rows are buffered once
+        if not pending_rows:
+            return
+        buffers = create_buffered_routes(routes_a + routes_b, buffer_distance)
+        ratios_a, ratios_b = calculate_buffer_intersection_ratios(buffers[:len(routes_a)], buffers[len(routes_a):])
+        for result_dict, ratio_a, ratio_b in zip(pending_rows, ratios_a.tolist(), ratios_b.tolist()):
+            result_dict["aIntersecRatio"] = ratio_a
+            result_dict["bIntersecRatio"] = ratio_b
+        writer.write_rows(pending_rows)
+        pending_rows.clear()
+        routes_a.clear()
+        routes_b.clear()
+
+    # Rows are written in batches as they complete rather than collected and written at the end
+    with CsvResultWriter(input_dir, fieldnames, output_csv) as writer:
+        try:
+            with ThreadPoolExecutor(max_workers=ROW_WORKERS, thread_name_prefix="row") as pool:
+                def run(row):
+                    return process_row_route_buffers(
+                        (row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method, plot)
+                    )
+
+                def submit(row):
+                    return pool.submit(run, row)
+
+                with closing(iter_row_results(
+                    mapped_rows(), submit, method, api_key, save_api_info, run,
+                    reuse_results=not plot, finished_maxsize=FINISHED_ROUTE_RESULTS_MAXSIZE
+                )) as results:
+                    for result_dict, _, api_errors, routes in results:
+                        if routes is not None:
+                            routes_a.append(routes[0])
+                            routes_b.append(routes[1])
+                            pending_rows.append(result_dict)
+                            if len(pending_rows) >= PREFETCH_WINDOW:
+                                write_pending_rows(writer)
+                        else:
+                            writer.write_row(result_dict)
+                        post_api_error_count += api_errors
+                        processed_count += 1
+                        print(f"[INFO] Processed {processed_count} row(s)...")
+        except KeyboardInterrupt:
+            print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
+
+        write_pending_rows(writer)
+
+    return [], pre_api_error_count, route_requests_sent - requests_before, post_api_error_count
 
 def calculate_precise_travel_segments(
     route_coords: List[List[float]],
@@ -2198,83 +2629,98 @@ def calculate_precise_travel_segments(
     """
     Calculates travel distances and times for segments of a route before, during,
     and after overlaps using Google Maps Directions API.
+    The segment routes are independent, so they are requested at the same time.
     Returns a dictionary with travel segment details.
     All coordinates are in the format [latitude, longitude].
     """
+    return calculate_precise_travel_segments_batch(
+        [(route_coords, intersections)], method, api_key, save_api_info
+    )[0]
 
-    if len(intersections) < 2:
-        print(f"Only {len(intersections)} intersection(s) found, skipping during segment calculation.")
-        if len(intersections) == 1:
-            start = intersections[0]
-            before_data = get_route_data(
-                f"{route_coords[0][0]},{route_coords[0][1]}",
-                f"{start[0]},{start[1]}",
-                method,
-                api_key,
-                save_api_info=save_api_info
-            )
-            after_data = get_route_data(
-                f"{start[0]},{start[1]}",
-                f"{route_coords[-1][0]},{route_coords[-1][1]}",
-                method,
-                api_key,
-                save_api_info=save_api_info
-            )
-            return {
-                "before_distance": before_data[1],
-                "before_time": before_data[2],
-                "during_distance": 0.0,
-                "during_time": 0.0,
-                "after_distance": after_data[1],
-                "after_time": after_data[2],
-            }
-        else:
-            return {
-                "before_distance": 0.0,
-                "before_time": 0.0,
-                "during_distance": 0.0,
-                "during_time": 0.0,
-                "after_distance": 0.0,
-                "after_time": 0.0,
-            }
-
-    start = intersections[0]
-    end = intersections[-1]
+def empty_travel_segments() -> Dict[str, float]:
+    """
+    Returns the travel segments of a route that does not overlap: every distance and time is 0.0.
 
-    before_data = get_route_data(
-        f"{route_coords[0][0]},{route_coords[0][1]}",
-        f"{start[0]},{start[1]}",
-        method,
-        api_key,
-        save_api_info=save_api_info
-    )
-    during_data = get_route_data(
-        f"{start[0]},{start[1]}",
-        f"{end[0]},{end[1]}",
-        method,
-        api_key,
-        save_api_info=save_api_info
-    )
-    after_data = get_route_data(
-        f"{end[0]},{end[1]}",
-        f"{route_coords[-1][0]},{route_coords[-1][1]}",
-        method,
-        api_key,
-        save_api_info=save_api_info
+    Returns:
+    - dict: The before, during and after distances and times, all 0.0.
+    """
+    return dict.fromkeys(
+        ("before_distance", "before_time", "during_distance", "during_time", "after_distance", "after_time"),
+        0.0,
     )
 
-    print(f"Before segment: {before_data}")
-    print(f"During segment: {during_data}")
-    print(f"After segment: {after_data}")
+def calculate_precise_travel_segments_batch(
+    routes: List[Tuple[List[List[float]], Optional[List[List[float]]]]],
+    method: str,
+    api_key: str,
+    save_api_info: bool = False
+) -> List[Dict[str, float]]:
+    """
+    Calculates the travel segments of several routes (see calculate_precise_travel_segments),
+    with the segment routes of all of them requested at the same time, so that the two routes
+    of a row cost one round trip instead of two.
+
+    Parameters:
+    - routes (list): (route_coords, intersections) for each route. Intersections of None mean
+      that the route does not overlap; its segments are all 0.0 and nothing is requested for it.
+    - method (str): "google" or "graphhopper"
+    - api_key (str): Required for Google
+    - save_api_info (bool): Cache raw response
 
-    return {
-        "before_distance": before_data[1],
-        "before_time": before_data[2],
-        "during_distance": during_data[1],
-        "during_time": during_data[2],
-        "after_distance": after_data[1],
-        "after_time": after_data[2],
-    }
+    Returns:
+    - List[Dict[str, float]]: The travel segment details of each route, in the order of `routes`.
+    """
+    pairs = []
+    # Per route: (index of its first segment in pairs, number of segments), or None if no request
+    plans = []
+    for route_coords, intersections in routes:
+        if intersections is None:
+            plans.append(None)
+            continue
+
+        origin = f"{route_coords[0][0]},{route_coords[0][1]}"
+        destination = f"{route_coords[-1][0]},{route_coords[-1][1]}"
+        if len(intersections) < 2:
+            print(f"Only {len(intersections)} intersection(s) found, skipping during segment calculation.")
+            if not intersections:
+                plans.append(None)
+                continue
+            points = [origin, f"{intersections[0][0]},{intersections[0][1]}", destination]
+        else:
+            start = f"{intersections[0][0]},{intersections[0][1]}"
+            end = f"{intersections[-1][0]},{intersections[-1][1]}"
+            points = [origin, start, end, destination]
+        plans.append((len(pairs), len(points) - 1))
+        pairs.extend(zip(points, points[1:]))
+
+    segment_routes = get_routes_concurrently(pairs, method, api_key, save_api_info) if pairs else []
+
+    results = []
+    for plan in plans:
+        if plan is None:
+            results.append(empty_travel_segments())
+            continue
+
+        first, count = plan
+        if count == 2:
+            # A single intersection splits the route in two, with no during segment
+            before_data, after_data = segment_routes[first:first + count]
+            during_data = ([], 0.0, 0.0)
+        else:
+            before_data, during_data, after_data = segment_routes[first:first + count]
+            print(f"Before segment: {before_data}")
+            print(f"During segment: {during_data}")
+            print(f"After segment: {after_data}")
+
+        results.append({
+            "before_distance": before_data[1],
+            "before_time": before_data[2],
+            "during_distance": during_data[1],
+            "during_time": during_data[2],
+            "after_distance": after_data[1],
+            "after_time": after_data[2],
+        })
+    return results
 
 # The function calculates travel metrics and overlapping segments between two routes based on their closest nodes and shared buffer intersection.
 def process_row_closest_nodes(row_and_args):
@@ -2296,221 +2742,91 @@ def process_row_closest_nodes(row_and_args):
             - save_api_info (bool): Whether to save API response data (default: False).
             - input_dir (str): Directory for input files.
             - method (str): Routing method to use (e.g., "driving", "walking").
+            - plot (bool): Whether to save a map of the routes and their buffers.
 
     Returns:
         tuple: (result_dict, api_calls, api_errors)
     """
     api_calls = 0
     try:
-        row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method = row_and_args
+        row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method, plot = row_and_args
         ID = row["ID"]
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
-        # Split and convert to float
-        origin_a_lat, origin_a_lon = map(float, map(str.strip, origin_a.split(",")))
-        destination_a_lat, destination_a_lon = map(float, map(str.strip, destination_a.split(",")))
-        origin_b_lat, origin_b_lon = map(float, map(str.strip, origin_b.split(",")))
-        destination_b_lat, destination_b_lon = map(float, map(str.strip, destination_b.split(",")))
+        endpoints = endpoint_fields(row)
 
-        if origin_a == destination_a and origin_b == destination_b:
+        if same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
             return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0.0,
-                    aTime=0.0,
-                    bDist=0.0,
-                    bTime=0.0,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0
-                ).model_dump(),
+                no_overlap_result(DetailedDualOverlapResult, endpoints),
                 api_calls,
                 0
             )
 
-        if origin_a == destination_a and origin_b != destination_b:
+        if same_point(origin_a, destination_a) and not same_point(origin_b, destination_b):
             api_calls += 1
             coords_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
             return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0.0,
-                    aTime=0.0,
-                    bDist=b_dist,
-                    bTime=b_time,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0
-                ).model_dump(),
+                no_overlap_result(DetailedDualOverlapResult, endpoints, bDist=b_dist, bTime=b_time),
                 api_calls,
                 0
             )
 
-        if origin_a != destination_a and origin_b == destination_b:
+        if not same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
             api_calls += 1
             coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
             return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=0.0,
-                    bTime=0.0,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0
-                ).model_dump(),
+                no_overlap_result(DetailedDualOverlapResult, endpoints, aDist=a_dist, aTime=a_time),
                 api_calls,
                 0
             )
 
-        if origin_a == origin_b and destination_a == destination_b:
+        if same_point(origin_a, origin_b) and same_point(destination_a, destination_b):
             api_calls += 1
             coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
-            buffer_a = create_buffered_route(coords_a, buffer_distance)
-            coords_b = coords_a
-            buffer_b = buffer_a
-            plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
-            return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=a_dist,
-                    bTime=a_time,
-                    aoverlapDist=a_dist,
-                    aoverlapTime=a_time,
-                    boverlapDist=a_dist,
-                    boverlapTime=a_time,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0
-                ).model_dump(),
-                api_calls,
-                0
-            )
+            if plot:
+                buffer_a = create_buffered_route(coords_a, buffer_distance)
+                plot_routes_and_buffers(coords_a, coords_a, buffer_a, buffer_a, ID, input_dir)
+            return same_route_result(DetailedDualOverlapResult, endpoints, a_dist, a_time), api_calls, 0
 
         api_calls += 2
         start_time_a = time.time()
         coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
-        logging.info(f"Time to fetch route A from API: {time.time() - start_time_a:.6f} seconds")
+        timing_log.debug("Time to fetch route A from API: %.6f seconds", time.time() - start_time_a)
         start_time_b = time.time()
         coords_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
-        logging.info(f"Time to fetch route B from API: {time.time() - start_time_b:.6f} seconds")
+        timing_log.debug("Time to fetch route B from API: %.6f seconds", time.time() - start_time_b)
 
-        buffer_a = create_buffered_route(coords_a, buffer_distance)
-        buffer_b = create_buffered_route(coords_b, buffer_distance)
-        intersection_polygon = get_buffer_intersection(buffer_a, buffer_b)
+        # Routes too far apart for their buffers to meet are not buffered unless they are drawn
+        if not plot and route_buffers_disjoint(coords_a, coords_b, buffer_distance):
+            intersection_polygon = None
+        else:
+            buffer_a, buffer_b = create_buffered_routes([coords_a, coords_b], buffer_distance)
+            intersection_polygon = get_buffer_intersection(buffer_a, buffer_b)
 
-        plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
+            if plot:
+                plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
 
         if not intersection_polygon:
-            overlap_a = overlap_b = {
-                "during_distance": 0.0, "during_time": 0.0,
-                "before_distance": 0.0, "before_time": 0.0,
-                "after_distance": 0.0, "after_time": 0.0,
-            }
+            overlap_a = overlap_b = empty_travel_segments()
         else:
             start_time = time.time()
-            nodes_inside_a = [pt for pt in coords_a if Point(pt[1], pt[0]).within(intersection_polygon)]
-            logging.info(f"Time to check route A points inside intersection: {time.time() - start_time:.6f} seconds")
+            nodes_a = entry_exit_nodes(coords_a, intersection_polygon)
+            timing_log.debug("Time to check route A points inside intersection: %.6f seconds", time.time() - start_time)
             start_time = time.time()
-            nodes_inside_b = [pt for pt in coords_b if Point(pt[1], pt[0]).within(intersection_polygon)]
-            logging.info(f"Time to check route B points inside intersection: {time.time() - start_time:.6f} seconds")
-
-            if len(nodes_inside_a) >= 2:
-                entry_a, exit_a = nodes_inside_a[0], nodes_inside_a[-1]
-                api_calls += 1
-                overlap_a = calculate_precise_travel_segments(coords_a, [list(entry_a), list(exit_a)], method, api_key, save_api_info=save_api_info)
-            else:
-                overlap_a = {"during_distance": 0.0, "during_time": 0.0,
-                             "before_distance": 0.0, "before_time": 0.0,
-                             "after_distance": 0.0, "after_time": 0.0}
-
-            if len(nodes_inside_b) >= 2:
-                entry_b, exit_b = nodes_inside_b[0], nodes_inside_b[-1]
-                api_calls += 1
-                overlap_b = calculate_precise_travel_segments(coords_b, [entry_b, exit_b], method, api_key, save_api_info=save_api_info)
-            else:
-                overlap_b = {"during_distance": 0.0, "during_time": 0.0,
-                             "before_distance": 0.0, "before_time": 0.0,
-                             "after_distance": 0.0, "after_time": 0.0}
+            nodes_b = entry_exit_nodes(coords_b, intersection_polygon)
+            timing_log.debug("Time to check route B points inside intersection: %.6f seconds", time.time() - start_time)
+
+            # The segments of both routes are requested together; a route without nodes in
+            # the intersection gets zero segments without a request
+            api_calls += (nodes_a is not None) + (nodes_b is not None)
+            overlap_a, overlap_b = calculate_precise_travel_segments_batch(
+                [(coords_a, nodes_a), (coords_b, nodes_b)], method, api_key, save_api_info=save_api_info
+            )
 
         return (
-            DetailedDualOverlapResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                DetailedDualOverlapResult,
+                **endpoints,
                 aDist=a_dist,
                 aTime=a_time,
                 bDist=b_dist,
@@ -2527,7 +2843,7 @@ def process_row_closest_nodes(row_and_args):
                 bBeforeTime=overlap_b["before_time"],
                 bAfterDist=overlap_b["after_distance"],
                 bAfterTime=overlap_b["after_time"]
-            ).model_dump(),
+            ),
             api_calls,
             0
         )
@@ -2535,43 +2851,7 @@ def process_row_closest_nodes(row_and_args):
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error processing row {row if 'row' in locals() else 'unknown'}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-
-            return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    aoverlapDist=None,
-                    aoverlapTime=None,
-                    boverlapDist=None,
-                    boverlapTime=None,
-                    aBeforeDist=None,
-                    aBeforeTime=None,
-                    aAfterDist=None,
-                    aAfterTime=None,
-                    bBeforeDist=None,
-                    bBeforeTime=None,
-                    bAfterDist=None,
-                    bAfterTime=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return error_result(DetailedDualOverlapResult, row, api_calls)
         else:
             raise
 
@@ -2592,7 +2872,8 @@ def process_routes_with_closest_nodes(
     method: str = "google", 
     output_csv: str = "output_closest_nodes.csv",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    plot: bool = False
 ) -> tuple:
     """
     Processes two routes using buffered geometries to compute travel overlap details
@@ -2616,56 +2897,56 @@ def process_routes_with_closest_nodes(
     - output_csv (str): Path to save the output results.
     - skip_invalid (bool): If True, skips invalid input rows and logs them.
     - save_api_info (bool): If True, save API response.
+    - plot (bool): If True, a map of each route pair and its buffers is saved to the results folder (default: False).
 
     Returns:
     - tuple: (
-        results (list): Processed route rows,
+        results (list): Empty; the rows are streamed to output_csv,
         pre_api_error_count (int): Invalid before routing,
-        total_api_calls (int): Number of API calls made,
+        total_api_calls (int): Number of route requests sent to the routing service,
         post_api_error_count (int): Failures during processing
       )
     """
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
+    pre_api_error_count = 0
 
-    args_with_flags = [(row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method) for row in data]
+    def mapped_rows():
+        # Rows are handed to the workers while the CSV file is still being read
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
 
-    results = []
-    total_api_calls = 0
+    requests_before = route_requests_sent
     post_api_error_count = 0
     processed_count = 0
 
-    try:
-        with Pool() as pool:
-            for res in pool.imap_unordered(process_row_closest_nodes, args_with_flags):
-                if res is None:
-                    continue
-                row_result, api_calls, api_errors = res
-                results.append(row_result)
-                total_api_calls += api_calls
-                post_api_error_count += api_errors
-                processed_count += 1
-                print(f"[INFO] Processed {processed_count} row(s)...")
-    except KeyboardInterrupt:
-        print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
-
-    if results:
-        fieldnames = list(results[0].keys())
-        write_csv_file(input_dir=input_dir, results=results, fieldnames=fieldnames, output_file=output_csv)
-
-    return results, pre_api_error_count, total_api_calls, post_api_error_count
+    # Rows are written as they complete rather than collected and written at the end
+    with CsvResultWriter(input_dir, DetailedDualOverlapResult.model_fields, output_csv) as writer:
+        # Rows mostly wait on the routing API, so they run on ROW_WORKERS threads with their routes
+        # prefetched per window; rows repeating a route pair take the earlier result
+        try:
+            with ThreadPoolExecutor(max_workers=ROW_WORKERS, thread_name_prefix="row") as pool:
+                def run(row):
+                    return process_row_closest_nodes(
+                        (row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method, plot)
+                    )
+
+                def submit(row):
+                    return pool.submit(run, row)
+
+                with closing(iter_row_results(mapped_rows(), submit, method, api_key, save_api_info, run, reuse_results=not plot)) as row_results:
+                    for row_result, _, api_errors in row_results:
+                        writer.write_row(row_result)
+                        post_api_error_count += api_errors
+                        processed_count += 1
+                        print(f"[INFO] Processed {processed_count} row(s)...")
+        except KeyboardInterrupt:
+            print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
+
+    return [], pre_api_error_count, route_requests_sent - requests_before, post_api_error_count
 
 def process_row_closest_nodes_simple(row_and_args):
     """
@@ -2686,98 +2967,41 @@ def process_row_closest_nodes_simple(row_and_args):
             - save_api_info (bool): If True, saves API response data.
             - input_dir (str): Directory for input files.
             - method (str): Routing method to use (e.g., "driving", "walking").
+            - plot (bool): Whether to save a map of the routes and their buffers.
 
     Returns:
         tuple: (result_dict, api_calls, api_errors)
     """
     api_calls = 0
     try:
-        row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method = row_and_args
+        row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method, plot = row_and_args
         ID = row["ID"]
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
 
-        # Split and convert to float
-        origin_a_lat, origin_a_lon = map(float, map(str.strip, origin_a.split(",")))
-        destination_a_lat, destination_a_lon = map(float, map(str.strip, destination_a.split(",")))
-        origin_b_lat, origin_b_lon = map(float, map(str.strip, origin_b.split(",")))
-        destination_b_lat, destination_b_lon = map(float, map(str.strip, destination_b.split(",")))
+        endpoints = endpoint_fields(row)
 
-        if origin_a == destination_a and origin_b == destination_b:
+        if same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
             return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0.0,
-                    aTime=0.0,
-                    bDist=0.0,
-                    bTime=0.0,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                ).model_dump(),
+                no_overlap_result(SimpleDualOverlapResult, endpoints),
                 api_calls,
                 0
             )
 
-        if origin_a == destination_a:
+        if same_point(origin_a, destination_a):
             api_calls += 1
             coords_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
             return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0.0,
-                    aTime=0.0,
-                    bDist=b_dist,
-                    bTime=b_time,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                ).model_dump(),
+                no_overlap_result(SimpleDualOverlapResult, endpoints, bDist=b_dist, bTime=b_time),
                 api_calls,
                 0
             )
 
-        if origin_b == destination_b:
+        if same_point(origin_b, destination_b):
             api_calls += 1
             coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
             return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=0.0,
-                    bTime=0.0,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                ).model_dump(),
+                no_overlap_result(SimpleDualOverlapResult, endpoints, aDist=a_dist, aTime=a_time),
                 api_calls,
                 0
             )
@@ -2788,76 +3012,44 @@ def process_row_closest_nodes_simple(row_and_args):
         api_calls += 1
         coords_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
 
-        if origin_a == origin_b and destination_a == destination_b:
-            buffer_a = create_buffered_route(coords_a, buffer_distance)
-            buffer_b = buffer_a
-            plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
-            return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=a_dist,
-                    bTime=a_time,
-                    aoverlapDist=a_dist,
-                    aoverlapTime=a_time,
-                    boverlapDist=a_dist,
-                    boverlapTime=a_time,
-                ).model_dump(),
-                api_calls,
-                0
-            )
+        if same_point(origin_a, origin_b) and same_point(destination_a, destination_b):
+            if plot:
+                buffer_a = create_buffered_route(coords_a, buffer_distance)
+                plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_a, ID, input_dir)
+            return same_route_result(SimpleDualOverlapResult, endpoints, a_dist, a_time), api_calls, 0
 
-        buffer_a = create_buffered_route(coords_a, buffer_distance)
-        buffer_b = create_buffered_route(coords_b, buffer_distance)
-        intersection_polygon = get_buffer_intersection(buffer_a, buffer_b)
+        # Routes too far apart for their buffers to meet are not buffered unless they are drawn
+        if not plot and route_buffers_disjoint(coords_a, coords_b, buffer_distance):
+            intersection_polygon = None
+        else:
+            buffer_a, buffer_b = create_buffered_routes([coords_a, coords_b], buffer_distance)
+            intersection_polygon = get_buffer_intersection(buffer_a, buffer_b)
 
-        plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
+            if plot:
+                plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
 
         if not intersection_polygon:
             print(f"No intersection for {origin_a} → {destination_a} and {origin_b} → {destination_b}")
             overlap_a_dist = overlap_a_time = overlap_b_dist = overlap_b_time = 0.0
         else:
-            nodes_inside_a = [pt for pt in coords_a if Point(pt[1], pt[0]).within(intersection_polygon)]
-            nodes_inside_b = [pt for pt in coords_b if Point(pt[1], pt[0]).within(intersection_polygon)]
-
-            if len(nodes_inside_a) >= 2:
-                api_calls += 1
-                entry_a, exit_a = nodes_inside_a[0], nodes_inside_a[-1]
-                segments_a = calculate_precise_travel_segments(coords_a, [entry_a, exit_a], method, api_key, save_api_info=save_api_info)
-                overlap_a_dist = segments_a.get("during_distance", 0.0)
-                overlap_a_time = segments_a.get("during_time", 0.0)
-            else:
-                overlap_a_dist = overlap_a_time = 0.0
-
-            if len(nodes_inside_b) >= 2:
-                api_calls += 1
-                entry_b, exit_b = nodes_inside_b[0], nodes_inside_b[-1]
-                segments_b = calculate_precise_travel_segments(coords_b, [entry_b, exit_b], method, api_key, save_api_info=save_api_info)
-                overlap_b_dist = segments_b.get("during_distance", 0.0)
-                overlap_b_time = segments_b.get("during_time", 0.0)
-            else:
-                overlap_b_dist = overlap_b_time = 0.0
+            nodes_a = entry_exit_nodes(coords_a, intersection_polygon)
+            nodes_b = entry_exit_nodes(coords_b, intersection_polygon)
+
+            # The segments of both routes are requested together; a route without nodes in
+            # the intersection gets zero segments without a request
+            api_calls += (nodes_a is not None) + (nodes_b is not None)
+            segments_a, segments_b = calculate_precise_travel_segments_batch(
+                [(coords_a, nodes_a), (coords_b, nodes_b)], method, api_key, save_api_info=save_api_info
+            )
+            overlap_a_dist = segments_a.get("during_distance", 0.0)
+            overlap_a_time = segments_a.get("during_time", 0.0)
+            overlap_b_dist = segments_b.get("during_distance", 0.0)
+            overlap_b_time = segments_b.get("during_time", 0.0)
 
         return (
-            SimpleDualOverlapResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                SimpleDualOverlapResult,
+                **endpoints,
                 aDist=a_dist,
                 aTime=a_time,
                 bDist=b_dist,
@@ -2866,7 +3058,7 @@ def process_row_closest_nodes_simple(row_and_args):
                 aoverlapTime=overlap_a_time,
                 boverlapDist=overlap_b_dist,
                 boverlapTime=overlap_b_time,
-            ).model_dump(),
+            ),
             api_calls,
             0
         )
@@ -2874,34 +3066,7 @@ def process_row_closest_nodes_simple(row_and_args):
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error processing row {row}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-            return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    aoverlapDist=None,
-                    aoverlapTime=None,
-                    boverlapDist=None,
-                    boverlapTime=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return error_result(SimpleDualOverlapResult, row, api_calls)
         else:
             raise
 
@@ -2922,7 +3087,8 @@ def process_routes_with_closest_nodes_simple(
     method: str = "google",
     output_csv: str = "output_closest_nodes_simple.csv",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    plot: bool = False
 ) -> tuple:
     """
     Computes total and overlapping travel segments for two routes using closest-node
@@ -2946,62 +3112,62 @@ def process_routes_with_closest_nodes_simple(
     - output_csv (str): Output name for CSV file with results.
     - skip_invalid (bool): If True, skips rows with invalid coordinate values.
     - save_api_info (bool): If True, saves API response.
+    - plot (bool): If True, a map of each route pair and its buffers is saved to the results folder (default: False).
 
     Returns:
     - tuple: (
-        results (list): Processed result rows,
+        results (list): Empty; the rows are streamed to output_csv,
         pre_api_error_count (int): Number of errors before API calls,
-        total_api_calls (int): Total number of API calls made,
+        total_api_calls (int): Number of route requests sent to the routing service,
         post_api_error_count (int): Number of errors during/after API calls
       )
     """
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
+    pre_api_error_count = 0
 
-    args_with_flags = [(row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method) for row in data]
+    def mapped_rows():
+        # Rows are handed to the workers while the CSV file is still being read
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
 
-    results = []
-    total_api_calls = 0
+    requests_before = route_requests_sent
     post_api_error_count = 0
     processed_count = 0
 
-    try:
-        with Pool() as pool:
-            for r in pool.imap_unordered(process_row_closest_nodes_simple, args_with_flags):
-                if r is None:
-                    continue
-                row_result, api_calls, api_errors = r
-                results.append(row_result)
-                total_api_calls += api_calls
-                post_api_error_count += api_errors
-                processed_count += 1
-                print(f"[INFO] Processed {processed_count} row(s)...")
-    except KeyboardInterrupt:
-        print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
-
-    if results:
-        fieldnames = list(results[0].keys())
-        write_csv_file(input_dir=input_dir, results=results, fieldnames=fieldnames, output_file=output_csv)
-
-    return results, pre_api_error_count, total_api_calls, post_api_error_count
+    # Rows are written as they complete rather than collected and written at the end
+    with CsvResultWriter(input_dir, SimpleDualOverlapResult.model_fields, output_csv) as writer:
+        # Rows mostly wait on the routing API, so they run on ROW_WORKERS threads with their routes
+        # prefetched per window; rows repeating a route pair take the earlier result
+        try:
+            with ThreadPoolExecutor(max_workers=ROW_WORKERS, thread_name_prefix="row") as pool:
+                def run(row):
+                    return process_row_closest_nodes_simple(
+                        (row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method, plot)
+                    )
+
+                def submit(row):
+                    return pool.submit(run, row)
+
+                with closing(iter_row_results(mapped_rows(), submit, method, api_key, save_api_info, run, reuse_results=not plot)) as row_results:
+                    for row_result, _, api_errors in row_results:
+                        writer.write_row(row_result)
+                        post_api_error_count += api_errors
+                        processed_count += 1
+                        print(f"[INFO] Processed {processed_count} row(s)...")
+        except KeyboardInterrupt:
+            print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
+
+    return [], pre_api_error_count, route_requests_sent - requests_before, post_api_error_count
 
 def wrap_row_multiproc_exact(args):
     """
     Wraps a row-processing call for exact intersection calculations using buffered routes.
 
-    This function is designed for use with multiprocessing. It unpacks the arguments and
+    This function is submitted to the row thread pool. It unpacks the arguments and
     passes them to `process_row_exact_intersections`.
 
     Tracks:
@@ -3016,6 +3182,8 @@ def wrap_row_multiproc_exact(args):
             - skip_invalid (bool): If True, logs and skips rows with errors.
             - save_api_info (bool): If True, saves API response.
             - input_dir (str): Directory for saving output files.
+            - method (str): "google" or "graphhopper".
+            - plot (bool): Whether to save a map of the routes and their buffers.
 
     Returns:
         tuple: (result_dict, api_call_count, api_error_flag)
@@ -3023,9 +3191,9 @@ def wrap_row_multiproc_exact(args):
             - api_call_count (int): Number of API calls made.
             - api_error_flag (int): 0 if successful, 1 if error occurred and skip_invalid was True.
     """
-    row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method = args
+    row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method, plot = args
     result, api_calls, api_errors = process_row_exact_intersections(
-        row, api_key, buffer_distance, method, skip_invalid, save_api_info, input_dir
+        row, api_key, buffer_distance, method, skip_invalid, save_api_info, input_dir, plot
     )
     return result, api_calls, api_errors
 
@@ -3037,6 +3205,7 @@ def process_row_exact_intersections(
     skip_invalid: bool = True,
     save_api_info: bool = False,
     input_dir: str = "",
+    plot: bool = False,
 ) -> Tuple[Dict[str, Any], int, int]:
     """
     Computes precise overlapping segments between two routes using buffered polygon intersections.
@@ -3053,6 +3222,7 @@ def process_row_exact_intersections(
         skip_invalid (bool): If True, logs and skips errors instead of raising them.
         save_api_info (bool): If True, saves API response.
         input_dir (str): Directory to save output plots and files.
+        plot (bool): If True, saves a map of the two routes and their buffers.
 
     Returns:
         tuple: (result_dict, api_call_count, api_error_flag)
@@ -3066,197 +3236,78 @@ def process_row_exact_intersections(
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
 
-        origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-        destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-        origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-        destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
+        endpoints = endpoint_fields(row, parse=safe_split)
 
-        if origin_a == destination_a and origin_b == destination_b:
+        if same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
             return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0.0,
-                    aTime=0.0,
-                    bDist=0.0,
-                    bTime=0.0,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0,
-                ).model_dump(),
+                no_overlap_result(DetailedDualOverlapResult, endpoints),
                 api_calls,
                 0
             )
 
-        if origin_a == destination_a and origin_b != destination_b:
+        if same_point(origin_a, destination_a) and not same_point(origin_b, destination_b):
             api_calls += 1
             coords_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
             return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0.0,
-                    aTime=0.0,
-                    bDist=b_dist,
-                    bTime=b_time,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0,
-                ).model_dump(),
+                no_overlap_result(DetailedDualOverlapResult, endpoints, bDist=b_dist, bTime=b_time),
                 api_calls,
                 0
             )
 
-        if origin_a != destination_a and origin_b == destination_b:
+        if not same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
             api_calls += 1
             coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
             return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=0.0,
-                    bTime=0.0,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0,
-                ).model_dump(),
+                no_overlap_result(DetailedDualOverlapResult, endpoints, aDist=a_dist, aTime=a_time),
                 api_calls,
                 0
             )
         
-        if origin_a == origin_b and destination_a == destination_b:
+        if same_point(origin_a, origin_b) and same_point(destination_a, destination_b):
             api_calls += 1
             coords_a, dist_a, time_a = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
-            return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=dist_a,
-                    aTime=time_a,
-                    bDist=dist_a,
-                    bTime=time_a,
-                    aoverlapDist=dist_a,      # Overlap is the full distance of A
-                    aoverlapTime=time_a,      # Overlap is the full time of A
-                    boverlapDist=dist_a,      # Same for B
-                    boverlapTime=time_a,
-                    aBeforeDist=0.0,
-                    aBeforeTime=0.0,
-                    aAfterDist=0.0,
-                    aAfterTime=0.0,
-                    bBeforeDist=0.0,
-                    bBeforeTime=0.0,
-                    bAfterDist=0.0,
-                    bAfterTime=0.0,
-                ).model_dump(),
-                api_calls,
-                0
-            )
+            return same_route_result(DetailedDualOverlapResult, endpoints, dist_a, time_a), api_calls, 0
 
         api_calls += 1
         start_time_a = time.time()
 
         coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
-        logging.info(f"Time to fetch route A from API: {time.time() - start_time_a:.6f} seconds")
+        timing_log.debug("Time to fetch route A from API: %.6f seconds", time.time() - start_time_a)
 
         api_calls += 1
         start_time_b = time.time()
         coords_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
-        logging.info(f"Time to fetch route B from API: {time.time() - start_time_b:.6f} seconds")
+        timing_log.debug("Time to fetch route B from API: %.6f seconds", time.time() - start_time_b)
 
-        buffer_a = create_buffered_route(coords_a, buffer_distance)
-        buffer_b = create_buffered_route(coords_b, buffer_distance)
-        intersection_polygon = get_buffer_intersection(buffer_a, buffer_b)
+        # Routes too far apart for their buffers to meet are not buffered unless they are drawn
+        if not plot and route_buffers_disjoint(coords_a, coords_b, buffer_distance):
+            intersection_polygon = None
+        else:
+            buffer_a, buffer_b = create_buffered_routes([coords_a, coords_b], buffer_distance)
+            intersection_polygon = get_buffer_intersection(buffer_a, buffer_b)
 
-        plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
+            if plot:
+                plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
 
         if not intersection_polygon:
-            overlap_a = overlap_b = {"during_distance": 0.0, "during_time": 0.0, "before_distance": 0.0, "before_time": 0.0, "after_distance": 0.0, "after_time": 0.0}
+            overlap_a = overlap_b = empty_travel_segments()
         else:
             points_a = get_route_polygon_intersections(coords_a, intersection_polygon)
             points_b = get_route_polygon_intersections(coords_b, intersection_polygon)
 
-            if len(points_a) >= 2:
-                api_calls += 1
-                entry_a, exit_a = points_a[0], points_a[-1]
-                overlap_a = calculate_precise_travel_segments(coords_a, [entry_a, exit_a], method, api_key, save_api_info=save_api_info)
-            else:
-                overlap_a = {"during_distance": 0.0, "during_time": 0.0, "before_distance": 0.0, "before_time": 0.0, "after_distance": 0.0, "after_time": 0.0}
-
-            if len(points_b) >= 2:
-                api_calls += 1
-                entry_b, exit_b = points_b[0], points_b[-1]
-                overlap_b = calculate_precise_travel_segments(coords_b, [entry_b, exit_b], method, api_key, save_api_info=save_api_info)
-            else:
-                overlap_b = {"during_distance": 0.0, "during_time": 0.0, "before_distance": 0.0, "before_time": 0.0, "after_distance": 0.0, "after_time": 0.0}
+            # The segments of both routes are requested together, between the first and last
+            # intersection points; a route with fewer than 2 gets zero segments without a request
+            entry_exit_a = [points_a[0], points_a[-1]] if len(points_a) >= 2 else None
+            entry_exit_b = [points_b[0], points_b[-1]] if len(points_b) >= 2 else None
+            api_calls += (entry_exit_a is not None) + (entry_exit_b is not None)
+            overlap_a, overlap_b = calculate_precise_travel_segments_batch(
+                [(coords_a, entry_exit_a), (coords_b, entry_exit_b)], method, api_key, save_api_info=save_api_info
+            )
 
         return (
-            DetailedDualOverlapResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                DetailedDualOverlapResult,
+                **endpoints,
                 aDist=a_dist,
                 aTime=a_time,
                 bDist=b_dist,
@@ -3273,7 +3324,7 @@ def process_row_exact_intersections(
                 bBeforeTime=overlap_b["before_time"],
                 bAfterDist=overlap_b["after_distance"],
                 bAfterTime=overlap_b["after_time"],
-            ).model_dump(),
+            ),
             api_calls,
             0
         )
@@ -3281,43 +3332,7 @@ def process_row_exact_intersections(
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error processing row {row}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-
-            return (
-                DetailedDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    aoverlapDist=None,
-                    aoverlapTime=None,
-                    boverlapDist=None,
-                    boverlapTime=None,
-                    aBeforeDist=None,
-                    aBeforeTime=None,
-                    aAfterDist=None,
-                    aAfterTime=None,
-                    bBeforeDist=None,
-                    bBeforeTime=None,
-                    bAfterDist=None,
-                    bAfterTime=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return error_result(DetailedDualOverlapResult, row, api_calls)
         else:
             raise
 
@@ -3338,12 +3353,14 @@ def process_routes_with_exact_intersections(
     method: str = "google",
     output_csv: str = "output_exact_intersections.csv",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    plot: bool = False
 ) -> tuple:
     """
     Calculates travel metrics for two routes using exact geometric intersections within buffer polygons.
 
-    It applies the processing to each row of the CSV using multiprocessing and collects:
+    Rows are processed on a thread pool while the CSV is read, and each result is written to
+    output_csv as soon as it is ready. It collects:
     - The total number of API calls made across all rows.
     - The number of post-API processing errors (e.g., route failure, segment failure).
 
@@ -3365,56 +3382,55 @@ def process_routes_with_exact_intersections(
         output_csv (str): Output CSV file path.
         skip_invalid (bool): If True, skip invalid coordinate rows and log them.
         save_api_info (bool): If True, save API response.
+        plot (bool): If True, save a map of each route pair and its buffers (default: False).
 
     Returns:
         tuple:
-            - results (list): Processed result dictionaries.
+            - results (list): Empty; the rows are streamed to output_csv.
             - pre_api_error_count (int): Errors before API calls (e.g., missing coordinates).
-            - api_call_count (int): Total number of Google Maps API requests.
+            - api_call_count (int): Number of route requests sent to the routing service.
             - post_api_error_count (int): Errors during or after API processing.
     """
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
+    pre_api_error_count = 0
 
-    args_list = [(row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method) for row in data]
+    def mapped_rows():
+        # Rows are handed to the workers while the CSV file is still being read
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
 
-    results = []
-    api_call_count = 0
+    requests_before = route_requests_sent
     post_api_error_count = 0
     processed_count = 0
 
-    try:
-        with Pool() as pool:
-            for result in pool.imap_unordered(wrap_row_multiproc_exact, args_list):
-                if result is None:
-                    continue
-                row_result, calls, errors = result
-                results.append(row_result)
-                api_call_count += calls
-                post_api_error_count += errors
-                processed_count += 1
-                print(f"[INFO] Processed {processed_count} row(s)...")
-
-    except KeyboardInterrupt:
-        print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
-
-    if results:
-        fieldnames = list(results[0].keys())
-        write_csv_file(input_dir=input_dir, results=results, fieldnames=fieldnames, output_file=output_csv)
-
-    return results, pre_api_error_count, api_call_count, post_api_error_count
+    # Rows are written as they complete rather than collected and written at the end
+    with CsvResultWriter(input_dir, DetailedDualOverlapResult.model_fields, output_csv) as writer:
+        # Rows mostly wait on the routing API, so they run on ROW_WORKERS threads with their routes
+        # prefetched per window; rows repeating a route pair take the earlier result
+        try:
+            with ThreadPoolExecutor(max_workers=ROW_WORKERS, thread_name_prefix="row") as pool:
+                def run(row):
+                    return wrap_row_multiproc_exact(
+                        (row, api_key, buffer_distance, skip_invalid, save_api_info, input_dir, method, plot)
+                    )
+
+                def submit(row):
+                    return pool.submit(run, row)
+
+                with closing(iter_row_results(mapped_rows(), submit, method, api_key, save_api_info, run, reuse_results=not plot)) as row_results:
+                    for row_result, _, errors in row_results:
+                        writer.write_row(row_result)
+                        post_api_error_count += errors
+                        processed_count += 1
+                        print(f"[INFO] Processed {processed_count} row(s)...")
+        except KeyboardInterrupt:
+            print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
+
+    return [], pre_api_error_count, route_requests_sent - requests_before, post_api_error_count
 
 def wrap_row_multiproc_simple(args):
     """
@@ -3428,19 +3444,22 @@ def wrap_row_multiproc_simple(args):
             - input_dir (str): Directory where input files are located.
             - skip_invalid (bool): If True, log and skip rows that raise exceptions; else re-raise.
             - save_api_info (bool): If True, include and store raw API response data.
+            - method (str): Routing method, either "google" or "graphhopper".
+            - plot (bool): Whether to save a map of the routes and their buffers.
 
     Returns:
         tuple: A tuple of (result_dict, api_calls, api_errors)
     """
-    row, api_key, buffer_distance, input_dir, skip_invalid, save_api_info, method = args
+    row, api_key, buffer_distance, input_dir, skip_invalid, save_api_info, method, plot = args
     return process_row_exact_intersections_simple(
         (row, api_key, buffer_distance, save_api_info),
         skip_invalid=skip_invalid,
         input_dir=input_dir,
-        method=method
+        method=method,
+        plot=plot
     )
 
-def process_row_exact_intersections_simple(row_and_args, skip_invalid=True, input_dir="", method="google") -> Tuple[Dict[str, Any], int, int]:
+def process_row_exact_intersections_simple(row_and_args, skip_invalid=True, input_dir="", method="google", plot=False) -> Tuple[Dict[str, Any], int, int]:
     """
     Processes a single row to compute total and overlapping travel metrics between two routes
     using exact geometric intersections of buffered route polygons.
@@ -3460,6 +3479,7 @@ def process_row_exact_intersections_simple(row_and_args, skip_invalid=True, inpu
         skip_invalid (bool): If True, logs and skips errors; if False, raises them.
         input_dir (str): Directory to save output plots and files.
         method (str): Routing method, either "google" or "graphhopper".
+        plot (bool): If True, saves a map of the two routes and their buffers.
 
     Returns:
         tuple: A tuple of (result_dict, api_calls, api_errors)
@@ -3472,152 +3492,65 @@ def process_row_exact_intersections_simple(row_and_args, skip_invalid=True, inpu
         origin_a, destination_a = row["OriginA"], row["DestinationA"]
         origin_b, destination_b = row["OriginB"], row["DestinationB"]
 
-        origin_a_lat, origin_a_lon = map(float, map(str.strip, origin_a.split(",")))
-        destination_a_lat, destination_a_lon = map(float, map(str.strip, destination_a.split(",")))
-        origin_b_lat, origin_b_lon = map(float, map(str.strip, origin_b.split(",")))
-        destination_b_lat, destination_b_lon = map(float, map(str.strip, destination_b.split(",")))
+        endpoints = endpoint_fields(row)
 
-        if origin_a == destination_a and origin_b == destination_b:
+        if same_point(origin_a, destination_a) and same_point(origin_b, destination_b):
             return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0.0,
-                    aTime=0.0,
-                    bDist=0.0,
-                    bTime=0.0,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                ).model_dump(),
+                no_overlap_result(SimpleDualOverlapResult, endpoints),
                 api_calls,
                 0
             )
 
-        if origin_a == destination_a:
+        if same_point(origin_a, destination_a):
             api_calls += 1
             coords_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
             return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=0.0,
-                    aTime=0.0,
-                    bDist=b_dist,
-                    bTime=b_time,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                ).model_dump(),
+                no_overlap_result(SimpleDualOverlapResult, endpoints, bDist=b_dist, bTime=b_time),
                 api_calls,
                 0
             )
 
-        if origin_b == destination_b:
+        if same_point(origin_b, destination_b):
             api_calls += 1
             coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
             return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=0.0,
-                    bTime=0.0,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                ).model_dump(),
+                no_overlap_result(SimpleDualOverlapResult, endpoints, aDist=a_dist, aTime=a_time),
                 api_calls,
                 0
             )
 
-        if origin_a == origin_b and destination_a == destination_b:
+        if same_point(origin_a, origin_b) and same_point(destination_a, destination_b):
             api_calls += 1
             coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
-            buffer_a = create_buffered_route(coords_a, buffer_distance)
-            buffer_b = buffer_a
-            coords_b = coords_a
-            plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
-            return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=a_dist,
-                    aTime=a_time,
-                    bDist=a_dist,
-                    bTime=a_time,
-                    aoverlapDist=a_dist,
-                    aoverlapTime=a_time,
-                    boverlapDist=a_dist,
-                    boverlapTime=a_time,
-                ).model_dump(),
-                api_calls,
-                0
-            )
+            if plot:
+                buffer_a = create_buffered_route(coords_a, buffer_distance)
+                plot_routes_and_buffers(coords_a, coords_a, buffer_a, buffer_a, ID, input_dir)
+            return same_route_result(SimpleDualOverlapResult, endpoints, a_dist, a_time), api_calls, 0
         
         api_calls += 2
         coords_a, a_dist, a_time = get_route_data(origin_a, destination_a, method, api_key, save_api_info=save_api_info)
         coords_b, b_dist, b_time = get_route_data(origin_b, destination_b, method, api_key, save_api_info=save_api_info)
 
-        buffer_a = create_buffered_route(coords_a, buffer_distance)
-        buffer_b = create_buffered_route(coords_b, buffer_distance)
-        intersection_polygon = get_buffer_intersection(buffer_a, buffer_b)
+        # Routes too far apart for their buffers to meet are not buffered unless they are drawn
+        if not plot and route_buffers_disjoint(coords_a, coords_b, buffer_distance):
+            intersection_polygon = None
+        else:
+            buffer_a, buffer_b = create_buffered_routes([coords_a, coords_b], buffer_distance)
+            intersection_polygon = get_buffer_intersection(buffer_a, buffer_b)
 
-        plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
+            if plot:
+                plot_routes_and_buffers(coords_a, coords_b, buffer_a, buffer_b, ID, input_dir)
 
         if not intersection_polygon:
             return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
+                no_overlap_result(
+                    SimpleDualOverlapResult,
+                    endpoints,
                     aDist=a_dist,
                     aTime=a_time,
                     bDist=b_dist,
                     bTime=b_time,
-                    aoverlapDist=0.0,
-                    aoverlapTime=0.0,
-                    boverlapDist=0.0,
-                    boverlapTime=0.0,
-                ).model_dump(),
+                ),
                 api_calls,
                 0
             )
@@ -3625,35 +3558,23 @@ def process_row_exact_intersections_simple(row_and_args, skip_invalid=True, inpu
         points_a = get_route_polygon_intersections(coords_a, intersection_polygon)
         points_b = get_route_polygon_intersections(coords_b, intersection_polygon)
 
-        if len(points_a) >= 2:
-            api_calls += 1
-            entry_a, exit_a = points_a[0], points_a[-1]
-            segments_a = calculate_precise_travel_segments(coords_a, [entry_a, exit_a], method, api_key, save_api_info=save_api_info)
-            overlap_a_dist = segments_a.get("during_distance", 0.0)
-            overlap_a_time = segments_a.get("during_time", 0.0)
-        else:
-            overlap_a_dist = overlap_a_time = 0.0
-
-        if len(points_b) >= 2:
-            api_calls += 1
-            entry_b, exit_b = points_b[0], points_b[-1]
-            segments_b = calculate_precise_travel_segments(coords_b, [entry_b, exit_b], method, api_key, save_api_info=save_api_info)
-            overlap_b_dist = segments_b.get("during_distance", 0.0)
-            overlap_b_time = segments_b.get("during_time", 0.0)
-        else:
-            overlap_b_dist = overlap_b_time = 0.0
+        # The segments of both routes are requested together, between the first and last
+        # intersection points; a route with fewer than 2 gets zero segments without a request
+        entry_exit_a = [points_a[0], points_a[-1]] if len(points_a) >= 2 else None
+        entry_exit_b = [points_b[0], points_b[-1]] if len(points_b) >= 2 else None
+        api_calls += (entry_exit_a is not None) + (entry_exit_b is not None)
+        segments_a, segments_b = calculate_precise_travel_segments_batch(
+            [(coords_a, entry_exit_a), (coords_b, entry_exit_b)], method, api_key, save_api_info=save_api_info
+        )
+        overlap_a_dist = segments_a.get("during_distance", 0.0)
+        overlap_a_time = segments_a.get("during_time", 0.0)
+        overlap_b_dist = segments_b.get("during_distance", 0.0)
+        overlap_b_time = segments_b.get("during_time", 0.0)
 
         return (
-            SimpleDualOverlapResult(
-                ID=ID,
-                OriginAlat=origin_a_lat,
-                OriginAlong=origin_a_lon,
-                DestinationAlat=destination_a_lat,
-                DestinationAlong=destination_a_lon,
-                OriginBlat=origin_b_lat,
-                OriginBlong=origin_b_lon,
-                DestinationBlat=destination_b_lat,
-                DestinationBlong=destination_b_lon,
+            build_result_row(
+                SimpleDualOverlapResult,
+                **endpoints,
                 aDist=a_dist,
                 aTime=a_time,
                 bDist=b_dist,
@@ -3662,7 +3583,7 @@ def process_row_exact_intersections_simple(row_and_args, skip_invalid=True, inpu
                 aoverlapTime=overlap_a_time,
                 boverlapDist=overlap_b_dist,
                 boverlapTime=overlap_b_time,
-            ).model_dump(),
+            ),
             api_calls,
             0
         )
@@ -3670,35 +3591,7 @@ def process_row_exact_intersections_simple(row_and_args, skip_invalid=True, inpu
     except Exception as e:
         if skip_invalid:
             logging.error(f"Error processing row {row if 'row' in locals() else 'unknown'}: {str(e)}")
-            ID = row.get("ID", "")
-            origin_a_lat, origin_a_lon = safe_split(row.get("OriginA", ""))
-            destination_a_lat, destination_a_lon = safe_split(row.get("DestinationA", ""))
-            origin_b_lat, origin_b_lon = safe_split(row.get("OriginB", ""))
-            destination_b_lat, destination_b_lon = safe_split(row.get("DestinationB", ""))
-
-            return (
-                SimpleDualOverlapResult(
-                    ID=ID,
-                    OriginAlat=origin_a_lat,
-                    OriginAlong=origin_a_lon,
-                    DestinationAlat=destination_a_lat,
-                    DestinationAlong=destination_a_lon,
-                    OriginBlat=origin_b_lat,
-                    OriginBlong=origin_b_lon,
-                    DestinationBlat=destination_b_lat,
-                    DestinationBlong=destination_b_lon,
-                    aDist=None,
-                    aTime=None,
-                    bDist=None,
-                    bTime=None,
-                    aoverlapDist=None,
-                    aoverlapTime=None,
-                    boverlapDist=None,
-                    boverlapTime=None,
-                ).model_dump(),
-                api_calls,
-                1
-            )
+            return error_result(SimpleDualOverlapResult, row, api_calls)
         else:
             raise
 
@@ -3719,11 +3612,14 @@ def process_routes_with_exact_intersections_simple(
     method: str = "google",
     output_csv: str = "output_exact_intersections_simple.csv",
     skip_invalid: bool = True,
-    save_api_info: bool = False
+    save_api_info: bool = False,
+    plot: bool = False
 ) -> tuple:
     """
     Processes routes to compute total and overlapping segments using exact geometric intersections,
     without splitting into before/during/after segments. Supports optional skipping of invalid rows.
+    Rows are processed on a thread pool while the CSV is read, and each result is written to
+    output_csv as soon as it is ready.
 
     Parameters:
     - csv_file (str): Path to input CSV file.
@@ -3743,52 +3639,52 @@ def process_routes_with_exact_intersections_simple(
     - output_csv (str): File path to write the output CSV.
     - skip_invalid (bool): If True, skips invalid coordinate rows and logs them.
     - save_api_info (bool): If True, saves API response.
+    - plot (bool): If True, a map of each route pair and its buffers is saved to the results folder (default: False).
 
     Returns:
-    - tuple: (results list, pre_api_error_count, api_call_count, post_api_error_count)
+    - tuple: (results list (empty; the rows are streamed to output_csv), pre_api_error_count,
+      api_call_count, post_api_error_count)
     """
-    data, pre_api_error_count = read_csv_file(
-        csv_file=csv_file,
-        input_dir=input_dir,
-        home_a_lat=home_a_lat,
-        home_a_lon=home_a_lon,
-        work_a_lat=work_a_lat,
-        work_a_lon=work_a_lon,
-        home_b_lat=home_b_lat,
-        home_b_lon=home_b_lon,
-        work_b_lat=work_b_lat,
-        work_b_lon=work_b_lon,
-        id_column=id_column,
-        skip_invalid=skip_invalid
-    )
+    pre_api_error_count = 0
 
-    args = [(row, api_key, buffer_distance, input_dir, skip_invalid, save_api_info, method) for row in data]
+    def mapped_rows():
+        # Rows are handed to the workers while the CSV file is still being read
+        nonlocal pre_api_error_count
+        for row, is_valid in iter_csv_rows(
+            csv_file, input_dir, home_a_lat, home_a_lon, work_a_lat, work_a_lon,
+            home_b_lat, home_b_lon, work_b_lat, work_b_lon, id_column, skip_invalid
+        ):
+            pre_api_error_count += not is_valid
+            yield row
 
-    processed = []
-    api_call_count = 0
+    requests_before = route_requests_sent
     api_error_count = 0
     processed_count = 0
 
-    try:
-        with Pool() as pool:
-            for result in pool.imap_unordered(wrap_row_multiproc_simple, args):
-                if result is None:
-                    continue
-                row_result, row_calls, row_errors = result
-                processed.append(row_result)
-                api_call_count += row_calls
-                api_error_count += row_errors
-                processed_count += 1
-                print(f"[INFO] Processed {processed_count} row(s)...")
-
-    except KeyboardInterrupt:
-        print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
-
-    if processed:
-        fieldnames = list(processed[0].keys())
-        write_csv_file(input_dir=input_dir, results=processed, fieldnames=fieldnames, output_file=output_csv)
-
-    return processed, pre_api_error_count, api_call_count, api_error_count
+    # Rows are written as they complete rather than collected and written at the end
+    with CsvResultWriter(input_dir, SimpleDualOverlapResult.model_fields, output_csv) as writer:
+        # Rows mostly wait on the routing API, so they run on ROW_WORKERS threads with their routes
+        # prefetched per window; rows repeating a route pair take the earlier result
+        try:
+            with ThreadPoolExecutor(max_workers=ROW_WORKERS, thread_name_prefix="row") as pool:
+                def run(row):
+                    return wrap_row_multiproc_simple(
+                        (row, api_key, buffer_distance, input_dir, skip_invalid, save_api_info, method, plot)
+                    )
+
+                def submit(row):
+                    return pool.submit(run, row)
+
+                with closing(iter_row_results(mapped_rows(), submit, method, api_key, save_api_info, run, reuse_results=not plot)) as row_results:
+                    for row_result, _, row_errors in row_results:
+                        writer.write_row(row_result)
+                        api_error_count += row_errors
+                        processed_count += 1
+                        print(f"[INFO] Processed {processed_count} row(s)...")
+        except KeyboardInterrupt:
+            print("\n[INTERRUPTED] Keyboard interrupt received. Writing partial results...")
+
+    return [], pre_api_error_count, route_requests_sent - requests_before, api_error_count
 
 # Function to write txt file for displaying inputs for the package to run.
 def write_log(file_path: str, options: dict, input_dir: str) -> None:
@@ -3842,7 +3738,9 @@ def Overlap_Function(
     output_file: Optional[str] = None,
     skip_invalid: bool = True,
     save_api_info: bool = True,
-    auto_confirm: bool = False
+    auto_confirm: bool = False,
+    route_cache: Optional[str] = None,
+    plot: bool = False
 ) -> None:
     """
     Main dispatcher function to handle various route overlap and buffer analysis strategies.
@@ -3874,6 +3772,9 @@ def Overlap_Function(
     - skip_invalid (bool): If True, skips invalid coordinates and logs the error; if False, halts on error.
     - save_api_info (bool): If True, saves API response.
     - auto_confirm (bool): If True, skips the user confirmation prompt and proceeds automatically.
+    - route_cache (Optional[str]): Path of an SQLite file used to cache routes across runs. Repeated
+      origin/destination pairs are then served from the file instead of the routing API.
+    - plot (bool): If True, a map of each route pair is saved to the results folder (default: False).
 
     Returns:
     - None
@@ -3914,6 +3815,8 @@ def Overlap_Function(
         "method": method,
         "skip_invalid": skip_invalid,
         "save_api_info": save_api_info,
+        "route_cache": route_cache,
+        "plot": plot,
     }
 
     if csv_file is None:
@@ -3959,6 +3862,10 @@ def Overlap_Function(
 
     print("[PROCESSING] Proceeding with route analysis...\n")
 
+    if route_cache:
+        enable_route_cache(os.path.abspath(route_cache))
+
+
     if approximation == "yes":
         if commuting_info == "yes":
             output_file = output_file or generate_unique_filename("outputRec", ".csv")
@@ -3967,7 +3874,7 @@ def Overlap_Function(
                 home_a_lat, home_a_lon, work_a_lat, work_a_lon, home_b_lat,
                 home_b_lon, work_b_lat, work_b_lon, id_column,
                 output_csv=output_file, threshold=int(threshold), width=int(width), method=method,
-                skip_invalid=skip_invalid, save_api_info=save_api_info)
+                skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
             options["Pre-API Error Count"] = pre_api_errors
             options["Post-API Error Count"] = post_api_errors
             options["Total API Calls"] = api_calls
@@ -3978,7 +3885,7 @@ def Overlap_Function(
                 csv_file, input_dir, api_key, home_a_lat, home_a_lon, work_a_lat, work_a_lon, home_b_lat,
                 home_b_lon, work_b_lat, work_b_lon, id_column,
                 output_csv=output_file, threshold=int(threshold), width=int(width), method=method,
-                skip_invalid=skip_invalid, save_api_info=save_api_info)
+                skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
             options["Pre-API Error Count"] = pre_api_errors
             options["Post-API Error Count"] = post_api_errors
             options["Total API Calls"] = api_calls
@@ -3990,7 +3897,7 @@ def Overlap_Function(
             results, pre_api_errors, api_calls, post_api_errors = process_routes_with_csv(
                 csv_file, input_dir, api_key, home_a_lat, home_a_lon, work_a_lat, work_a_lon, home_b_lat,
                 home_b_lon, work_b_lat, work_b_lon, id_column, method=method, output_csv=output_file, 
-                skip_invalid=skip_invalid, save_api_info=save_api_info)
+                skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
             options["Pre-API Error Count"] = pre_api_errors
             options["Post-API Error Count"] = post_api_errors
             options["Total API Calls"] = api_calls
@@ -4001,7 +3908,7 @@ def Overlap_Function(
             results, pre_api_errors, api_calls, post_api_errors = process_routes_only_overlap_with_csv(
                 csv_file, input_dir, api_key, home_a_lat, home_a_lon, work_a_lat, work_a_lon, home_b_lat,
                 home_b_lon, work_b_lat, work_b_lon, id_column, method=method, output_csv=output_file,
-                skip_invalid=skip_invalid, save_api_info=save_api_info)
+                skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
             options["Pre-API Error Count"] = pre_api_errors
             options["Post-API Error Count"] = post_api_errors
             options["Total API Calls"] = api_calls
@@ -4014,7 +3921,7 @@ def Overlap_Function(
             home_a_lat=home_a_lat, home_a_lon=home_a_lon, work_a_lat=work_a_lat, work_a_lon= work_a_lon, home_b_lat=home_b_lat,
             home_b_lon=home_b_lon, work_b_lat=work_b_lat, work_b_lon=work_b_lon, id_column=id_column, 
             output_csv=output_file, buffer_distance=buffer, method=method,
-            skip_invalid=skip_invalid, save_api_info=save_api_info)
+            skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
         options["Pre-API Error Count"] = pre_api_errors
         options["Post-API Error Count"] = post_api_errors
         options["Total API Calls"] = api_calls
@@ -4027,7 +3934,7 @@ def Overlap_Function(
                 csv_file=csv_file, input_dir = input_dir, api_key=api_key, 
                 home_a_lat=home_a_lat, home_a_lon=home_a_lon, work_a_lat=work_a_lat, work_a_lon=work_a_lon, home_b_lat=home_b_lat,
                 home_b_lon=home_b_lon, work_b_lat=work_b_lat, work_b_lon=work_b_lon, id_column=id_column, buffer_distance=buffer, method=method, output_csv=output_file,
-                skip_invalid=skip_invalid, save_api_info=save_api_info)
+                skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
             options["Pre-API Error Count"] = pre_api_errors
             options["Post-API Error Count"] = post_api_errors
             options["Total API Calls"] = api_calls
@@ -4039,7 +3946,7 @@ def Overlap_Function(
                 home_a_lat=home_a_lat, home_a_lon=home_a_lon, work_a_lat=work_a_lat, work_a_lon=work_a_lon, home_b_lat=home_b_lat,
                 home_b_lon=home_b_lon, work_b_lat=work_b_lat, work_b_lon=work_b_lon, id_column=id_column, 
                 buffer_distance=buffer, method=method, output_csv=output_file,
-                skip_invalid=skip_invalid, save_api_info=save_api_info)
+                skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
             options["Pre-API Error Count"] = pre_api_errors
             options["Post-API Error Count"] = post_api_errors
             options["Total API Calls"] = api_calls
@@ -4054,7 +3961,7 @@ def Overlap_Function(
                 csv_file=csv_file, input_dir=input_dir, api_key=api_key, home_a_lat=home_a_lat, home_a_lon=home_a_lon, work_a_lat=work_a_lat, work_a_lon=work_a_lon, home_b_lat=home_b_lat,
                 home_b_lon=home_b_lon, work_b_lat=work_b_lat, work_b_lon=work_b_lon, id_column=id_column,
                 buffer_distance=buffer, method=method, output_csv=output_file,
-                skip_invalid=skip_invalid, save_api_info=save_api_info)
+                skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
             options["Pre-API Error Count"] = pre_api_errors
             options["Post-API Error Count"] = post_api_errors
             options["Total API Calls"] = api_calls
@@ -4066,7 +3973,7 @@ def Overlap_Function(
                 home_a_lat=home_a_lat, home_a_lon=home_a_lon, work_a_lat=work_a_lat, work_a_lon=work_a_lon, home_b_lat=home_b_lat,
                 home_b_lon=home_b_lon, work_b_lat=work_b_lat, work_b_lon=work_b_lon, id_column=id_column,
                 buffer_distance=buffer, method=method, output_csv=output_file,
-                skip_invalid=skip_invalid, save_api_info=save_api_info)
+                skip_invalid=skip_invalid, save_api_info=save_api_info, plot=plot)
             options["Pre-API Error Count"] = pre_api_errors
             options["Post-API Error Count"] = post_api_errors
             options["Total API Calls"] = api_calls
@@ -4075,6 +3982,10 @@ def Overlap_Function(
     if save_api_info is True:
         os.makedirs(output_dir, exist_ok=True)  # Ensure the ResultsCommuto folder exists
         cache_path = os.path.join(output_dir, "api_response_cache.pkl")
+        # The store pickles as a plain dict, read from its file in batches
         with open(cache_path, "wb") as f:
             pickle.dump(api_response_cache, f)
 
+    if route_cache:
+        enable_route_cache(None)
+
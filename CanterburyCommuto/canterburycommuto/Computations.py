@@ -1,11 +1,68 @@
 import time
 import logging
 import math
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+import shapely
 from pyproj import Geod, Transformer
 from shapely.geometry import LineString, Polygon, Point, MultiPoint
 
+from canterburycommuto.HelperFunctions import LRUDict
+
+# Shared WGS84 geodesic; pyproj.Geod is immutable and safe to reuse across threads.
+_GEOD = Geod(ellps="WGS84")
+
+# Per-step timings are logged at DEBUG level, so they cost no formatting in normal runs
+timing_log = logging.getLogger("canterburycommuto.timing")
+
+def routes_bounds_disjoint(coordinates_a: list, coordinates_b: list, margin: float = 0.0) -> bool:
+    """
+    Checks whether the bounding boxes of two routes are disjoint.
+
+    Parameters:
+    - coordinates_a (list): A list of (latitude, longitude) tuples representing route A.
+    - coordinates_b (list): A list of (latitude, longitude) tuples representing route B.
+    - margin (float): Gap in degrees the boxes must exceed to count as disjoint (default: 0.0).
+
+    Returns:
+    - bool: True if the boxes are more than `margin` apart (or a route is empty), False otherwise.
+    """
+    if not coordinates_a or not coordinates_b:
+        return True
+    lats_a, lons_a = zip(*coordinates_a)
+    lats_b, lons_b = zip(*coordinates_b)
+    return (
+        max(lats_a) + margin < min(lats_b) or max(lats_b) + margin < min(lats_a)
+        or max(lons_a) + margin < min(lons_b) or max(lons_b) + margin < min(lons_a)
+    )
+
+# Radius of the sphere behind Web Mercator (EPSG:3857), in meters
+_MERCATOR_RADIUS = 6378137.0
+
+def route_buffers_disjoint(coordinates_a: list, coordinates_b: list, buffer_distance_meters: float) -> bool:
+    """
+    Checks from the routes alone whether their buffers (see create_buffered_routes, default
+    projection) are certain not to intersect, so that neither buffer has to be built.
+
+    Parameters:
+    - coordinates_a (list): A list of (latitude, longitude) tuples representing route A.
+    - coordinates_b (list): A list of (latitude, longitude) tuples representing route B.
+    - buffer_distance_meters (float): Buffer distance in meters.
+
+    Returns:
+    - bool: True if the buffers cannot intersect; False if they may, or if a route has fewer
+      than 2 points and is left to create_buffered_routes.
+    """
+    if len(coordinates_a) < 2 or len(coordinates_b) < 2:
+        return False
+    # A Web Mercator buffer of d meters reaches d / R radians of longitude beyond the route and at
+    # most as far in latitude, since the projection stretches northings by 1 / cos(latitude).
+    # Each buffer adds that to its route's box; 1% slack absorbs the projection round trip.
+    margin = 2.02 * math.degrees(buffer_distance_meters / _MERCATOR_RADIUS)
+    return routes_bounds_disjoint(coordinates_a, coordinates_b, margin)
+
 # Function to find common nodes
 def find_common_nodes(coordinates_a: list, coordinates_b: list) -> tuple:
     """
@@ -20,13 +77,18 @@ def find_common_nodes(coordinates_a: list, coordinates_b: list) -> tuple:
         - tuple or None: The first common node (latitude, longitude) or None if not found.
         - tuple or None: The last common node (latitude, longitude) or None if not found.
     """
-    first_common_node = next(
-        (coord for coord in coordinates_a if coord in coordinates_b), None
-    )
-    last_common_node = next(
-        (coord for coord in reversed(coordinates_a) if coord in coordinates_b), None
-    )
-    return first_common_node, last_common_node
+    # Common nodes are shared points, so routes whose bounding boxes do not meet have none
+    if routes_bounds_disjoint(coordinates_a, coordinates_b):
+        return None, None
+
+    # Each (lat, lon) node is viewed as one complex number, so that np.isin matches whole nodes
+    # exactly in a single vectorized pass instead of a Python loop over route A
+    nodes_a = np.asarray(coordinates_a, dtype=np.float64).view(np.complex128).ravel()
+    nodes_b = np.asarray(coordinates_b, dtype=np.float64).view(np.complex128).ravel()
+    common = np.flatnonzero(np.isin(nodes_a, nodes_b))
+    if common.size == 0:
+        return None, None
+    return coordinates_a[common[0]], coordinates_a[common[-1]]
 
 # Function to split route segments
 def split_segments(coordinates: list, first_common: tuple, last_common: tuple) -> tuple:
@@ -103,6 +165,29 @@ def great_circle_distance(
 
     return dist_km * 1000  # Convert to meters
 
+def great_circle_distances(coordinates: list) -> np.ndarray:
+    """
+    Vectorized great_circle_distance between each consecutive pair of coordinates.
+
+    Parameters:
+    - coordinates: list of (latitude, longitude) tuples
+
+    Returns:
+    - np.ndarray: The len(coordinates) - 1 distances in meters
+    """
+    points = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    latitudes = points[:, 0] * math.pi / 180
+    longitude_gaps = np.abs(np.diff(points[:, 1])) * math.pi / 180
+
+    cosd = (
+        np.sin(latitudes[:-1]) * np.sin(latitudes[1:])
+        + np.cos(latitudes[:-1]) * np.cos(latitudes[1:]) * np.cos(longitude_gaps)
+    )
+    np.clip(cosd, -1, 1, out=cosd)
+
+    dist_degrees = np.arccos(cosd) * 180 / math.pi
+    return 1.609 * (69.16 * dist_degrees) * 1000
+
 def calculate_distances(segment: list, label_prefix: str) -> list:
     """
     Calculates distances and creates labeled segments for a given list of coordinates.
@@ -118,16 +203,12 @@ def calculate_distances(segment: list, label_prefix: str) -> list:
         - 'end': End coordinates of the segment.
         - 'distance': Distance (in meters) for the segment.
     """
-    segment_details = []
-    for i in range(len(segment) - 1):
-        start = segment[i]
-        end = segment[i + 1]
-        distance = great_circle_distance(start, end)
-        label = f"{label_prefix}{i + 1}"
-        segment_details.append(
-            {"label": label, "start": start, "end": end, "distance": distance}
-        )
-    return segment_details
+    # All the distances of the segment are computed in one pass over the array
+    distances = great_circle_distances(segment).tolist()
+    return [
+        {"label": f"{label_prefix}{i + 1}", "start": start, "end": end, "distance": distance}
+        for i, (start, end, distance) in enumerate(zip(segment, segment[1:], distances))
+    ]
 
 def calculate_segment_distances(before: list, after: list) -> dict:
     """
@@ -150,6 +231,22 @@ def calculate_segment_distances(before: list, after: list) -> dict:
 
     return {"before_segments": before_segments, "after_segments": after_segments}
 
+def before_overlap_share(segment_distances: dict) -> float:
+    """
+    Computes the fraction of a route's non-overlapping length that lies before the overlap.
+
+    Parameters:
+    - segment_distances (dict): Output of calculate_segment_distances for the route.
+
+    Returns:
+    - float: Length of the 'before' segments divided by the length of the 'before' and 'after'
+      segments together, or 0.5 if both are empty.
+    """
+    before_length = sum(segment["distance"] for segment in segment_distances["before_segments"])
+    after_length = sum(segment["distance"] for segment in segment_distances["after_segments"])
+    total_length = before_length + after_length
+    return before_length / total_length if total_length > 0 else 0.5
+
 def calculate_rectangle_coordinates(start, end, width: float) -> list:
     """
     Calculates the coordinates of the corners of a rectangle for a given segment.
@@ -209,14 +306,22 @@ def create_segment_rectangles(segments: list, width: float = 100) -> list:
     """
     rectangles = []
     for segment in segments:
-        start = segment["start"]
-        end = segment["end"]
-        rectangle_coords = calculate_rectangle_coordinates(start, end, width)
-        rectangle_polygon = Polygon(rectangle_coords)
+        rectangle_polygon = _segment_rectangle(tuple(segment["start"]), tuple(segment["end"]), width)
         rectangles.append({"label": segment["label"], "rectangle": rectangle_polygon})
 
     return rectangles
 
+# A route usually appears in many rows (one commuter paired with several others), so each of its
+# segments would otherwise be turned into the same rectangle again for every pairing.
+@lru_cache(maxsize=200_000)
+def _segment_rectangle(start: Tuple[float, float], end: Tuple[float, float], width: float) -> Polygon:
+    """
+    Cached worker of `create_segment_rectangles`. The coordinates of a Shapely geometry cannot
+    change and the rectangles are never prepared, so the returned rectangle can safely be shared
+    between rows and threads.
+    """
+    return Polygon(calculate_rectangle_coordinates(start, end, width))
+
 def find_segment_combinations(rectangles_a: list, rectangles_b: list) -> dict:
     """
     Finds all combinations of segments between two routes (A and B).
@@ -300,42 +405,65 @@ def filter_combinations_by_overlap(
         - 'before_combinations': A list of tuples with retained combinations for "before overlap".
         - 'after_combinations': A list of tuples with retained combinations for "after overlap".
     """
-    filtered_before_combinations = []
-    filtered_after_combinations = []
-
     # Separate rectangles into before and after overlap
     before_a = [rect for rect in rectangles_a if rect["label"].startswith("t")]
     after_a = [rect for rect in rectangles_a if rect["label"].startswith("T")]
     before_b = [rect for rect in rectangles_b if rect["label"].startswith("t")]
     after_b = [rect for rect in rectangles_b if rect["label"].startswith("T")]
 
-    # Process "before overlap" combinations
-    for rect_a in before_a:
-        for rect_b in before_b:
-            overlap_ratio = calculate_overlap_ratio(
-                rect_a["rectangle"], rect_b["rectangle"]
-            )
-            if overlap_ratio >= threshold:
-                filtered_before_combinations.append(
-                    (rect_a["label"], rect_b["label"], overlap_ratio)
-                )
-
-    # Process "after overlap" combinations
-    for rect_a in after_a:
-        for rect_b in after_b:
-            overlap_ratio = calculate_overlap_ratio(
-                rect_a["rectangle"], rect_b["rectangle"]
-            )
-            if overlap_ratio >= threshold:
-                filtered_after_combinations.append(
-                    (rect_a["label"], rect_b["label"], overlap_ratio)
-                )
-
     return {
-        "before_combinations": filtered_before_combinations,
-        "after_combinations": filtered_after_combinations,
+        "before_combinations": _overlapping_rectangle_pairs(before_a, before_b, threshold),
+        "after_combinations": _overlapping_rectangle_pairs(after_a, after_b, threshold),
     }
 
+def _overlapping_rectangle_pairs(rectangles_a: list, rectangles_b: list, threshold: float) -> list:
+    """
+    Returns the (label_a, label_b, overlap_ratio) pairs whose overlap ratio (see calculate_overlap_ratio)
+    reaches the threshold, ordered by rectangle A, then rectangle B.
+
+    Only pairs whose envelopes intersect are candidates; they are found with an STRtree over the
+    B rectangles instead of testing every pair. Candidates whose envelope overlap is already too
+    small to reach the threshold are dropped with array arithmetic on the (n, 4) bounds before
+    any GEOS intersection is computed.
+    """
+    if not rectangles_a or not rectangles_b:
+        return []
+    polygons_a = _as_geometry_array([rect["rectangle"] for rect in rectangles_a])
+    polygons_b = _as_geometry_array([rect["rectangle"] for rect in rectangles_b])
+
+    areas_a = shapely.area(polygons_a)
+    areas_b = shapely.area(polygons_b)
+
+    if threshold > 0:
+        index_a, index_b = shapely.STRtree(polygons_b).query(polygons_a)
+        order = np.lexsort((index_b, index_a))
+        index_a, index_b = index_a[order], index_b[order]
+
+        # The overlap of two rectangles lies inside the overlap of their envelopes, so pairs
+        # whose envelope overlap is under threshold % of the smaller area cannot pass
+        bounds_a = shapely.bounds(polygons_a)[index_a]
+        bounds_b = shapely.bounds(polygons_b)[index_b]
+        extent = np.minimum(bounds_a[:, 2:], bounds_b[:, 2:]) - np.maximum(bounds_a[:, :2], bounds_b[:, :2])
+        envelope_overlap = np.prod(np.clip(extent, 0, None), axis=1)
+        # Small slack so that rounding never drops a pair GEOS would keep
+        possible = envelope_overlap * (100 + 1e-6) >= threshold * np.minimum(areas_a[index_a], areas_b[index_b])
+        index_a, index_b = index_a[possible], index_b[possible]
+    else:
+        # Every pair passes a non-positive threshold, including those that do not touch
+        index_a, index_b = np.divmod(np.arange(len(polygons_a) * len(polygons_b)), len(polygons_b))
+
+    overlap_area = shapely.area(shapely.intersection(polygons_a[index_a], polygons_b[index_b]))
+    smaller_area = np.minimum(areas_a[index_a], areas_b[index_b])
+    ratios = np.divide(
+        overlap_area, smaller_area, out=np.zeros_like(overlap_area), where=smaller_area > 0
+    ) * 100
+
+    keep = ratios >= threshold
+    return [
+        (rectangles_a[i]["label"], rectangles_b[j]["label"], float(ratio))
+        for i, j, ratio in zip(index_a[keep], index_b[keep], ratios[keep])
+    ]
+
 def get_segment_by_label(rectangles: list, label: str) -> dict:
     """
     Finds a segment dictionary by its label.
@@ -444,22 +572,21 @@ def calculate_geodetic_area(polygon: Polygon) -> float:
     Returns:
         float: The total area of the polygon or multipolygon in square meters (absolute value).
     """
-    geod = Geod(ellps="WGS84")
-
     start_time = time.time()
     if polygon.geom_type == "Polygon":
-        lon, lat = zip(*polygon.exterior.coords)
-        area, _ = geod.polygon_area_perimeter(lon, lat)
-        logging.info(f"Time to compute geodesic area: {time.time() - start_time:.6f} seconds")
+        # exterior.xy returns coordinate arrays that pyproj consumes without copying per point
+        lon, lat = polygon.exterior.xy
+        area, _ = _GEOD.polygon_area_perimeter(lon, lat)
+        timing_log.debug("Time to compute geodesic area: %.6f seconds", time.time() - start_time)
         return abs(area)
 
     elif polygon.geom_type == "MultiPolygon":
         total_area = 0
         for single_polygon in polygon.geoms:
-            lon, lat = zip(*single_polygon.exterior.coords)
-            area, _ = geod.polygon_area_perimeter(lon, lat)
+            lon, lat = single_polygon.exterior.xy
+            area, _ = _GEOD.polygon_area_perimeter(lon, lat)
             total_area += abs(area)
-        logging.info(f"Time to compute geodesic area: {time.time() - start_time:.6f} seconds")
+        timing_log.debug("Time to compute geodesic area: %.6f seconds", time.time() - start_time)
         return total_area
 
     else:
@@ -481,29 +608,124 @@ def create_buffered_route(
     Returns:
         Polygon: Buffered polygon around the route in geographic coordinates (lat/lon), or None if not possible.
     """
-    if not route_coords or len(route_coords) < 2:
-        print("Warning: Not enough points to create buffer. Returning None.")
-        return None
+    return create_buffered_routes([route_coords], buffer_distance_meters, projection)[0]
 
-    transformer = Transformer.from_crs("EPSG:4326", projection, always_xy=True)
-    inverse_transformer = Transformer.from_crs(projection, "EPSG:4326", always_xy=True)
+# Routes with more points than this are buffered piecewise and the pieces merged (buffer by
+# union); GEOS slows down sharply on long polylines that cross themselves many times
+BUFFER_CHUNK_SIZE = 500
 
-    projected_coords = [transformer.transform(lon, lat) for lat, lon in route_coords]
+# Identical routes (e.g. repeated home/work pairs) reuse the same buffer polygon. Buffers are
+# prepared before they are cached: shapely.prepare modifies a geometry in place, so a shared
+# polygon is only safe to use from several rows and threads once it is prepared.
+_buffer_cache = LRUDict(4096)
 
-    if len(projected_coords) < 2:
-        print("Error: Not enough points after projection to create LineString.")
-        return None
+def create_buffered_routes(
+    routes: Sequence[List[Tuple[float, float]]],
+    buffer_distance_meters: float,
+    projection: str = "EPSG:3857",
+) -> List[Optional[Polygon]]:
+    """
+    Creates the buffers of several routes at once; see create_buffered_route.
 
-    start_time = time.time()
-    projected_line = LineString(projected_coords)
-    logging.info(f"Time to create LineString: {time.time() - start_time:.6f} seconds")
+    The routes that are not cached yet go through one projection, one buffer and one inverse
+    projection call together, instead of a chain of Python-level calls per route.
+
+    Args:
+        routes (Sequence[List[Tuple[float, float]]]): Routes as lists of (latitude, longitude).
+        buffer_distance_meters (float): Buffer distance in meters.
+        projection (str): EPSG code for the projection (default: Web Mercator - EPSG:3857).
 
-    buffered_polygon = projected_line.buffer(buffer_distance_meters)
+    Returns:
+        List[Optional[Polygon]]: The buffer of each route in geographic coordinates, prepared, or
+        None for routes with fewer than 2 points.
+    """
+    buffers: List[Optional[Polygon]] = [None] * len(routes)
+    missing: Dict[tuple, List[int]] = {}
+    for i, route_coords in enumerate(routes):
+        if not route_coords or len(route_coords) < 2:
+            print("Warning: Not enough points to create buffer. Returning None.")
+            continue
+        key = (tuple(map(tuple, route_coords)), buffer_distance_meters, projection)
+        cached = _buffer_cache.get(key)
+        if cached is not None:
+            buffers[i] = cached
+        else:
+            missing.setdefault(key, []).append(i)
+
+    if missing:
+        keys = list(missing)
+        polygons = _buffer_routes([key[0] for key in keys], buffer_distance_meters, projection)
+        shapely.prepare(_as_geometry_array(polygons))
+        for key, polygon in zip(keys, polygons):
+            _buffer_cache[key] = polygon
+            for i in missing[key]:
+                buffers[i] = polygon
+    return buffers
+
+@lru_cache(maxsize=None)
+def _transformers(projection: str) -> Tuple[Transformer, Transformer]:
+    """
+    Returns the (to projection, back to WGS84) transformers of a projection. Building them costs
+    more than projecting a whole batch of routes, so they are created once per projection;
+    pyproj transformers can be shared between threads.
+    """
+    return (
+        Transformer.from_crs("EPSG:4326", projection, always_xy=True),
+        Transformer.from_crs(projection, "EPSG:4326", always_xy=True),
+    )
+
+def _buffer_routes(
+    routes: List[Tuple[Tuple[float, float], ...]],
+    buffer_distance_meters: float,
+    projection: str,
+) -> List[Polygon]:
+    """
+    Batch worker of `create_buffered_routes` for routes of at least 2 points.
+    """
+    transformer, inverse_transformer = _transformers(projection)
+
+    # All routes are projected in one call, then split back into lines by their indices
+    coords = np.concatenate([np.asarray(route, dtype=float) for route in routes])
+    xs, ys = transformer.transform(coords[:, 1], coords[:, 0])
+    lengths = np.array([len(route) for route in routes])
+    route_index = np.repeat(np.arange(len(routes)), lengths)
+
+    start_time = time.time()
+    projected_lines = shapely.linestrings(xs, ys, indices=route_index)
+    timing_log.debug("Time to create %s LineString(s): %.6f seconds", len(routes), time.time() - start_time)
+
+    buffers = np.empty(len(routes), dtype=object)
+    short = lengths <= BUFFER_CHUNK_SIZE
+    buffers[short] = shapely.buffer(projected_lines[short], buffer_distance_meters, quad_segs=16)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    for i in np.flatnonzero(~short):
+        end = starts[i] + lengths[i]
+        buffers[i] = _buffer_by_union(xs[starts[i]:end], ys[starts[i]:end], buffer_distance_meters)
+    rings = shapely.get_exterior_ring(buffers)
+
+    # Only the exterior of each buffer is kept; an empty buffer gives an empty polygon
+    polygons = np.array([Polygon() for _ in routes], dtype=object)
+    non_empty = np.flatnonzero(~shapely.is_empty(rings))
+    if non_empty.size:
+        ring_coords, ring_index = shapely.get_coordinates(rings[non_empty], return_index=True)
+        lons, lats = inverse_transformer.transform(ring_coords[:, 0], ring_coords[:, 1])
+        polygons[non_empty] = shapely.polygons(
+            shapely.linearrings(np.column_stack((lons, lats)), indices=ring_index)
+        )
+    return list(polygons)
 
-    return Polygon([
-        inverse_transformer.transform(x, y)
-        for x, y in buffered_polygon.exterior.coords
-    ])
+def _buffer_by_union(xs: np.ndarray, ys: np.ndarray, buffer_distance_meters: float) -> Polygon:
+    """
+    Buffers a long projected route as the union of the buffers of its pieces of at most
+    BUFFER_CHUNK_SIZE points. Consecutive pieces share a point, so the union covers the
+    same area as buffering the whole line.
+    """
+    starts = range(0, len(xs) - 1, BUFFER_CHUNK_SIZE - 1)
+    pieces = [
+        shapely.linestrings(xs[start:start + BUFFER_CHUNK_SIZE], ys[start:start + BUFFER_CHUNK_SIZE])
+        for start in starts
+    ]
+    return shapely.union_all(shapely.buffer(pieces, buffer_distance_meters, quad_segs=16))
 
 def calculate_area_ratios(
     buffer_a: Polygon, buffer_b: Polygon, intersection: Polygon
@@ -535,6 +757,24 @@ def calculate_area_ratios(
         "bAreaRatio": ratio_over_b,
     }
 
+def bounds_disjoint(geom_a: Polygon, geom_b: Polygon) -> bool:
+    """
+    Checks whether the bounding boxes of two geometries are disjoint.
+
+    Disjoint bounding boxes guarantee an empty intersection, so this cheap test can
+    be used to skip the GEOS intersection entirely.
+
+    Args:
+        geom_a (Polygon): First geometry.
+        geom_b (Polygon): Second geometry.
+
+    Returns:
+        bool: True if the bounding boxes do not overlap, False otherwise.
+    """
+    xa0, ya0, xa1, ya1 = geom_a.bounds
+    xb0, yb0, xb1, yb1 = geom_b.bounds
+    return xa1 < xb0 or xb1 < xa0 or ya1 < yb0 or yb1 < ya0
+
 def get_buffer_intersection(buffer1: Polygon, buffer2: Polygon) -> Polygon:
     """
     Returns the intersection of two buffer polygons.
@@ -550,11 +790,129 @@ def get_buffer_intersection(buffer1: Polygon, buffer2: Polygon) -> Polygon:
         print("Warning: One or both buffer polygons are None. Cannot compute intersection.")
         return None
 
+    # Buffers of routes in different areas cannot intersect; skip the GEOS operation for them
+    if bounds_disjoint(buffer1, buffer2):
+        return None
+
     start_time = time.time()
     intersection = buffer1.intersection(buffer2)
-    logging.info(f"Time to compute buffer intersection: {time.time() - start_time:.6f} seconds")
+    timing_log.debug("Time to compute buffer intersection: %.6f seconds", time.time() - start_time)
     return intersection if not intersection.is_empty else None
 
+def calculate_buffer_intersection_ratios(
+    buffers_a: Sequence[Polygon], buffers_b: Sequence[Polygon]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the intersection ratios of many buffer pairs in a single vectorized pass.
+
+    Pair i is (buffers_a[i], buffers_b[i]). Pairs whose bounding boxes are disjoint are
+    rejected with a vectorized bounds comparison, then the remaining ones with a prepared
+    intersects() predicate; only pairs that really overlap are passed to the GEOS
+    intersection. All other pairs keep a ratio of 0.0.
+
+    Args:
+        buffers_a (Sequence[Polygon]): Buffered polygons for the A routes.
+        buffers_b (Sequence[Polygon]): Buffered polygons for the B routes, aligned with buffers_a.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Intersection area over the area of A and over the
+        area of B for every pair.
+    """
+    geoms_a = _as_geometry_array(buffers_a)
+    geoms_b = _as_geometry_array(buffers_b)
+
+    start_time = time.time()
+    # Filter: envelope test on the (n, 4) bounds arrays
+    bounds_a = shapely.bounds(geoms_a)
+    bounds_b = shapely.bounds(geoms_b)
+    hits = ~(
+        (bounds_a[:, 2] < bounds_b[:, 0])
+        | (bounds_b[:, 2] < bounds_a[:, 0])
+        | (bounds_a[:, 3] < bounds_b[:, 1])
+        | (bounds_b[:, 3] < bounds_a[:, 1])
+    )
+    ratios_a = np.zeros(len(geoms_a))
+    ratios_b = np.zeros(len(geoms_b))
+    if hits.any():
+        # Refine: buffers whose envelopes overlap may still be apart (e.g. around a bend).
+        # Buffers from create_buffered_routes are prepared already and are left as they are;
+        # others are prepared here.
+        shapely.prepare(geoms_a[hits])
+        hits[hits] = shapely.intersects(geoms_a[hits], geoms_b[hits])
+    if hits.any():
+        # Intersections and areas are only computed for the overlapping pairs; the
+        # others keep their preset ratio of 0.0
+        hit_a = geoms_a[hits]
+        hit_b = geoms_b[hits]
+        intersection_area = shapely.area(shapely.intersection(hit_a, hit_b))
+        area_a = shapely.area(hit_a)
+        area_b = shapely.area(hit_b)
+        ratios_a[hits] = np.divide(intersection_area, area_a, out=np.zeros_like(area_a), where=area_a > 0)
+        ratios_b[hits] = np.divide(intersection_area, area_b, out=np.zeros_like(area_b), where=area_b > 0)
+    timing_log.debug(
+        "Time to compute %s buffer intersection ratio(s): %.6f seconds", len(geoms_a), time.time() - start_time
+    )
+    return ratios_a, ratios_b
+
+def _as_geometry_array(geoms: Sequence[Polygon]) -> np.ndarray:
+    """
+    Returns the geometries as a 1-D object array, without copying if they already are one.
+    """
+    if isinstance(geoms, np.ndarray) and geoms.dtype == object:
+        return geoms
+    array = np.empty(len(geoms), dtype=object)
+    array[:] = geoms
+    return array
+
+def nodes_inside_polygon(route_coords: List[Tuple[float, float]], polygon: Polygon) -> List[Tuple[float, float]]:
+    """
+    Returns the route nodes lying strictly inside a polygon, in route order.
+
+    All nodes are tested in one vectorized contains_xy call instead of building a Point and
+    calling within() for each of them. The polygon is prepared in place, so its edge index is
+    built once and reused for every node, including by later calls with the same polygon.
+
+    Args:
+        route_coords (List[Tuple[float, float]]): The route as list of (lat, lon).
+        polygon (Polygon): Polygon in (lon, lat) coordinates.
+
+    Returns:
+        List[Tuple[float, float]]: The nodes of route_coords inside the polygon.
+    """
+    return [route_coords[i] for i in _inside_node_indices(route_coords, polygon)]
+
+def entry_exit_nodes(
+    route_coords: List[Tuple[float, float]], polygon: Polygon
+) -> Optional[Tuple[Tuple[float, float], Tuple[float, float]]]:
+    """
+    Returns the first and last route nodes lying strictly inside a polygon.
+
+    Same test as `nodes_inside_polygon`, but only the two boundary nodes are taken from the
+    vectorized result instead of building the list of every node inside.
+
+    Args:
+        route_coords (List[Tuple[float, float]]): The route as list of (lat, lon).
+        polygon (Polygon): Polygon in (lon, lat) coordinates.
+
+    Returns:
+        Optional[Tuple[Tuple[float, float], Tuple[float, float]]]: (entry, exit) nodes, or None
+        if fewer than two nodes are inside the polygon.
+    """
+    inside = _inside_node_indices(route_coords, polygon)
+    if inside.size < 2:
+        return None
+    return route_coords[inside[0]], route_coords[inside[-1]]
+
+def _inside_node_indices(route_coords: List[Tuple[float, float]], polygon: Polygon) -> np.ndarray:
+    """
+    Returns the indices of the route nodes strictly inside a polygon, in route order.
+    """
+    if not route_coords:
+        return np.empty(0, dtype=np.intp)
+    shapely.prepare(polygon)
+    coords = np.asarray(route_coords, dtype=float)
+    return np.flatnonzero(shapely.contains_xy(polygon, coords[:, 1], coords[:, 0]))
+
 def get_route_polygon_intersections(route_coords: List[Tuple[float, float]], polygon: Polygon) -> List[Tuple[float, float]]:
     """
     Finds exact intersection points between a route LineString and a polygon.
@@ -567,8 +925,13 @@ def get_route_polygon_intersections(route_coords: List[Tuple[float, float]], pol
         List[Tuple[float, float]]: List of intersection points in (lat, lon).
     """
     start_time = time.time()
-    route_line = LineString([(lon, lat) for lat, lon in route_coords])  # shapely uses (x, y) = (lon, lat)
-    logging.info(f"Time to create LineString: {time.time() - start_time:.6f} seconds") 
+    # shapely uses (x, y) = (lon, lat); the line is built from the coordinate columns in one call
+    if route_coords:
+        coords = np.asarray(route_coords, dtype=float)
+        route_line = shapely.linestrings(coords[:, 1], coords[:, 0])
+    else:
+        route_line = LineString()
+    timing_log.debug("Time to create LineString: %.6f seconds", time.time() - start_time)
     intersection = route_line.intersection(polygon)
 
     if intersection.is_empty:
@@ -1,8 +1,19 @@
+import atexit
 import csv
+import json
 import os
 import datetime
 import random
-from typing import Tuple, Optional
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Iterator, List, Tuple, Optional, Union
 
 # Global function to generate URL
 def generate_url(origin: str, destination: str, api_key: str) -> str:
@@ -40,20 +51,150 @@ def write_csv_file(input_dir: str, results: list, fieldnames: list, output_file:
     - None
     """
 
-    # Ensure input_dir is an absolute path
-    input_dir = os.path.abspath(input_dir)
+    with CsvResultWriter(input_dir, fieldnames, output_file) as writer:
+        writer.write_rows(results)
 
-    # Define path to the ResultsCommuto folder inside input_dir
-    results_dir = os.path.join(input_dir, "ResultsCommuto")
-    os.makedirs(results_dir, exist_ok=True)
+class CsvResultWriter:
+    """
+    Writes result rows to a CSV file inside the 'ResultsCommuto' folder under input_dir
+    as they are produced, so that a run does not have to keep every row in memory.
+
+    The file is created, with its header, when the first row is written, so a run that
+    produces no rows leaves no file behind. The file is flushed every flush_every rows, so
+    the rows written so far survive an interrupted run. Can be used as a context manager,
+    which closes (and flushes) the file on exit.
+    """
+
+    def __init__(self, input_dir: str, fieldnames: list, output_file: str, flush_every: int = 1000):
+        # Define path to the ResultsCommuto folder inside input_dir
+        results_dir = os.path.join(os.path.abspath(input_dir), "ResultsCommuto")
+        os.makedirs(results_dir, exist_ok=True)
+
+        self.path = os.path.join(results_dir, output_file)
+        self.fieldnames = list(fieldnames)
+        self.row_count = 0
+        self.flush_every = flush_every
+        self._file = None
+        self._writer = None
+        # Result rows are built with every field of their model, so the values are read in
+        # a single C call; _row_values falls back to .get() for rows that miss a field.
+        self._values = itemgetter(*self.fieldnames) if len(self.fieldnames) > 1 else None
+
+    def _row_values(self, row: dict) -> list:
+        if self._values is not None:
+            try:
+                return self._values(row)
+            except KeyError:
+                pass
+        return [row.get(field, "") for field in self.fieldnames]
+
+    def _open(self) -> None:
+        self._file = open(self.path, mode="w", newline="", buffering=1 << 20)
+        # Rows are turned into lists in field order directly rather than through
+        # csv.DictWriter, which re-checks every row's keys against the fieldnames.
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.fieldnames)
+
+    def write_row(self, row: dict) -> None:
+        """Writes one result row; missing fields become empty cells."""
+        if self._writer is None:
+            self._open()
+        self._writer.writerow(self._row_values(row))
+        self.row_count += 1
+        if self.row_count % self.flush_every == 0:
+            self._file.flush()
+
+    def write_rows(self, rows: list) -> None:
+        """Writes several result rows at once."""
+        if not rows:
+            return
+        if self._writer is None:
+            self._open()
+        self._writer.writerows(map(self._row_values, rows))
+        self.row_count += len(rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> "CsvResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# "lat,lon" with optional whitespace around both numbers, captured in a single match
+_NUMBER = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+_COORD_RE = re.compile(rf"^\s*({_NUMBER})\s*,\s*({_NUMBER})\s*$")
+
+@lru_cache(maxsize=100_000)
+def parse_coordinate(coord: str) -> Tuple[float, float]:
+    """
+    Parses a coordinate string of the form "lat,lon" into two floats.
+
+    Results are cached: the same endpoint string is parsed for the output columns, the
+    route cache key and the request body, and is usually repeated across many rows.
+
+    Parameters:
+    - coord (str): A string representing a coordinate pair, formatted as "latitude,longitude".
+
+    Returns:
+    - Tuple[float, float]: (latitude, longitude).
+
+    Raises:
+    - ValueError: If the string is not two comma-separated decimal numbers.
+    """
+    match = _COORD_RE.match(coord)
+    if match is None:
+        raise ValueError(f"Invalid coordinate: {coord!r}")
+    return float(match.group(1)), float(match.group(2))
+
+def format_coordinate(node: Tuple[float, float]) -> str:
+    """
+    Formats a (latitude, longitude) node as the "lat,lon" string used in route requests.
+
+    Parameters:
+    - node (Tuple[float, float]): (latitude, longitude).
+
+    Returns:
+    - str: "latitude,longitude".
+    """
+    return f"{node[0]},{node[1]}"
+
+@lru_cache(maxsize=100_000)
+@lru_cache(maxsize=100_000)
+def normalize_coordinate(coord: str) -> str:
+    """
+    Rewrites a "lat,lon" string with both values rounded to 6 decimals (about 0.1 m), so that
+    spellings such as "45.5,-73.6" and " 45.500000, -73.6" of the same point compare equal.
+    Results are cached, as the same endpoints are compared and looked up for many rows.
+
+    Parameters:
+    - coord (str): A string representing a coordinate pair, formatted as "latitude,longitude".
+
+    Returns:
+    - str: The normalized "latitude,longitude", or the stripped input if it cannot be parsed.
+    """
+    try:
+        lat, lon = parse_coordinate(coord)
+    except ValueError:
+        return coord.strip()
+    return f"{round(lat, 6)},{round(lon, 6)}"
+
+def same_point(coord_a: str, coord_b: str) -> bool:
+    """
+    Tells whether two "lat,lon" strings are the same point once normalized with
+    normalize_coordinate. Strings that cannot be parsed are only equal if they are written the same.
 
-    # Full output path
-    output_csv_path = os.path.join(results_dir, output_file)
+    Parameters:
+    - coord_a (str): First coordinate pair, formatted as "latitude,longitude".
+    - coord_b (str): Second coordinate pair, formatted as "latitude,longitude".
 
-    with open(output_csv_path, mode="w", newline="") as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+    Returns:
+    - bool: True if both strings denote the same point.
+    """
+    return coord_a == coord_b or normalize_coordinate(coord_a) == normalize_coordinate(coord_b)
 
 def safe_split(coord: str) -> Tuple[Optional[float], Optional[float]]:
     """
@@ -71,8 +212,227 @@ def safe_split(coord: str) -> Tuple[Optional[float], Optional[float]]:
         or (None, None) if the input is invalid or cannot be converted to floats.
     """
     try:
-        lat, lon = map(float, map(str.strip, coord.split(",")))
-        return lat, lon
+        return parse_coordinate(coord)
     except Exception:
         return None, None
-    
+
+class LRUDict(OrderedDict):
+    """
+    Dictionary holding at most `maxsize` entries. Once full, storing a new key evicts the
+    least recently stored one. Writes are guarded by a lock so worker threads can share it.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.RLock()
+
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+class RouteCache:
+    """
+    Persistent SQLite store of decoded routes, so that repeated origin/destination pairs
+    are not requested again in later runs.
+
+    Coordinates are stored as packed float64 bytes (lat, lon, lat, lon, ...) rather than
+    pickled tuples, which keeps the file small and loading fast. The connection is shared
+    by all worker threads and guarded by a lock.
+
+    Entries older than `max_age` seconds are treated as missing, since road networks and
+    travel times change; None keeps entries forever.
+    """
+
+    def __init__(self, path: str, max_age: Optional[float] = None):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL keeps each commit an append to the log instead of a rewrite of the database pages
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS routes ("
+            "key TEXT PRIMARY KEY, coords BLOB, dist REAL, time REAL, response TEXT, created REAL)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(routes)")}
+        if "created" not in columns:
+            # Files written before entries expired have no timestamps; count them as new
+            self._conn.execute("ALTER TABLE routes ADD COLUMN created REAL")
+            self._conn.execute("UPDATE routes SET created = ?", (time.time(),))
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[List[Tuple[float, float]], float, float, Optional[str]]]:
+        """
+        Looks up a route.
+
+        Parameters:
+        - key (str): Cache key of the route.
+
+        Returns:
+        - tuple or None: (coordinates, distance_km, time_min, raw_response_json) if cached and
+          not expired, else None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT coords, dist, time, response, created FROM routes WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (self.max_age is not None and time.time() - row[4] > self.max_age):
+            return None
+        flat = array("d")
+        flat.frombytes(row[0])
+        return list(zip(flat[0::2], flat[1::2])), row[1], row[2], row[3]
+
+    def put(
+        self,
+        key: str,
+        coordinates: List[Tuple[float, float]],
+        distance_km: float,
+        time_min: float,
+        response: Optional[Union[str, bytes]] = None,
+    ) -> None:
+        """
+        Stores a route, replacing any previous entry with the same key.
+
+        Parameters:
+        - key (str): Cache key of the route.
+        - coordinates (list): (latitude, longitude) tuples of the route.
+        - distance_km (float): Route distance in kilometers.
+        - time_min (float): Route duration in minutes.
+        - response (Optional[Union[str, bytes]]): Raw API response as JSON, if it should be kept.
+
+        Returns:
+        - None
+        """
+        flat = array("d", [value for coord in coordinates for value in coord])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO routes VALUES (?, ?, ?, ?, ?, ?)",
+                (key, flat.tobytes(), distance_km, time_min, response, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class ResponseStore:
+    """
+    Raw API responses keyed by (origin, destination), kept in a temporary SQLite file instead of
+    in memory, so that a run saving every response does not hold them all.
+
+    Responses are stored as the JSON text returned by the API and parsed when they are read. The
+    file is created on the first response and removed when the process exits. Pickling a store
+    writes a plain dict, with its entries streamed from the file rather than loaded at once.
+    """
+
+    # Entries read from the file at a time while iterating over the store
+    BATCH_SIZE = 1000
+
+    def __init__(self, loads: Callable[[Union[str, bytes]], Any] = json.loads):
+        self.loads = loads
+        self.path: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Called with the lock held
+        if self._conn is None:
+            fd, self.path = tempfile.mkstemp(prefix="canterburycommuto-responses-", suffix=".sqlite")
+            os.close(fd)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            # The file only lives as long as the process, so it need not survive a crash
+            self._conn.execute("PRAGMA journal_mode=OFF")
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.execute(
+                "CREATE TABLE responses (origin TEXT, destination TEXT, response BLOB, "
+                "PRIMARY KEY (origin, destination))"
+            )
+            atexit.register(self.close)
+        return self._conn
+
+    def put(self, key: Tuple[str, str], response: Union[str, bytes]) -> None:
+        """
+        Stores the raw JSON response of a lookup, replacing any previous one.
+
+        Parameters:
+        - key (Tuple[str, str]): (origin, destination) as passed to the routing function.
+        - response (Union[str, bytes]): Raw API response as JSON.
+
+        Returns:
+        - None
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (*key, response))
+            conn.commit()
+
+    def get_raw(self, key: Tuple[str, str]) -> Optional[Union[str, bytes]]:
+        """
+        Returns the raw JSON response of a lookup, or None if there is none.
+        """
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE origin = ? AND destination = ?", key
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def get(self, key: Tuple[str, str], default: Any = None) -> Any:
+        """
+        Returns the parsed response of a lookup, or default if there is none.
+        """
+        response = self.get_raw(key)
+        return self.loads(response) if response is not None else default
+
+    def __getitem__(self, key: Tuple[str, str]) -> Any:
+        response = self.get_raw(key)
+        if response is None:
+            raise KeyError(key)
+        return self.loads(response)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return self.get_raw(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                return 0
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def items(self) -> Iterator[Tuple[Tuple[str, str], Any]]:
+        """
+        Yields ((origin, destination), parsed response) for every stored response, reading the
+        file in batches of BATCH_SIZE.
+        """
+        last_rowid = 0
+        while True:
+            with self._lock:
+                if self._conn is None:
+                    return
+                rows = self._conn.execute(
+                    "SELECT rowid, origin, destination, response FROM responses "
+                    "WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, self.BATCH_SIZE),
+                ).fetchall()
+            if not rows:
+                return
+            for rowid, origin, destination, response in rows:
+                yield (origin, destination), self.loads(response)
+            last_rowid = rows[-1][0]
+
+    def __reduce__(self):
+        # Unpickles as a plain dict; pickle adds the entries one batch at a time as items() yields them
+        return dict, (), None, None, self.items()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.close()
+            self._conn = None
+            os.remove(self.path)
@@ -1,13 +1,34 @@
 import time
+import itertools
 import logging
 import os
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Tuple
 
-import folium
-from IPython.display import display, IFrame
 from shapely.geometry import Polygon, mapping
 
-from canterburycommuto.HelperFunctions import generate_unique_filename
+# Maps are numbered within a run instead of timestamping every file; the run stamp
+# keeps the names of separate runs apart.
+_RUN_STAMP = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+_MAP_COUNTER = itertools.count(1)
+
+timing_log = logging.getLogger("canterburycommuto.timing")
+
+@lru_cache(maxsize=None)
+def _results_dir(input_dir: str) -> str:
+    """
+    Creates the 'ResultsCommuto' folder inside the input directory once per directory.
+
+    Parameters:
+    - input_dir (str): The directory where the input CSV is located.
+
+    Returns:
+    - str: The path to the results folder.
+    """
+    output_dir = os.path.join(input_dir, "ResultsCommuto")
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
 
 # Function to save the maps
 def save_map(map_object, base_name: str, ID: str, input_dir: str) -> str:
@@ -23,9 +44,9 @@ def save_map(map_object, base_name: str, ID: str, input_dir: str) -> str:
     Returns:
         str: The full path to the saved HTML file.
     """
-    output_dir = os.path.join(input_dir, "ResultsCommuto")
-    os.makedirs(output_dir, exist_ok=True)
-    filename = generate_unique_filename(os.path.join(output_dir, f"{base_name}_{ID}"), ".html")
+    filename = os.path.join(
+        _results_dir(input_dir), f"{base_name}_{ID}-{_RUN_STAMP}_{next(_MAP_COUNTER)}.html"
+    )
     map_object.save(filename)
     print(f"Map saved to: {os.path.abspath(filename)}")
     return filename
@@ -48,6 +69,9 @@ def plot_routes(
     Returns:
     - None
     """
+    # folium and IPython are only needed for plotting, so they are imported on first use
+    import folium
+    from IPython.display import display, IFrame
 
     # If the routes completely overlap, set Route B to be the same as Route A
     if not coordinates_b:
@@ -168,6 +192,8 @@ def plot_routes_and_buffers(
     Returns:
         None
     """
+    import folium
+    from IPython.display import display, IFrame
 
     # Calculate the center of the map
     avg_lat = sum(coord[0] for coord in route_a_coords + route_b_coords) / len(
@@ -193,7 +219,7 @@ def plot_routes_and_buffers(
     # Add Buffer A to the map
     start_time = time.time()
     buffer_a_geojson = mapping(buffer_a)
-    logging.info(f"Time to convert buffer A to GeoJSON: {time.time() - start_time:.6f} seconds")
+    timing_log.debug("Time to convert buffer A to GeoJSON: %.6f seconds", time.time() - start_time)
     folium.GeoJson(
         buffer_a_geojson,
         style_function=lambda x: {
@@ -208,7 +234,7 @@ def plot_routes_and_buffers(
     # Add Buffer B to the map
     start_time = time.time()
     buffer_b_geojson = mapping(buffer_b)
-    logging.info(f"Time to convert buffer B to GeoJSON: {time.time() - start_time:.6f} seconds")
+    timing_log.debug("Time to convert buffer B to GeoJSON: %.6f seconds", time.time() - start_time)
     folium.GeoJson(
         buffer_b_geojson,
         style_function=lambda x: {
@@ -20,6 +20,7 @@ Usage:
         [--id_column COLUMN_NAME]
         [--output_file FILENAME]
         [--skip_invalid True|False] [--save_api_info] [--yes]
+        [--route_cache PATH] [--plot]
 
     # Estimate number of API requests and cost (no actual API calls):
     python -m canterburycommuto.main estimate
@@ -66,7 +67,9 @@ def run_overlap(args):
             output_file=args.output_file,
             skip_invalid=args.skip_invalid,
             save_api_info=args.save_api_info,
-            auto_confirm=args.yes
+            auto_confirm=args.yes,
+            route_cache=args.route_cache,
+            plot=args.plot
         )
     except ValueError as ve:
         print(f"Input Validation Error: {ve}")
@@ -124,6 +127,8 @@ def main():
     overlap_parser.add_argument("--skip_invalid", type=lambda x: x == "True", choices=[True, False], default=True)
     overlap_parser.add_argument("--save_api_info", action="store_true", help="If set, saves API responses to a pickle file (api_response_cache.pkl)")
     overlap_parser.add_argument("--yes", action="store_true")
+    overlap_parser.add_argument("--route_cache", type=str, help="SQLite file used to cache routes across runs, so repeated origin/destination pairs are not requested again.")
+    overlap_parser.add_argument("--plot", action="store_true", help="Save a map of each route pair. Off by default, as drawing maps is slow.")
     overlap_parser.set_defaults(func=run_overlap)
 
     # Subparser for "estimate"